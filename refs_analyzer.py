@@ -1,9 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import islice
+from array import array
 from datetime import datetime, timedelta
+import multiprocessing
+import threading
+import functools
 import argparse
+import hashlib
+import cProfile
+import pstats
+import tracemalloc
+import time
+import fnmatch
+import re
+import bisect
+import heapq
+import pickle
+import tempfile
+import glob
+import sqlite3
+import json
+import csv
 import struct
+import mmap
+import zlib
 import sys
 import os
 
+try:
+    import numpy
+except ImportError:  # Batch LCN Translation Falls Back to Pure Python
+    numpy = None
+
 VBR_HEADER_STRUCTURE = '<3s8s5sIHHQIIBBHIQQQ'  # Size : 0x48 / <3s8s5s IHHQ IIBBHI QQ Q
 SUPER_BLOCK_STRUCTURE = '<16sQQIIII16s16s16s16sQQ'  # Size : 0x80 / <16s QQ IIII 16s 16s 16s 16s QQ
 CHECK_POINT_STRUCTURE = '<IIIIQQ16s16sIIIIIIIIIIIIII'  # Size : 0xC8 / <IIII QQ 16s 16s IIII IIII IIII II
@@ -31,13 +61,515 @@ INDEX_ENTRY_STRUCTURE = '<IHHHHH'  # Size : 0x0C / <IHHHHH
 ATTRIBUTE_HEADER_STRUCTURE = '<BBHIHBB'  # Size : 0x10 / <BBHIHBB
 ATTRIBUTE_KEY_STRUCTURE = '<IIBB'  # Size : 0x0C / <IIBB
 
+EWF_FILE_HEADER_STRUCTURE = '<8sBHH'  # Size : 0x0D / <8s BHH
+EWF_SECTION_DESCRIPTOR_STRUCTURE = '<16sQQ40sI'  # Size : 0x4C / <16s QQ 40s I
+EWF_VOLUME_STRUCTURE = '<4sIIIQ'  # Size : 0x18 / <4s III Q (Head of 0x41C Byte E01 Volume Section)
+EWF_SMART_VOLUME_STRUCTURE = '<4sIIII'  # Size : 0x14 / <4s III I (Head of 0x5E Byte S01 Volume Section)
+EWF_TABLE_HEADER_STRUCTURE = '<I4sQ4sI'  # Size : 0x18 / <I4s Q 4sI
+
+class ReFSError(Exception):
+    """Image does not hold the ReFS structure the parser expected."""
+
+class UnknownContainerError(ReFSError):
+    """LCN maps to an entry key missing from the container table."""
+
+    def __init__(self, entry_key):
+        super().__init__(f"Entry key '{entry_key}' does not exist in Container Table Key Dictionary.")
+        self.entry_key = entry_key
+
+class PageSignatureError(ReFSError):
+    """Referenced cluster does not hold the page (signature) the parser expected."""
+
+    def __init__(self, message, cluster):
+        super().__init__(message)
+        self.cluster = cluster
+
+class PathNotFoundError(ReFSError):
+    """Volume path does not name a file or directory of the volume."""
+
+    def __init__(self, path):
+        super().__init__(f"Path '{path}' does not exist in this volume.")
+        self.path = path
+
+# Precompiled Structure Registry - Format String -> struct.Struct
+STRUCT_REGISTRY = {structure: struct.Struct(structure) for structure in (
+    VBR_HEADER_STRUCTURE, SUPER_BLOCK_STRUCTURE, CHECK_POINT_STRUCTURE, CONTAINER_TABLE_STRUCTURE,
+    OBJECT_ID_TABLE_KEY_STRUCTURE, OBJECT_ID_TABLE_VALUE_STRUCTURE, PARENT_CHILD_TABLE_STRUCTURE,
+    PAGE_HEADER_STRUCTURE, PAGE_REFERENCE_STRUCTURE,
+    FILE_TABLE_NAME_STRUCTURE, FILE_TABLE_TIME_SIZE_STRUCTURE, FILE_TABLE_SIZE_STRUCTURE, FILE_TABLE_DATARUN_STRUCTURE,
+    DIRECTORY_TABLE_NAME_STRUCTURE, DIRECTORY_TABLE_METADATA_STRUCTURE,
+    INDEX_ROOT_STRUCTURE, INDEX_HEADER_STRUCTURE, INDEX_KEY_STRUCTURE, INDEX_ENTRY_STRUCTURE,
+    ATTRIBUTE_HEADER_STRUCTURE, ATTRIBUTE_KEY_STRUCTURE,
+    EWF_FILE_HEADER_STRUCTURE, EWF_SECTION_DESCRIPTOR_STRUCTURE, EWF_VOLUME_STRUCTURE, EWF_SMART_VOLUME_STRUCTURE, EWF_TABLE_HEADER_STRUCTURE,
+)}
+
+SUPER_BLOCK = STRUCT_REGISTRY[SUPER_BLOCK_STRUCTURE]
+CHECK_POINT = STRUCT_REGISTRY[CHECK_POINT_STRUCTURE]
+CONTAINER_TABLE = STRUCT_REGISTRY[CONTAINER_TABLE_STRUCTURE]
+OBJECT_ID_TABLE_KEY = STRUCT_REGISTRY[OBJECT_ID_TABLE_KEY_STRUCTURE]
+OBJECT_ID_TABLE_VALUE = STRUCT_REGISTRY[OBJECT_ID_TABLE_VALUE_STRUCTURE]
+PARENT_CHILD_TABLE = STRUCT_REGISTRY[PARENT_CHILD_TABLE_STRUCTURE]
+PAGE_HEADER = STRUCT_REGISTRY[PAGE_HEADER_STRUCTURE]
+PAGE_REFERENCE = STRUCT_REGISTRY[PAGE_REFERENCE_STRUCTURE]
+FILE_TABLE_TIME_SIZE = STRUCT_REGISTRY[FILE_TABLE_TIME_SIZE_STRUCTURE]
+FILE_TABLE_SIZE = STRUCT_REGISTRY[FILE_TABLE_SIZE_STRUCTURE]
+FILE_TABLE_DATARUN = STRUCT_REGISTRY[FILE_TABLE_DATARUN_STRUCTURE]
+DIRECTORY_TABLE_METADATA = STRUCT_REGISTRY[DIRECTORY_TABLE_METADATA_STRUCTURE]
+INDEX_ROOT = STRUCT_REGISTRY[INDEX_ROOT_STRUCTURE]
+INDEX_HEADER = STRUCT_REGISTRY[INDEX_HEADER_STRUCTURE]
+INDEX_KEY = STRUCT_REGISTRY[INDEX_KEY_STRUCTURE]
+INDEX_ENTRY = STRUCT_REGISTRY[INDEX_ENTRY_STRUCTURE]
+EWF_FILE_HEADER = STRUCT_REGISTRY[EWF_FILE_HEADER_STRUCTURE]
+EWF_SECTION_DESCRIPTOR = STRUCT_REGISTRY[EWF_SECTION_DESCRIPTOR_STRUCTURE]
+EWF_VOLUME = STRUCT_REGISTRY[EWF_VOLUME_STRUCTURE]
+EWF_SMART_VOLUME = STRUCT_REGISTRY[EWF_SMART_VOLUME_STRUCTURE]
+EWF_TABLE_HEADER = STRUCT_REGISTRY[EWF_TABLE_HEADER_STRUCTURE]
+
+METADATA_PAGE_SIZE = 0x4000  # Size : 16 KiB / ReFS 3.x Metadata Page
+MSB_PLUS_PAGE_SIGNATURE = 0x2b42534d  # "MSB+"
+CHECK_POINT_PAGE_SIGNATURE = 0x504b4843  # "CHKP"
+SUPER_BLOCK_PAGE_SIGNATURE = 0x42505553  # "SUPB"
+
+OBJECT_ID_TABLE_ID = 0x02  # Table Identifier in Page Header (Directory Tables Use Their Directory Object ID)
+CONTAINER_TABLE_ID = 0x0B
+PARENT_CHILD_TABLE_ID = 0x0C
+MSB_PLUS_NODE_CACHE_COUNT = 0x100  # Count : Parsed Nodes Kept per Tree (Root and Inner Nodes Stay Hot)
+DIRECTORY_TABLE_TREE_CACHE_COUNT = 0x40  # Count : Directory Table Trees Kept per Volume for Repeated Lookups and Listings
+DIRECTORY_TABLE_NODE_CACHE_COUNT = 0x10  # Count : Parsed Nodes Kept per Cached Directory Table Tree (Bounds Cache to 1024 Pages)
+OBJECT_ID_CACHE_COUNT = 0x1000  # Count : Looked-Up Object ID -> LCN Pairs Kept by a Lazy Object ID Table
+
+IMAGE_CACHE_BLOCK_SIZE = 0x10000  # Size : 64 KiB / Unit of Image Read and Cache Entry (Holds Whole Metadata Pages)
+IMAGE_CACHE_BLOCK_COUNT = 0x400  # Count : 1024 Blocks / Upper Bound of Cached Bytes is 64 MiB
+
+EWF_SIGNATURE = b'EVF\x09\x0d\x0a\xff\x00'  # Expert Witness Format (E01 / S01) Segment File
+EWF2_SIGNATURE = b'EVF2\x0d\x0a\x81\x00'  # Expert Witness Format 2 (Ex01) Segment File
+EWF_CHUNK_CACHE_COUNT = 0x400  # Count : 1024 Chunks / 32 MiB of Decompressed 32 KiB Chunks
+EWF_PREFETCH_CHUNK_COUNT = 0x04  # Count : Chunks Decompressed Ahead After a Cache Miss (0 : No Prefetch)
+EWF_PREFETCH_WORKERS = 0x04  # Count : Threads Decompressing Prefetched Chunks (zlib Releases the GIL)
+
+FILETIME_TICKS_PER_SECOND = 10**7  # Count : 100ns Intervals per Second
+FILETIME_TICKS_PER_DAY = 86400 * FILETIME_TICKS_PER_SECOND
+FILETIME_UNIX_EPOCH = 116444736000000000  # Count : 100ns Intervals From 1601-01-01 to 1970-01-01 (UTC)
+FILETIME_EPOCH_CIVIL_DAY = 584694  # Days From 0000-03-01 (Start of Civil Era Cycle) to 1601-01-01
+DISPLAY_UTC_OFFSET = 9 * 3600  # Seconds : Default Display Time Zone (KST, UTC+09:00)
+
+class ImageReader:
+    """Random access layer over an image file.
+
+    Raw image files are memory-mapped; anything that cannot be mapped is read in
+    whole aligned blocks kept in a bounded LRU cache. Parsers take zero-copy
+    memoryview slices with `view()`, while `seek()`, `tell()` and `read()` keep
+    the reader usable wherever a file object was used before.
+    """
+
+    def __init__(self, image_file, use_mmap=True, block_size=IMAGE_CACHE_BLOCK_SIZE, block_count=IMAGE_CACHE_BLOCK_COUNT):
+        self.image_file = image_file
+        self.block_size = block_size
+        self.block_count = block_count
+        self.position = 0
+
+        # Cache Statistics - | Hits | Misses | Bytes Read From Image |
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes_read = 0
+
+        self._blocks = OrderedDict()  # Block Index -> Block Bytes (Least Recently Used First)
+        self._lock = threading.Lock()
+
+        image_file.seek(0, os.SEEK_END)
+        self.size = image_file.tell()
+
+        # Positional Reads Need No Shared File Position - Threads Read Concurrently Without Lock
+        try:
+            self._file_descriptor = image_file.fileno() if hasattr(os, 'preadv') else None
+        except (AttributeError, OSError, ValueError):
+            self._file_descriptor = None
+
+        self._mmap = None
+        self._mmap_view = None
+        if use_mmap and self.size > 0:
+            try:
+                self._mmap = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._mmap_view = memoryview(self._mmap)
+                self._touched_blocks = bytearray((self.size + block_size - 1) // block_size)  # One Byte per Block Already Faulted In
+            except (AttributeError, OSError, ValueError):  # Not a Mappable Raw File (Pipe, Network Stream, Container Reader)
+                self._mmap = None
+
+    @property
+    def is_mapped(self):
+        return self._mmap is not None
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self.position = offset
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self.position
+        data = bytes(self.view(self.position, size))
+        self.position += len(data)
+        return data
+
+    def view(self, offset, length):
+        # Clamp Request to End of Image (Short View Behaves Like Short Read)
+        length = max(0, min(length, self.size - offset))
+        if length == 0:
+            return memoryview(b'')
+
+        first_block = offset // self.block_size
+        last_block = (offset + length - 1) // self.block_size
+
+        if self._mmap is not None:
+            self._count_mapped_blocks(first_block, last_block)
+            return self._mmap_view[offset:offset + length]
+
+        if first_block == last_block:  # Common Case - Whole Request Inside One Cached Block
+            block_offset = offset - first_block * self.block_size
+            return self._load_block(first_block)[block_offset:block_offset + length]
+
+        # Request Spans Block Boundary - Assemble From Consecutive Cached Blocks
+        buffer = bytearray(length)
+        copied = 0
+        for block_index in range(first_block, last_block + 1):
+            block = self._load_block(block_index)
+            block_offset = (offset + copied) - block_index * self.block_size
+            chunk = block[block_offset:block_offset + (length - copied)]
+            buffer[copied:copied + len(chunk)] = chunk
+            copied += len(chunk)
+        return memoryview(buffer)
+
+    def read_into(self, offset, buffer):
+        # Bulk Content Read Straight Into Caller Buffer - Bypasses Block Cache so File Data Does Not Evict Metadata
+        length = max(0, min(len(buffer), self.size - offset))
+        if length == 0:
+            return 0
+
+        if self._mmap is not None:
+            buffer[:length] = self._mmap_view[offset:offset + length]
+        else:
+            length = self._read_into_at(offset, memoryview(buffer)[:length])
+
+        self.bytes_read += length
+        return length
+
+    def read_at(self, offset, size):
+        # Small Uncached Read (e.g. File Signature) - Does Not Pull Whole Block Into Cache
+        buffer = bytearray(max(0, min(size, self.size - offset)))
+        return bytes(buffer[:self.read_into(offset, buffer)])
+
+    def _read_into_at(self, offset, buffer_view):
+        if self._file_descriptor is not None:
+            return os.preadv(self._file_descriptor, [buffer_view], offset)
+        with self._lock:
+            self.image_file.seek(offset)
+            return self.image_file.readinto(buffer_view) or 0
+
+    def _count_mapped_blocks(self, first_block, last_block):
+        for block_index in range(first_block, last_block + 1):
+            if self._touched_blocks[block_index]:
+                self.cache_hits += 1
+            else:
+                self._touched_blocks[block_index] = 1
+                self.cache_misses += 1
+                self.bytes_read += min(self.block_size, self.size - block_index * self.block_size)
+
+    def _load_block(self, block_index):
+        with self._lock:
+            block = self._blocks.get(block_index)
+            if block is not None:
+                self._blocks.move_to_end(block_index)
+                self.cache_hits += 1
+                return block
+
+        # Read Outside Cache Lock - Concurrent Misses on Other Blocks Proceed in Parallel
+        block_offset = block_index * self.block_size
+        block = bytearray(min(self.block_size, self.size - block_offset))
+        block = memoryview(block)[:self._read_into_at(block_offset, memoryview(block))]
+
+        with self._lock:
+            self.cache_misses += 1
+            self.bytes_read += len(block)
+
+            self._blocks[block_index] = block
+            if len(self._blocks) > self.block_count:  # Evict Least Recently Used Block
+                self._blocks.popitem(last=False)
+            return block
+
+    def statistics(self):
+        statistics = {
+            'mode': 'mmap' if self._mmap is not None else 'cache',
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'bytes_read': self.bytes_read,
+            'cached_blocks': self._touched_blocks.count(1) if self._mmap is not None else len(self._blocks),
+        }
+        if hasattr(self.image_file, 'statistics'):  # Container Reader (EWF) Chunk Cache
+            statistics.update(self.image_file.statistics())
+        return statistics
+
+    def close(self):
+        self._blocks.clear()
+        if self._mmap is not None:
+            self._mmap_view.release()
+            try:
+                self._mmap.close()
+            except BufferError:  # Views Still Held by Caller - Mapping is Released When They Are Collected
+                pass
+            self._mmap = None
+        self.image_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class EwfImage:
+    """Read-only file object over the media stored in EWF (E01) segment files.
+
+    Every segment (.E01, .E02, ...) is scanned once for its table sections, which
+    become one chunk offset index of the whole media. Reads decompress only the
+    chunks they touch; decompressed chunks are kept in a bounded LRU cache and,
+    after a miss, the following chunks are decompressed ahead by a thread pool.
+    """
+
+    def __init__(self, image_path, chunk_cache_count=EWF_CHUNK_CACHE_COUNT, prefetch_count=EWF_PREFETCH_CHUNK_COUNT):
+        self.chunk_cache_count = chunk_cache_count
+        self.prefetch_count = prefetch_count
+        self.position = 0
+
+        # Chunk Cache Statistics - | Hits | Misses (Decompressed on Demand) | Prefetched |
+        self.chunk_hits = 0
+        self.chunk_misses = 0
+        self.chunks_prefetched = 0
+
+        self._chunks = OrderedDict()  # Chunk Index -> Decompressed Bytes (Least Recently Used First)
+        self._pending_chunks = {}  # Chunk Index -> Future of Prefetch Still Decompressing
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(EWF_PREFETCH_WORKERS) if prefetch_count > 0 else None
+
+        # Chunk Offset Table - Segment Number, Offset in Segment File, Stored Size and Compression Flag per Chunk
+        self.chunk_segments = array('H')
+        self.chunk_offsets = array('Q')
+        self.chunk_stored_sizes = array('I')
+        self.chunk_compressed = bytearray()
+
+        self.segment_files = []
+        try:
+            for segment_path in self.find_segment_paths(image_path):
+                self.segment_files.append(open(segment_path, 'rb'))
+                last_section_type = self.read_segment_sections(len(self.segment_files) - 1)
+
+            if last_section_type != b'done':  # Only the Last Segment Ends With 'done', Others End With 'next'
+                raise ReFSError(f"EWF segment file after number {len(self.segment_files)} of '{image_path}' is missing.")
+            if not hasattr(self, 'chunk_size'):
+                raise ReFSError(f"EWF image '{image_path}' has no volume section.")
+        except BaseException:
+            self.close()
+            raise
+
+        self.size = min(self.size, len(self.chunk_offsets) * self.chunk_size)
+
+    @staticmethod
+    def find_segment_paths(image_path):
+        # Segment Files Share the Base Name (E01 .. E99, EAA .. ZZZ) - Ordered by Segment Number in Their Header
+        # Given Path Always Counts - it May Lack the 3 Character Extension the Glob Expects (e.g. Renamed 'evidence' or 'case.ewf')
+        segment_paths = glob.glob(glob.escape(os.path.splitext(image_path)[0]) + '.[A-Za-z][0-9A-Za-z][0-9A-Za-z]')
+        if os.path.abspath(image_path) not in {os.path.abspath(segment_path) for segment_path in segment_paths}:
+            segment_paths.insert(0, image_path)
+
+        segment_number_dic = {}
+        for segment_path in segment_paths:
+            with open(segment_path, 'rb') as segment_file:
+                file_header = segment_file.read(EWF_FILE_HEADER.size)
+            if len(file_header) == EWF_FILE_HEADER.size and file_header.startswith(EWF_SIGNATURE):
+                segment_number_dic[EWF_FILE_HEADER.unpack(file_header)[2]] = segment_path
+
+        for segment_number in range(1, len(segment_number_dic) + 1):
+            if segment_number not in segment_number_dic:
+                raise ReFSError(f"EWF segment file number {segment_number} of '{image_path}' is missing.")
+        if not segment_number_dic:
+            raise ReFSError(f"No EWF segment file found for '{image_path}'.")
+        return [segment_number_dic[segment_number] for segment_number in sorted(segment_number_dic)]
+
+    def read_segment_sections(self, segment_index):
+        segment_file = self.segment_files[segment_index]
+        segment_size = os.fstat(segment_file.fileno()).st_size
+        section_offset = EWF_FILE_HEADER.size
+        sectors_end = None  # Chunk Data of Following Table Ends With the Sectors Section
+
+        while section_offset + EWF_SECTION_DESCRIPTOR.size <= segment_size:
+            segment_file.seek(section_offset)
+            descriptor = segment_file.read(EWF_SECTION_DESCRIPTOR.size)
+            section_type, next_offset, section_size, _, checksum = EWF_SECTION_DESCRIPTOR.unpack(descriptor)
+            if zlib.adler32(descriptor[:-4]) != checksum:
+                raise ReFSError(f"EWF section descriptor at {hex(section_offset)} of segment {segment_index + 1} is corrupted.")
+            section_type = section_type.rstrip(b'\x00')
+
+            if section_type in (b'volume', b'disk') and not hasattr(self, 'chunk_size'):
+                section_data = segment_file.read(EWF_VOLUME.size)
+                if section_size - EWF_SECTION_DESCRIPTOR.size < 0x41C:  # SMART (S01) Volume Section Holds 32-bit Sector Count
+                    _, number_of_chunks, sectors_per_chunk, bytes_per_sector, number_of_sectors = EWF_SMART_VOLUME.unpack_from(section_data)
+                else:
+                    _, number_of_chunks, sectors_per_chunk, bytes_per_sector, number_of_sectors = EWF_VOLUME.unpack_from(section_data)
+                self.chunk_size = sectors_per_chunk * bytes_per_sector
+                self.size = number_of_sectors * bytes_per_sector
+            elif section_type == b'sectors':
+                sectors_end = section_offset + section_size
+            elif section_type == b'table':
+                self.read_table_section(segment_index, section_offset, section_size, sectors_end)
+                sectors_end = None
+            elif section_type in (b'next', b'done'):
+                break
+
+            if next_offset <= section_offset:  # Last Section Points to Itself
+                break
+            section_offset = next_offset
+
+        return section_type
+
+    def read_table_section(self, segment_index, section_offset, section_size, sectors_end):
+        segment_file = self.segment_files[segment_index]
+        segment_file.seek(section_offset + EWF_SECTION_DESCRIPTOR.size)
+        number_of_entries, _, base_offset, _, _ = EWF_TABLE_HEADER.unpack(segment_file.read(EWF_TABLE_HEADER.size))
+        table_entries = array('I', segment_file.read(number_of_entries * 0x04))
+        if sys.byteorder == 'big':
+            table_entries.byteswap()
+
+        # Table Entry - Bit 31 : Compressed, Bit 0 ~ 30 : Chunk Offset From Base Offset
+        chunk_offsets = [base_offset + (table_entry & 0x7FFFFFFF) for table_entry in table_entries]
+        chunk_offsets.append(sectors_end if sectors_end is not None else section_offset + section_size)  # End of Last Chunk
+        for entry_index, table_entry in enumerate(table_entries):
+            self.chunk_segments.append(segment_index)
+            self.chunk_offsets.append(chunk_offsets[entry_index])
+            self.chunk_stored_sizes.append(chunk_offsets[entry_index + 1] - chunk_offsets[entry_index])
+            self.chunk_compressed.append(table_entry >> 31)
+
+    def read_chunk_data(self, chunk_index):
+        # Stored Chunk -> Media Bytes (zlib Stream, or Raw Bytes Followed by Adler-32 Checksum)
+        segment_file = self.segment_files[self.chunk_segments[chunk_index]]
+        chunk_offset = self.chunk_offsets[chunk_index]
+        stored_size = self.chunk_stored_sizes[chunk_index]
+        if hasattr(os, 'pread'):
+            stored_chunk = os.pread(segment_file.fileno(), stored_size, chunk_offset)
+        else:
+            with self._lock:
+                segment_file.seek(chunk_offset)
+                stored_chunk = segment_file.read(stored_size)
+
+        chunk_length = min(self.chunk_size, self.size - chunk_index * self.chunk_size)
+        if self.chunk_compressed[chunk_index]:
+            try:
+                return zlib.decompress(stored_chunk)[:chunk_length]
+            except zlib.error as error:
+                raise ReFSError(f"EWF chunk {chunk_index} can not be decompressed ({error}).") from None
+        return stored_chunk[:chunk_length]
+
+    def prefetch_chunk(self, chunk_index):
+        chunk = self.read_chunk_data(chunk_index)
+        with self._lock:
+            self._pending_chunks.pop(chunk_index, None)
+            self.chunks_prefetched += 1
+            self.cache_chunk(chunk_index, chunk)
+        return chunk
+
+    def cache_chunk(self, chunk_index, chunk):
+        self._chunks[chunk_index] = chunk
+        if len(self._chunks) > self.chunk_cache_count:  # Evict Least Recently Used Chunk
+            self._chunks.popitem(last=False)
+
+    def load_chunk(self, chunk_index):
+        with self._lock:
+            chunk = self._chunks.get(chunk_index)
+            if chunk is not None:
+                self._chunks.move_to_end(chunk_index)
+                self.chunk_hits += 1
+                return chunk
+            pending_chunk = self._pending_chunks.get(chunk_index)
+
+            # Miss - Queue Decompression of Following Chunks While This One is Read
+            if self._executor is not None:
+                for prefetch_index in range(chunk_index + 1, min(chunk_index + 1 + self.prefetch_count, len(self.chunk_offsets))):
+                    if prefetch_index not in self._chunks and prefetch_index not in self._pending_chunks:
+                        self._pending_chunks[prefetch_index] = self._executor.submit(self.prefetch_chunk, prefetch_index)
+
+        if pending_chunk is not None:
+            return pending_chunk.result()
+
+        chunk = self.read_chunk_data(chunk_index)
+        with self._lock:
+            self.chunk_misses += 1
+            self.cache_chunk(chunk_index, chunk)
+        return chunk
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self.position = offset
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def readinto(self, buffer):
+        buffer = memoryview(buffer).cast('B')
+        length = max(0, min(len(buffer), self.size - self.position))
+        copied = 0
+        while copied < length:
+            chunk_index, chunk_offset = divmod(self.position + copied, self.chunk_size)
+            chunk = self.load_chunk(chunk_index)
+            copy_length = min(length - copied, len(chunk) - chunk_offset)
+            if copy_length <= 0:  # Chunk Shorter Than Recorded Media Size
+                break
+            buffer[copied:copied + copy_length] = chunk[chunk_offset:chunk_offset + copy_length]
+            copied += copy_length
+        self.position += copied
+        return copied
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self.position
+        buffer = bytearray(max(0, min(size, self.size - self.position)))
+        return bytes(buffer[:self.readinto(buffer)])
+
+    def statistics(self):
+        return {'chunk_hits': self.chunk_hits, 'chunk_misses': self.chunk_misses, 'chunks_prefetched': self.chunks_prefetched}
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._chunks.clear()
+        for segment_file in self.segment_files:
+            segment_file.close()
+
+def open_image(image_path, use_mmap=True):
+    image_file = open(image_path, 'rb')
+    file_signature = image_file.read(len(EWF_SIGNATURE))
+    if file_signature == EWF_SIGNATURE:  # Expert Witness Format Evidence - Read Media Through Segment Chunk Index
+        image_file.close()
+        image_file = EwfImage(image_path)
+    elif file_signature == EWF2_SIGNATURE:
+        image_file.close()
+        raise ReFSError(f"EWF2 (Ex01) image '{image_path}' is not supported, export it to E01 or raw first.")
+    return ImageReader(image_file, use_mmap=use_mmap)
+
 def read_vbr(image_file, base_cluster):
     image_file.seek(base_cluster)
 
     vbr_header = read_struct(image_file, VBR_HEADER_STRUCTURE)
 
     if (vbr_header[9] != 0x03):  # Check File System Version
-        sys.exit(f"This ReFS is not 3.x version.\n")
+        raise ReFSError(f"This ReFS is not 3.x version.")
 
     sector_size = vbr_header[7]
     clusters_per_sector = vbr_header[8]
@@ -52,7 +584,7 @@ def read_super_block(image_file, base_cluster, cluster_size):
     page_header = read_struct(image_file, PAGE_HEADER_STRUCTURE)
 
     if (hex(page_header[0]) != "0x42505553"):  # Compair page header signature "SUPB"
-        sys.exit(f"This block is not Super Block.\n")
+        raise PageSignatureError(f"This block is not Super Block.", base_cluster)
     
     super_block = read_struct(image_file, SUPER_BLOCK_STRUCTURE)
 
@@ -64,7 +596,7 @@ def read_check_point(image_file, base_cluster, cluster_size):
     page_header = read_struct(image_file, PAGE_HEADER_STRUCTURE)
 
     if (hex(page_header[0]) != "0x504b4843"):  # Compair page header signature "CHKP"
-        sys.exit(f"This block is not Check Point.\n")
+        raise PageSignatureError(f"This block is not Check Point.", base_cluster)
     
     check_point = read_struct(image_file, CHECK_POINT_STRUCTURE)
 
@@ -85,47 +617,50 @@ def read_container_table(image_file, base_cluster, cluster_size):
     page_header = read_struct(image_file, PAGE_HEADER_STRUCTURE)
 
     if (hex(page_header[0]) != "0x2b42534d"):  # Compair page header signature "MSB+"
-        sys.exit(f"This block is not Container Table.\n")
+        raise PageSignatureError(f"This block is not Container Table.", base_cluster)
     
-    container_table_key_dic = {}
-    image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE))  # Move to Index Root
-    read_index(image_file, base_cluster, cluster_size, "Container Table", container_table_key_dic, None)
+    image_file.seek(base_cluster * cluster_size + PAGE_HEADER.size)  # Move to Index Root
+    return read_index(image_file, base_cluster, cluster_size, "Container Table", None)
 
-    return container_table_key_dic
-
-def read_object_id_table(image_file, base_cluster, cluster_size, container_table_key_dic):
+def read_object_id_table(image_file, base_cluster, cluster_size, lcn_translator):
     image_file.seek(base_cluster * cluster_size)
 
     page_header = read_struct(image_file, PAGE_HEADER_STRUCTURE)
 
     if (hex(page_header[0]) != "0x2b42534d"):  # Compair page header signature "MSB+"
-        sys.exit(f"This block is not Object ID Table.\n")
-    
-    object_id_table_lcn_dic = {}
-    image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE))  # Move to Index Root
-    read_index(image_file, base_cluster, cluster_size, "Object ID Table", container_table_key_dic, object_id_table_lcn_dic)
+        raise PageSignatureError(f"This block is not Object ID Table.", base_cluster)
 
-    return object_id_table_lcn_dic
+    # Lazy Table - Object ID -> LCN is Looked Up in the Tree on First Use, Untouched Nodes are Never Read
+    return ObjectIdTable(MsbPlusTree(image_file, base_cluster, cluster_size, lcn_translator.translate, object_id_table_key))
 
-def read_parent_child_table(image_file, base_cluster, cluster_size, container_table_key_dic, object_id_table_lcn_dic):
+def read_object_id_array(image_file, base_cluster, cluster_size, lcn_translator):
+    # Parent Child Pass Resolves Nearly Every Object ID - One Leaf Scan Into Sorted Arrays Beats a Point Lookup per Child
+    return read_object_id_table(image_file, base_cluster, cluster_size, lcn_translator).to_array()
+
+def read_parent_child_table(image_file, base_cluster, cluster_size, lcn_translator, object_id_table):
     image_file.seek(base_cluster * cluster_size)
 
     page_header = read_struct(image_file, PAGE_HEADER_STRUCTURE)
 
     if (hex(page_header[0]) != "0x2b42534d"):  # Compair page header signature "MSB+"
-        sys.exit(f"This block is not Parent Child Table.\n")
+        raise PageSignatureError(f"This block is not Parent Child Table.", base_cluster)
+
+    # | Parent Object ID | Child Object ID | Columns -> Child VCN From Object ID Table -> Directory Tree
+    image_file.seek(base_cluster * cluster_size + PAGE_HEADER.size)  # Move to Index Root
+    parent_object_ids, child_object_ids = read_index(image_file, base_cluster, cluster_size, "Parent Child Table", lcn_translator)
 
-    # Declar Parent Child Table Global Dictionary
-    global master_directory_tree_dic; master_directory_tree_dic = {}
-    image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE))  # Move to Index Root
-    read_index(image_file, base_cluster, cluster_size, "Parent Child Table", container_table_key_dic, object_id_table_lcn_dic)
+    try:
+        child_lcns = [object_id_table[child_object_id] for child_object_id in child_object_ids]
+    except KeyError as error:
+        raise ReFSError(f"Object ID '{hex(error.args[0])}' of Parent Child Table is not in Object ID Table.") from None
 
-def traversing_directory_hierarchy(image_file, base_cluster, cluster_size, container_table_key_dic, object_id_table_lcn_dic):
+    return DirectoryTree(parent_object_ids, child_object_ids, lcn_translator.translate_array(child_lcns))
+
+def traversing_directory_hierarchy(volume, utc_offset=DISPLAY_UTC_OFFSET):
     # Initial Assignment Value is 0x600 (Root Directory Object ID)
     visit_object_id = 0x600
 
     # Initial Assignment Value is '.\\' (Root Directory Path)
-    global current_work_directory
     current_work_directory = '.' + '\\' + 'Root'
     
     # Stack to Keep Track of Visited Directory (All of object_id)
@@ -136,52 +671,51 @@ def traversing_directory_hierarchy(image_file, base_cluster, cluster_size, conta
     
     while True:
         # Convert 'Directory Object ID' -> 'LCN' -> 'VCN'
-        visit_object_id_vcn = lcn_to_vcn(cluster_size, container_size, object_id_table_lcn_dic[visit_object_id]["LCN"], container_table_key_dic)
+        visit_object_id_vcn = volume.directory_vcn(visit_object_id)
 
         # Read File and Directory Table Lower of Current Directory Object ID
-        lower_file_table_of_current_directory_dic, lower_directory_table_of_current_directory_dic = read_currnet_directory_table(image_file, visit_object_id_vcn, cluster_size, container_table_key_dic, object_id_table_lcn_dic, visit_object_id)
+        lower_file_table_of_current_directory_dic, lower_directory_table_of_current_directory_dic = read_directory_table_indexed(volume, visit_object_id_vcn, visit_object_id, current_work_directory[len('.\\Root'):])
 
         # Update Lower Directory Table of Current Directory Dictionary Based Parent Child Table Info
-        one_level_children = master_directory_tree_dic.get(visit_object_id, [])
-        existing_object_ids = {entry['directory_object_id'] for entry in lower_directory_table_of_current_directory_dic.values()}
+        one_level_children = volume.directory_tree.get(visit_object_id, [])
+        existing_object_ids = {entry.directory_object_id for entry in lower_directory_table_of_current_directory_dic.values()}
         for child_object_id, _ in one_level_children:
             if child_object_id not in existing_object_ids:
                 new_index = max(lower_directory_table_of_current_directory_dic.keys(), default=0) + 1
-                lower_directory_table_of_current_directory_dic[new_index] = {'directory_name': f'Unknown (Object ID :{hex(child_object_id)})', 'directory_object_id': child_object_id, 'last_access_time': 'Unknown'}
-
-        # print(f"master_directory_tree_dic : {master_directory_tree_dic}, lower_file_table_of_current_directory_dic : {lower_file_table_of_current_directory_dic}, lower_directory_table_of_current_directory_dic : {lower_directory_table_of_current_directory_dic}")
+                lower_directory_table_of_current_directory_dic[new_index] = DirectoryEntry(f'Unknown (Object ID :{hex(child_object_id)})', child_object_id, None, None, None, 'Unknown')
 
-        def read_file_signature(image_file, file_vcn, cluster_size):
-            # Read File Signature Foramt By Hex
-            image_file.seek(file_vcn * cluster_size)
-            hex_value = read_struct(image_file, '<I')
-            
-            return hex_value[0]
+        # print(f"directory_tree : {volume.directory_tree}, lower_file_table_of_current_directory_dic : {lower_file_table_of_current_directory_dic}, lower_directory_table_of_current_directory_dic : {lower_directory_table_of_current_directory_dic}")
 
         # Print File and Directory Table Info in Lower of Current Directory
         def print_directory_and_file_info(directory_dic, file_dic):
-            header = f"{'Type':<4} {'Name':<25} {'LogicalSize':<12} {'LastWriteTime':<20} {'Signature (VCN)':<20}"
+            header = f"{'Type':<4} {'Name':<25} {'LogicalSize':<12} {'LastWriteTime':<20} {'Signature (VCN)':<20} {'FileType':<8}"
             separator = "-" * len(header)
 
             print(header)
             print(separator)
 
             for key, value in directory_dic.items():
-                dir_name = value.get('directory_name', 'Unknown')
-                last_write_time = convert_filesystem_time(value.get('last_access_time', 'Unknown'))
+                dir_name = value.directory_name
+                last_write_time = convert_filesystem_time(value.last_access_time, utc_offset)
                 print(f"{'d':<4} {dir_name:<25} {'':<12} {last_write_time:<20} {'':<20}")
-            
+
+            # Collect VCN of Every File First, Then Read All Signatures in One Sorted Batch
+            file_vcn_dic = {key: volume.lcn_translator.translate(value.file_lcn) for key, value in file_dic.items() if value.file_lcn is not None}
+            signature_dic = volume.file_signature_scanner.scan(file_vcn_dic.values())
+
             for key, value in file_dic.items():
-                file_name = value.get('file_name', 'Unknown')
-                logical_size = value.get('file_logical_size', 0)
-                last_write_time = convert_filesystem_time(value.get('file_last_access_time', 'Unknown'))
-                file_lcn = value.get('file_lcn', 0)
-                
-                file_vcn = lcn_to_vcn(cluster_size, container_size, file_lcn, container_table_key_dic)
-                hex_signature = read_file_signature(image_file, file_vcn, cluster_size)
-                signature_and_vcn = f"{hex(hex_signature)} ({hex(file_vcn)})"
-
-                print(f"{'f':<4} {file_name:<25} {logical_size:<12} {last_write_time:<20} {signature_and_vcn:<20}")
+                file_name = value.file_name
+                logical_size = value.file_logical_size
+                last_write_time = convert_filesystem_time(value.file_last_access_time, utc_offset)
+
+                signature_and_vcn = ''
+                file_type = ''
+                if key in file_vcn_dic:  # No Data Run Recorded (Unsupported File Table Layout)
+                    file_vcn = file_vcn_dic[key]
+                    hex_signature, file_type = signature_dic[file_vcn]
+                    signature_and_vcn = f"{hex(hex_signature)} ({hex(file_vcn)})"
+
+                print(f"{'f':<4} {file_name:<25} {logical_size:<12} {last_write_time:<20} {signature_and_vcn:<20} {file_type or '':<8}")
             
         print_directory_and_file_info(lower_directory_table_of_current_directory_dic, lower_file_table_of_current_directory_dic)
 
@@ -204,9 +738,9 @@ def traversing_directory_hierarchy(image_file, base_cluster, cluster_size, conta
         # Attempt to find the directory in the current directory's table
         directory_found = False
         for key, value in lower_directory_table_of_current_directory_dic.items():
-            if value.get('directory_name') == directory_name:
-                directory_stack.append(int(value.get('directory_object_id')))
-                visit_object_id = int(value.get('directory_object_id'))
+            if value.directory_name == directory_name:
+                directory_stack.append(value.directory_object_id)
+                visit_object_id = value.directory_object_id
                 current_work_directory = current_work_directory + '\\' + str(directory_name)
                 directory_found = True
                 break
@@ -214,227 +748,2074 @@ def traversing_directory_hierarchy(image_file, base_cluster, cluster_size, conta
         if not directory_found:
             print(f"Error: Directory '{directory_name}' not found.\n")
 
-def read_currnet_directory_table(image_file, base_cluster, cluster_size, container_table_key_dic, object_id_table_lcn_dic, directory_object_id = 0x600):
+FILE_SIGNATURE_PREFIX_SIZE = 0x10  # Size : 16 Bytes / Read From First Cluster of Each File (Longest Magic Number in Table)
+FILE_SIGNATURE_CACHE_COUNT = 0x10000  # Count : VCN -> (Signature, File Type) Results Kept Across Directory Listings
+FILE_SIGNATURE_READ_WORKERS = 0x08  # Count : Threads Issuing Prefix Reads When the Image is Not Memory-Mapped
+
+# (Offset, Magic Number, File Type) - Longer Magic Numbers First Where They Share a Prefix
+FILE_SIGNATURE_TABLE = (
+    (0x00, b'SQLite format 3\x00', 'SQLITE'),
+    (0x00, b'\x89PNG\r\n\x1a\n', 'PNG'),
+    (0x00, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'OLE'),
+    (0x00, b'ElfFile\x00', 'EVTX'),
+    (0x00, b'EVF\x09\x0d\x0a\xff\x00', 'EWF'),
+    (0x00, b'7z\xbc\xaf\x27\x1c', '7Z'),
+    (0x00, b'Rar!\x1a\x07', 'RAR'),
+    (0x00, b'%PDF-', 'PDF'),
+    (0x00, b'{\\rtf', 'RTF'),
+    (0x00, b'regf', 'REGISTRY'),
+    (0x00, b'PK\x03\x04', 'ZIP'),
+    (0x00, b'\x7fELF', 'ELF'),
+    (0x00, b'RIFF', 'RIFF'),
+    (0x00, b'GIF8', 'GIF'),
+    (0x00, b'\xff\xd8\xff', 'JPEG'),
+    (0x00, b'ID3', 'MP3'),
+    (0x00, b'\x1f\x8b', 'GZIP'),
+    (0x00, b'BM', 'BMP'),
+    (0x00, b'MZ', 'PE'),
+    (0x04, b'ftyp', 'MP4'),
+)
+
+def classify_file_signature(prefix):
+    for offset, magic_number, file_type in FILE_SIGNATURE_TABLE:
+        if prefix.startswith(magic_number, offset):
+            return file_type
+    return None
+
+class FileSignatureScanner:
+    """Batch file signature reader with a per-VCN result cache.
+
+    A directory's file VCNs are deduplicated and sorted by image offset, then the
+    first bytes of every file are read in one ascending pass (memory-mapped image)
+    or by a thread pool (cached / high-latency image). Results are cached by VCN,
+    so listing the same directory again reads nothing from the image.
+    """
+
+    def __init__(self, image_file, cluster_size, cache_count=FILE_SIGNATURE_CACHE_COUNT, read_workers=FILE_SIGNATURE_READ_WORKERS):
+        self.image_file = image_file
+        self.cluster_size = cluster_size
+        self.cache_count = cache_count
+        self.read_workers = read_workers
+        self._signatures = OrderedDict()  # VCN -> (Signature, File Type), Least Recently Used First
+        self._executor = None
+
+    def scan(self, file_vcns):
+        # Returns VCN -> (Signature, File Type) for Every Given VCN
+        signature_dic = {}
+        missing_vcns = []
+        for file_vcn in file_vcns:
+            if file_vcn in signature_dic:
+                continue
+            cached_signature = self._signatures.get(file_vcn)
+            if cached_signature is None:
+                missing_vcns.append(file_vcn)
+            else:
+                self._signatures.move_to_end(file_vcn)
+            signature_dic[file_vcn] = cached_signature
+
+        if missing_vcns:
+            missing_vcns.sort()  # Ascending Image Offset - One Forward Pass Over the Volume
+            for file_vcn, prefix in zip(missing_vcns, self._read_prefixes(missing_vcns)):
+                signature = int.from_bytes(prefix[:0x04].tobytes().ljust(0x04, b'\x00'), 'little')
+                signature_dic[file_vcn] = self._signatures[file_vcn] = (signature, classify_file_signature(prefix.tobytes()))
+            while len(self._signatures) > self.cache_count:  # Evict Least Recently Used Result
+                self._signatures.popitem(last=False)
+
+        return signature_dic
+
+    def _read_prefix(self, file_vcn):
+        return memoryview(self.image_file.read_at(file_vcn * self.cluster_size, FILE_SIGNATURE_PREFIX_SIZE))
+
+    def _read_prefixes(self, sorted_vcns):
+        if self.image_file.is_mapped or len(sorted_vcns) == 1:
+            return [self.image_file.view(file_vcn * self.cluster_size, FILE_SIGNATURE_PREFIX_SIZE) for file_vcn in sorted_vcns]
+
+        # Uncached Positional Reads in Flight Together - Hides Per-Read Latency of Remote or Spinning Storage
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.read_workers)
+        return list(self._executor.map(self._read_prefix, sorted_vcns))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+WALK_RECORD_FIELDS = ('type', 'path', 'object_id', 'size', 'creation_time', 'modification_time', 'change_time', 'access_time', 'lcn', 'vcn', 'signature', 'file_type')
+
+def file_walk_record(value, file_vcn=None, signature=None, file_type=None):
+    return {
+        'type': 'f', 'path': value.file_name, 'object_id': None, 'size': value.file_logical_size,
+        'creation_time': value.file_creation_time, 'modification_time': value.file_last_modification_time,
+        'change_time': value.file_last_change_time, 'access_time': value.file_last_access_time,
+        'lcn': value.file_lcn, 'vcn': file_vcn, 'signature': signature, 'file_type': file_type,
+        'data_runs': value.file_data_runs
+    }
+
+def directory_walk_record(value, child_lcn=None, child_vcn=None):
+    return {
+        'type': 'd', 'path': value.directory_name, 'object_id': value.directory_object_id, 'size': None,
+        'creation_time': value.creation_time, 'modification_time': value.last_modification_time,
+        'change_time': value.last_change_time, 'access_time': value.last_access_time,
+        'lcn': child_lcn, 'vcn': child_vcn, 'signature': None, 'file_type': None
+    }
+
+def root_directory_walk_record(root_object_id, root_directory_lcn, root_directory_vcn):
+    return {'type': 'd', 'path': '\\', 'object_id': root_object_id, 'size': None, 'creation_time': None, 'modification_time': None, 'change_time': None, 'access_time': None, 'lcn': root_directory_lcn, 'vcn': root_directory_vcn, 'signature': None, 'file_type': None}
+
+def read_directory_records(volume, directory_object_id, directory_vcn, directory_path='', scan_signatures=True, tree=None):
+    # Parse One Directory Table Into Walk Records - Path Holds Only the Entry Name Here
+    lower_file_table_dic, lower_directory_table_dic = read_directory_table_indexed(volume, directory_vcn, directory_object_id, directory_path, tree)
+
+    lcn_translator = volume.lcn_translator
+    object_id_table = volume.object_id_table
+
+    # Signatures of Whole Directory in One Batch (Skipped When Only Metadata is Needed - One Read per File)
+    file_vcn_dic = {key: lcn_translator.translate(value.file_lcn) for key, value in lower_file_table_dic.items() if value.file_lcn is not None}
+    signature_dic = volume.file_signature_scanner.scan(file_vcn_dic.values()) if scan_signatures else {}
+
+    file_records = []
+    for key, value in lower_file_table_dic.items():
+        file_vcn = file_vcn_dic.get(key)
+        file_records.append(file_walk_record(value, file_vcn, *signature_dic.get(file_vcn, (None, None))))
+
+    directory_records = []
+    for value in lower_directory_table_dic.values():
+        child_lcn = object_id_table.get(value.directory_object_id)
+        directory_records.append(directory_walk_record(value, child_lcn, lcn_translator.translate(child_lcn) if child_lcn is not None else None))
+
+    return file_records, directory_records
+
+def complete_directory_records(volume, directory_object_id, directory_path, file_records, directory_records):
+    # Entry Name -> Full Path, Child VCN From Parent Child Table, Children Missing in Directory Table are Added as Unknown
+    for record in file_records:
+        record['path'] = directory_path + '\\' + record['path']
+
+    child_directory_vcn_dic = dict(volume.directory_tree.get(directory_object_id, []))
+    named_object_ids = {record['object_id'] for record in directory_records}
+    for child_object_id, child_vcn in child_directory_vcn_dic.items():
+        if child_object_id not in named_object_ids:
+            child_lcn = volume.object_id_table.get(child_object_id)
+            directory_records.append({'type': 'd', 'path': f'Unknown (Object ID :{hex(child_object_id)})', 'object_id': child_object_id, 'size': None, 'creation_time': None, 'modification_time': None, 'change_time': None, 'access_time': None, 'lcn': child_lcn, 'vcn': child_vcn, 'signature': None, 'file_type': None})
+
+    for record in directory_records:
+        record['path'] = directory_path + '\\' + record['path']
+        record['vcn'] = child_directory_vcn_dic.get(record['object_id'], record['vcn'])
+
+    return file_records, directory_records
+
+def walk_directory_hierarchy(volume, root_object_id=0x600, read_directory=None, scan_signatures=True):
+    # Directory Source - Serial Parse by Default, Parallel Walk Passes Results From Worker Processes
+    if read_directory is None:
+        read_directory = lambda directory_object_id, directory_vcn, directory_path: read_directory_records(volume, directory_object_id, directory_vcn, directory_path, scan_signatures)
+
+    # Depth First Walk - Only Directories Still to Visit are Kept, Every Record is Yielded as Soon as it is Parsed
+    root_directory_lcn = volume.object_id_table[root_object_id]
+    root_directory_vcn = volume.lcn_translator.translate(root_directory_lcn)
+    yield root_directory_walk_record(root_object_id, root_directory_lcn, root_directory_vcn)
+
+    directory_stack = [(root_object_id, root_directory_vcn, '')]
+    while directory_stack:
+        directory_object_id, directory_vcn, directory_path = directory_stack.pop()
+        file_records, directory_records = complete_directory_records(volume, directory_object_id, directory_path, *read_directory(directory_object_id, directory_vcn, directory_path))
+
+        yield from file_records
+
+        child_directories = []
+        for record in directory_records:
+            if record['vcn'] is not None:  # Captured Before Yield - Consumer May Reformat Record Fields
+                child_directories.append((record['object_id'], record['vcn'], record['path']))
+
+            yield record
+
+        directory_stack.extend(reversed(child_directories))  # Visit Children in Directory Table Order
+
+DIRECTORY_PREFETCH_PER_WORKER = 0x10  # Count : Directory Tables Queued Ahead of the Walk per Worker Process
+
+worker_volume = None  # Volume of This Worker Process (Set by Pool Initializer)
+
+def initialize_directory_worker(image_path, use_mmap, volume_tables):
+    # Each Worker Process Opens its Own Image Handle and Keeps the Shipped Compact Tables (No Sidecar Index - SQLite Connection Must Not be Shared)
+    global worker_volume
+    worker_volume = Volume.open(image_path, use_mmap=use_mmap)
+    worker_volume.set_tables(*volume_tables)
+
+def read_directory_records_worker(directory_object_id, directory_vcn, scan_signatures=True):
+    return read_directory_records(worker_volume, directory_object_id, directory_vcn, scan_signatures=scan_signatures)
+
+def walk_directory_hierarchy_parallel(volume, workers, root_object_id=0x600, scan_signatures=True):
+    # Object ID Table is Pickled as Sorted Arrays, Directory Tree as its CSR Arrays
+    initialize_arguments = (volume.image_path, volume.use_mmap, (volume.container_table_key_dic, volume.object_id_table, volume.directory_tree))
+    with multiprocessing.Pool(workers, initializer=initialize_directory_worker, initargs=initialize_arguments) as pool:
+        pending_directory_dic = {}  # Directory Object ID -> Queued Worker Result (At Most prefetch_window Outstanding)
+        prefetch_window = workers * DIRECTORY_PREFETCH_PER_WORKER
+        prefetch_stack = []  # Directories Expected Next (Parent Child Table, Depth First) Not Yet Submitted - First to Visit on Top
+        demanded_object_ids = set()  # Submitted by the Walk Before Prefetch Reached Them - Skipped When Popped From prefetch_stack
+
+        def submit_directory(object_id, vcn):
+            pending_directory_dic[object_id] = pool.apply_async(read_directory_records_worker, (object_id, vcn, scan_signatures))
+            prefetch_stack.extend(reversed(volume.directory_tree.get(object_id, [])))  # Children Follow Their Parent in Walk Order
+
+        def fill_prefetch_window():
+            # Wide Directories Wait Here as (Object ID, VCN) Pairs - Only prefetch_window Listings are Ever Parsed Ahead and Held
+            while prefetch_stack and len(pending_directory_dic) < prefetch_window:
+                object_id, vcn = prefetch_stack.pop()
+                if object_id in demanded_object_ids:
+                    demanded_object_ids.discard(object_id)
+                    continue
+                submit_directory(object_id, vcn)
+
+        def read_directory(directory_object_id, directory_vcn, directory_path):
+            if directory_object_id not in pending_directory_dic:  # Root, or Not Reached by Prefetch Yet
+                demanded_object_ids.add(directory_object_id)
+                submit_directory(directory_object_id, directory_vcn)
+            pending_result = pending_directory_dic.pop(directory_object_id)
+            fill_prefetch_window()  # Workers Parse Ahead While This Listing is Awaited
+            return pending_result.get()
+
+        # Same Depth First Order as Serial Walk - Output is Identical Whatever the Worker Count
+        yield from walk_directory_hierarchy(volume, root_object_id, read_directory)
+
+def convert_filesystem_time_iso(filetime):
+    if (filetime is None):
+        return None
+
+    # FILETIME (100ns Since 1601-01-01 UTC) -> ISO 8601 UTC With Microsecond Precision
+    return (datetime(1601, 1, 1) + timedelta(microseconds=filetime // 10)).isoformat() + 'Z'
+
+def parse_utc_offset(text):
+    # 'UTC', 'Z', '+09:00', '-0530' or '+9' -> Seconds East of UTC
+    text = text.strip()
+    if text.upper() in ('UTC', 'Z', 'GMT'):
+        return 0
+    if text[:1] not in ('+', '-') or not text[1:].replace(':', '').isdigit():
+        raise ValueError(f"Time zone '{text}' is not UTC or a fixed offset such as +09:00.")
+
+    digits = text[1:].replace(':', '')
+    hours, minutes = (int(digits[:-2]), int(digits[-2:])) if len(digits) > 2 else (int(digits), 0)
+    if hours > 14 or minutes > 59:
+        raise ValueError(f"Time zone offset '{text}' is out of range.")
+    return (hours * 3600 + minutes * 60) * (-1 if text[0] == '-' else 1)
+
+def format_utc_offset(utc_offset):
+    hours, minutes = divmod(abs(utc_offset) // 60, 60)
+    return f"{'-' if utc_offset < 0 else '+'}{hours:02d}:{minutes:02d}"
+
+def civil_date(filetime_day):
+    # Days Since 1601-01-01 -> (Year, Month, Day) of Proleptic Gregorian Calendar - Integer Only, No Year 9999 Limit of datetime
+    era_day = filetime_day + FILETIME_EPOCH_CIVIL_DAY
+    era, day_of_era = divmod(era_day, 146097)
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+def convert_filesystem_times(filetimes, utc_offset=0):
+    # Batch FILETIME -> ISO 8601 With Full 100ns Precision and Offset - Integer Math per Value, Calendar Date Only Recomputed When the Day Changes (Sorted Input Shares Days)
+    offset_ticks = utc_offset * FILETIME_TICKS_PER_SECOND
+    offset_suffix = format_utc_offset(utc_offset)
+    last_day = None
+    day_prefix = ''
+
+    converted_times = []
+    for filetime in filetimes:
+        if filetime is None:
+            converted_times.append(None)
+            continue
+        day, day_ticks = divmod(filetime + offset_ticks, FILETIME_TICKS_PER_DAY)
+        if day != last_day:
+            last_day = day
+            day_prefix = '%04d-%02d-%02dT' % civil_date(day)
+        seconds, fraction = divmod(day_ticks, FILETIME_TICKS_PER_SECOND)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        converted_times.append(f"{day_prefix}{hour:02d}:{minute:02d}:{second:02d}.{fraction:07d}{offset_suffix}")
+
+    return converted_times
+
+def convert_filesystem_time_unix(filetime):
+    # FILETIME -> Whole Seconds Since 1970-01-01 UTC (Body File Time Fields, 0 When Not Recorded)
+    return (filetime - FILETIME_UNIX_EPOCH) // FILETIME_TICKS_PER_SECOND if filetime else 0
+
+def format_walk_record(record, fields=WALK_RECORD_FIELDS):
+    # Record -> Output Fields Only, FILETIME as ISO 8601 and Addresses / Identifiers as Hex Strings
+    formatted_record = {field: record[field] for field in fields}
+    for field in ('creation_time', 'modification_time', 'change_time', 'access_time'):
+        if field in formatted_record:
+            formatted_record[field] = convert_filesystem_time_iso(formatted_record[field])
+    for field in ('offset', 'table_id', 'object_id', 'parent_object_id', 'lcn', 'vcn', 'signature'):
+        if formatted_record.get(field) is not None:
+            formatted_record[field] = hex(formatted_record[field])
+    return formatted_record
+
+def write_walk_records(walk_records, output_file, output_format, fields=WALK_RECORD_FIELDS):
+    if output_format == 'csv':
+        writer = csv.DictWriter(output_file, fieldnames=fields)
+        writer.writeheader()
+        write_record = writer.writerow
+    else:
+        write_record = lambda record: output_file.write(json.dumps(record) + '\n')
+
+    number_of_records = 0
+    for record in walk_records:
+        write_record(format_walk_record(record, fields))
+        number_of_records += 1
+
+    return number_of_records
+
+FILE_EXTRACTION_CHUNK_SIZE = 0x400000  # Size : 4 MiB / Reusable Buffer of File Content Reads
+EXTRACTION_COALESCE_GAP = 0x10000  # Size : 64 KiB / Unused Bytes Read Through Rather Than Seeking Between Extents
+EXTRACTION_OPEN_FILE_COUNT = 0x40  # Count : Output Files Kept Open While Writing Extents
+
+def iterate_file_extents(lcn_translator, data_runs, logical_size):
+    # Data Runs -> | File Offset | Image Offset (None = Sparse) | Length |, Clipped to Logical Size
+    cluster_size = lcn_translator.cluster_size
+    file_offset = 0
+    for lcn, cluster_count in data_runs:
+        vcn_runs = [(None, cluster_count)] if lcn == 0 else lcn_translator.translate_runs([(lcn, cluster_count)])
+        for vcn, vcn_cluster_count in vcn_runs:
+            length = min(vcn_cluster_count * cluster_size, logical_size - file_offset)
+            if length <= 0:
+                return
+            yield file_offset, (vcn * cluster_size if vcn is not None else None), length
+            file_offset += vcn_cluster_count * cluster_size
+
+def read_file_chunks(image_file, lcn_translator, data_runs, logical_size, chunk_size=FILE_EXTRACTION_CHUNK_SIZE):
+    # Stream File Content in Large Aligned Reads - Yielded View is Reused, Consume it Before Next Chunk
+    buffer = bytearray(chunk_size)
+    buffer_view = memoryview(buffer)
+    zero_view = None
+    for file_offset, image_offset, length in iterate_file_extents(lcn_translator, data_runs, logical_size):
+        while length > 0:
+            read_length = min(length, chunk_size)
+            if image_offset is None:  # Sparse Run Reads as Zero
+                zero_view = zero_view or memoryview(bytes(chunk_size))
+                yield zero_view[:read_length]
+            else:
+                read_length = image_file.read_into(image_offset, buffer_view[:read_length])
+                if read_length == 0:
+                    raise ReFSError(f"Data run at offset '{hex(image_offset)}' is beyond end of image.")
+                yield buffer_view[:read_length]
+                image_offset += read_length
+            length -= read_length
+
+def extract_file(image_file, lcn_translator, data_runs, logical_size, output_file, chunk_size=FILE_EXTRACTION_CHUNK_SIZE):
+    # Single File to Seekable Output - Sparse Runs are Left as Holes, Output is Truncated to Logical Size at the End
+    buffer_view = memoryview(bytearray(chunk_size))
+    for file_offset, image_offset, length in iterate_file_extents(lcn_translator, data_runs, logical_size):
+        if image_offset is None:
+            continue
+
+        output_file.seek(file_offset)
+        while length > 0:
+            read_length = image_file.read_into(image_offset, buffer_view[:min(length, chunk_size)])
+            if read_length == 0:
+                raise ReFSError(f"Data run at offset '{hex(image_offset)}' is beyond end of image.")
+            output_file.write(buffer_view[:read_length])
+            image_offset += read_length
+            length -= read_length
+
+    output_file.truncate(logical_size)
+    return logical_size
+
+def extraction_output_path(output_directory, volume_path):
+    # Volume Path '\\Dir\\File' -> output_directory/Dir/File (No Component May Climb Out of Output Directory)
+    components = [component.replace('/', '_') for component in volume_path.split('\\') if component]
+    return os.path.join(output_directory, *[('_' if component in ('.', '..') else component) for component in components])
+
+def extract_files(image_file, lcn_translator, file_records, output_directory, chunk_size=FILE_EXTRACTION_CHUNK_SIZE):
+    # Output Files are Created Up Front at Logical Size, Then Every Extent of Every File is Written in Image Offset Order
+    output_paths = []
+    extents = []  # | Image Offset | Length | Output File Index | File Offset |
+    skipped_records = []
+    for record in file_records:
+        if record['size'] and not record['data_runs']:  # File Table Layout Without Data Run
+            skipped_records.append(record)
+            continue
+
+        output_path = extraction_output_path(output_directory, record['path'])
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as output_file:
+            output_file.truncate(record['size'])
+
+        for file_offset, image_offset, length in iterate_file_extents(lcn_translator, record['data_runs'], record['size']):
+            if image_offset is not None:  # Sparse Runs Stay as Holes of Truncated File
+                extents.append((image_offset, length, len(output_paths), file_offset))
+        output_paths.append(output_path)
+
+    extents.sort()
+
+    # Coalesce Extents Physically Adjacent (Within Gap) Across Files Into Spans - Each Span is Read Sequentially
+    span_end_list = [0] * len(extents)
+    span_end = 0
+    for extent_index in range(len(extents) - 1, -1, -1):
+        image_offset, length = extents[extent_index][0], extents[extent_index][1]
+        if extent_index + 1 < len(extents) and extents[extent_index + 1][0] <= image_offset + length + EXTRACTION_COALESCE_GAP:
+            span_end = max(span_end, image_offset + length)
+        else:
+            span_end = image_offset + length
+        span_end_list[extent_index] = span_end
+
+    buffer = bytearray(chunk_size)
+    buffer_view = memoryview(buffer)
+    chunk_start = chunk_end = 0
+    open_file_dic = OrderedDict()  # Output File Index -> Open Handle (Least Recently Used First)
+    bytes_written = 0
+    try:
+        for extent_index, (image_offset, length, output_index, file_offset) in enumerate(extents):
+            while length > 0:
+                if not (chunk_start <= image_offset < chunk_end):
+                    # Read Ahead Only to End of Span - Following Extents of Span Land in Same Chunk
+                    chunk_start = image_offset
+                    chunk_end = chunk_start + image_file.read_into(chunk_start, buffer_view[:min(chunk_size, span_end_list[extent_index] - chunk_start)])
+                    if chunk_end == chunk_start:
+                        raise ReFSError(f"Data run at offset '{hex(image_offset)}' is beyond end of image.")
+
+                output_file = open_file_dic.get(output_index)
+                if output_file is None:
+                    if len(open_file_dic) >= EXTRACTION_OPEN_FILE_COUNT:
+                        open_file_dic.popitem(last=False)[1].close()
+                    output_file = open_file_dic[output_index] = open(output_paths[output_index], 'r+b')
+                else:
+                    open_file_dic.move_to_end(output_index)
+
+                piece_length = min(length, chunk_end - image_offset)
+                output_file.seek(file_offset)
+                output_file.write(buffer_view[image_offset - chunk_start:image_offset - chunk_start + piece_length])
+
+                image_offset += piece_length
+                file_offset += piece_length
+                length -= piece_length
+                bytes_written += piece_length
+    finally:
+        for output_file in open_file_dic.values():
+            output_file.close()
+
+    return len(output_paths), bytes_written, skipped_records
+
+HASH_ALGORITHMS = ('md5', 'sha1', 'sha256')
+HASH_DIGEST_SIZE_DIC = {0x10: 'md5', 0x14: 'sha1', 0x20: 'sha256'}  # Digest Length -> Algorithm (Known Hash Set Lines are Told Apart by Length)
+HASH_BUFFER_SIZE = 0x400000  # Size : 4 MiB / One of Two Buffers - Next is Read While Previous is Hashed
+HASH_SET_FIELD_SEPARATOR = re.compile(r'[\s,|"*]+')  # Fields of Hash Set Line (CSV, md5sum, hashdeep, Pipe Separated)
+
+class KnownHashSet:
+    """Known file hashes (NSRL, hashdeep, md5sum or plain lists) kept as sorted 64-bit digest prefixes.
+
+    Eight bytes per hash keeps sets of hundreds of millions in memory; the chance that an
+    unknown file matches a prefix is about (Number of Hashes / 2^64) per lookup.
+    """
+
+    def __init__(self, digests=()):
+        prefix_list_dic = {algorithm: array('Q') for algorithm in HASH_ALGORITHMS}  # Algorithm -> Unsorted Prefixes While Loading
+        for digest in digests:
+            prefix_list_dic[HASH_DIGEST_SIZE_DIC[len(digest)]].append(int.from_bytes(digest[:8], 'big'))
+
+        self.prefix_dic = {}  # Algorithm -> Sorted, Unique array('Q')
+        for algorithm, prefixes in prefix_list_dic.items():
+            if numpy is not None:
+                self.prefix_dic[algorithm] = array('Q', numpy.unique(numpy.frombuffer(prefixes, dtype=numpy.uint64)).tobytes())
+            else:
+                self.prefix_dic[algorithm] = array('Q', sorted(set(prefixes)))
+
+    @classmethod
+    def load(cls, hash_set_path):
+        # Hex Fields Whose Length is an MD5, SHA-1 or SHA-256 Digest - Only the Digest Columns Named by a Header When There is One
+        def iterate_digests():
+            digest_columns = None  # Field Positions From Header (hashdeep '%%%% size,md5,sha256,filename', NSRL "SHA-1","MD5",...)
+            with open(hash_set_path, 'r', encoding='utf-8', errors='replace') as hash_set_file:
+                for line in hash_set_file:
+                    fields = [field for field in HASH_SET_FIELD_SEPARATOR.split(line.strip().lstrip('%')) if field]
+                    header_columns = [position for position, field in enumerate(fields) if field.lower().replace('-', '') in HASH_ALGORITHMS]
+                    if header_columns:
+                        digest_columns = header_columns
+                        continue
+                    if line.startswith(('#', '%')):  # hashdeep Comment and Invocation Lines
+                        continue
+
+                    for field in (fields if digest_columns is None else [fields[position] for position in digest_columns if position < len(fields)]):
+                        try:
+                            digest = bytes.fromhex(field)
+                        except ValueError:  # Size, File Name or Other Non-Digest Field - Later Fields May Still be Digests
+                            continue
+                        if len(digest) in HASH_DIGEST_SIZE_DIC:
+                            yield digest
+
+        return cls(iterate_digests())
+
+    def __len__(self):
+        return sum(len(prefixes) for prefixes in self.prefix_dic.values())
+
+    def contains(self, algorithm, digest):
+        prefixes = self.prefix_dic.get(algorithm)
+        if not prefixes:
+            return False
+        prefix = int.from_bytes(digest[:8], 'big')
+        position = bisect.bisect_left(prefixes, prefix)
+        return position < len(prefixes) and prefixes[position] == prefix
+
+def iterate_hash_buffers(image_file, lcn_translator, file_records, buffer_size=HASH_BUFFER_SIZE):
+    # Pack File Contents Back to Back Into Two Alternating Buffers -> | Buffer View | Segments (File Index, Start, End) | Files Ending in Buffer (File Index, Error) |
+    # Buffer is Refilled Only When Caller Asks for the Buffer After Next - Caller Must be Done Hashing it by Then
+    buffer_views = [memoryview(bytearray(buffer_size)) for _ in range(2)]
+    buffer_view = buffer_views[0]
+    fill = 0
+    segments = []
+    completed_files = []
+    for file_index, record in enumerate(file_records):
+        error = None
+        try:
+            for _, image_offset, length in iterate_file_extents(lcn_translator, record['data_runs'] or (), record['size']):
+                while length > 0:
+                    if fill == buffer_size:
+                        yield buffer_view, segments, completed_files
+                        buffer_view = buffer_views[1] if buffer_view is buffer_views[0] else buffer_views[0]
+                        fill = 0
+                        segments = []
+                        completed_files = []
+
+                    piece_length = min(length, buffer_size - fill)
+                    if image_offset is None:  # Sparse Run Hashes as Zero
+                        buffer_view[fill:fill + piece_length] = bytes(piece_length)
+                    else:
+                        piece_length = image_file.read_into(image_offset, buffer_view[fill:fill + piece_length])
+                        if piece_length == 0:
+                            raise ReFSError(f"Data run at offset '{hex(image_offset)}' is beyond end of image.")
+                        image_offset += piece_length
+
+                    if segments and segments[-1][0] == file_index and segments[-1][2] == fill:  # Extents Adjacent in Buffer -> One Update
+                        segments[-1] = (file_index, segments[-1][1], fill + piece_length)
+                    else:
+                        segments.append((file_index, fill, fill + piece_length))
+                    fill += piece_length
+                    length -= piece_length
+        except ReFSError as error_of_file:  # Damaged Data Run - Only This File Goes Without Digests
+            error = str(error_of_file)
+        completed_files.append((file_index, error))
+
+    yield buffer_view, segments, completed_files
+
+def update_buffer_digests(file_digest_dic, algorithm_index, buffer_view, segments):
+    # One Algorithm Over Whole Buffer - Only Task Touching These Digest Objects Until Buffer is Done (hashlib Releases the GIL)
+    for file_index, start, end in segments:
+        file_digest_dic[file_index][algorithm_index].update(buffer_view[start:end])
+
+def hash_files(image_file, lcn_translator, file_records, algorithms=HASH_ALGORITHMS, known_hash_set=None, buffer_size=HASH_BUFFER_SIZE, statistics=None):
+    # Yields One Hash Record per File in Physical (VCN) Order - Every Digest is Computed in the Same Pass, Reading of Next Buffer Overlaps Hashing of Previous One
+    if statistics is None:
+        statistics = {}
+    statistics.update(files=0, bytes_hashed=0, known_files=0, failed_files=0)
+
+    # Sequential Image Reads - Files Without Data Run Sort Last (Reported Without Digests)
+    file_records = sorted(file_records, key=lambda record: (record['vcn'] is None, record['vcn'] or 0))
+    file_digest_dic = {}  # File Index -> Digest Objects (One per Algorithm) of Files Not Yet Complete
+
+    def complete_files(completed_files):
+        for file_index, error in completed_files:
+            record = file_records[file_index]
+            file_digests = file_digest_dic.pop(file_index, None)
+            if error is None and record['size'] and not record['data_runs']:
+                error = "No data run recorded (unsupported file table layout, e.g. fragmented file)."
+            hash_record = {'path': record['path'], 'size': record['size'], 'lcn': record['lcn'], 'vcn': record['vcn'], 'known': None, 'error': error}
+            if error is None:
+                digests = [digest.digest() for digest in file_digests] if file_digests else [hashlib.new(algorithm).digest() for algorithm in algorithms]
+                hash_record.update(zip(algorithms, (digest.hex() for digest in digests)))
+                if known_hash_set is not None:
+                    hash_record['known'] = any(known_hash_set.contains(algorithm, digest) for algorithm, digest in zip(algorithms, digests))
+                    statistics['known_files'] += hash_record['known']
+                statistics['bytes_hashed'] += record['size']
+            else:
+                hash_record.update(dict.fromkeys(algorithms))
+                statistics['failed_files'] += 1
+            statistics['files'] += 1
+            yield hash_record
+
+    with ThreadPoolExecutor(max_workers=len(algorithms)) as executor:
+        pending_futures, pending_completed_files = [], []
+        for buffer_view, segments, completed_files in iterate_hash_buffers(image_file, lcn_translator, file_records, buffer_size):
+            # This Buffer Was Filled While Previous One Was Hashed - Wait for Previous Before Submitting (Keeps Updates of Each Digest in File Order)
+            for future in pending_futures:
+                future.result()
+            yield from complete_files(pending_completed_files)
+
+            for file_index, _, _ in segments:
+                if file_index not in file_digest_dic:
+                    file_digest_dic[file_index] = [hashlib.new(algorithm) for algorithm in algorithms]
+            pending_futures = [executor.submit(update_buffer_digests, file_digest_dic, algorithm_index, buffer_view, segments) for algorithm_index in range(len(algorithms))]
+            pending_completed_files = completed_files
+
+        for future in pending_futures:
+            future.result()
+        yield from complete_files(pending_completed_files)
+
+def match_walk_record(record, pattern):
+    # Pattern With Path Separator Matches Full Path, Otherwise Entry Name (Shell Wildcards, Case Insensitive)
+    value = record['path'] if '\\' in pattern else record['path'].rsplit('\\', 1)[-1]
+    return fnmatch.fnmatchcase(value.lower(), pattern.lower())
+
+CARVE_RECORD_FIELDS = ('offset', 'vcn', 'page_type', 'table_id', 'generation', 'live', 'type', 'path', 'object_id', 'parent_object_id', 'size', 'creation_time', 'modification_time', 'change_time', 'access_time', 'lcn')
+CARVE_PAGE_SIGNATURES = ((MSB_PLUS_PAGE_SIGNATURE, 'MSB+'), (CHECK_POINT_PAGE_SIGNATURE, 'CHKP'), (SUPER_BLOCK_PAGE_SIGNATURE, 'SUPB'))
+CARVE_BLOCK_SIZE = 0x1000000  # Size : 16 MiB / One Sequential Read of the Scan
+CARVE_RANGE_SIZE = 0x8000000  # Size : 128 MiB / Offset Range Scanned by One Worker Task
+
+def carve_record(page_offset, cluster_size, page_type, table_id, record_type, **fields):
+    record = dict.fromkeys(CARVE_RECORD_FIELDS)
+    record.update(offset=page_offset, vcn=page_offset // cluster_size, page_type=page_type, table_id=table_id, type=record_type, **fields)
+    return record
+
+def carve_page(page, page_offset, cluster_size, page_type):
+    # One Carved Page -> Records of Everything Recoverable From it (Live Flag is Filled in Later)
+    page_header = PAGE_HEADER.unpack_from(page)
+    if page_type == 'SUPB':  # Super Block -> Primary and Secondary Check Point Cluster
+        super_block = SUPER_BLOCK.unpack_from(page, PAGE_HEADER.size)
+        return [carve_record(page_offset, cluster_size, page_type, None, 'check_point_reference', lcn=check_point_cluster) for check_point_cluster in super_block[11:13]]
+
+    if page_type == 'CHKP':  # Check Point -> Generation (Virtual Clock) and Root of Each Table it Refers To
+        check_point = CHECK_POINT.unpack_from(page, PAGE_HEADER.size)
+        return [carve_record(page_offset, cluster_size, page_type, table_id, 'table_reference', generation=check_point[4], lcn=PAGE_REFERENCE.unpack_from(page, check_point[field])[0])
+                for table_id, field in ((OBJECT_ID_TABLE_ID, 9), (PARENT_CHILD_TABLE_ID, 13), (CONTAINER_TABLE_ID, 16))]
+
+    # MSB+ Page - Inner Nodes Only Reference Other Pages (Scanned on Their Own), Leaf Entries are Recovered by Table
+    table_id = page_header[11]
+    index_root_offset = PAGE_HEADER.size
+    index_header = INDEX_HEADER.unpack_from(page, index_root_offset + INDEX_ROOT.unpack_from(page, index_root_offset)[0])
+    if index_header[3] > 0:
+        return [carve_record(page_offset, cluster_size, page_type, table_id, 'inner_node', generation=page_header[5])]
+
+    index_entries = [(page, index_entry_offset, index_entry) for _, index_entry_offset, index_entry in iterate_index_entries(page, index_root_offset)]
+    carve_records = []
+    if table_id == OBJECT_ID_TABLE_ID:
+        for index_entry in index_entries:
+            object_id, lcn = ObjectIdTable.parse_entry(*index_entry)
+            carve_records.append(carve_record(page_offset, cluster_size, page_type, table_id, 'object_id', generation=page_header[5], object_id=object_id, lcn=lcn))
+    elif table_id == PARENT_CHILD_TABLE_ID:
+        parent_object_ids, child_object_ids = parse_index_page(index_entries, cluster_size, "Parent Child Table")
+        for parent_object_id, child_object_id in zip(parent_object_ids, child_object_ids):
+            carve_records.append(carve_record(page_offset, cluster_size, page_type, table_id, 'parent_child', generation=page_header[5], object_id=child_object_id, parent_object_id=parent_object_id))
+    elif table_id != CONTAINER_TABLE_ID:  # Any Other Table is Tried as Directory Table (Only File / Directory Key Types are Taken)
+        lower_file_table_dic, lower_directory_table_dic = parse_index_page(index_entries, cluster_size, "Directory Table")
+        for value in lower_file_table_dic.values():
+            carve_records.append(carve_record(
+                page_offset, cluster_size, page_type, table_id, 'f', generation=page_header[5], path=value.file_name, parent_object_id=table_id, size=value.file_logical_size,
+                creation_time=value.file_creation_time, modification_time=value.file_last_modification_time, change_time=value.file_last_change_time, access_time=value.file_last_access_time, lcn=value.file_lcn))
+        for value in lower_directory_table_dic.values():
+            carve_records.append(carve_record(
+                page_offset, cluster_size, page_type, table_id, 'd', generation=page_header[5], path=value.directory_name, object_id=value.directory_object_id, parent_object_id=table_id,
+                creation_time=value.creation_time, modification_time=value.last_modification_time, change_time=value.last_change_time, access_time=value.last_access_time))
+
+    return carve_records or [carve_record(page_offset, cluster_size, page_type, table_id, 'leaf_node', generation=page_header[5])]
+
+def carve_page_range(image_file, cluster_size, start_offset, end_offset):
+    # Scan [start_offset, end_offset) in Large Sequential Reads for Page Signatures at Cluster Boundaries - Pages Starting in Range May Extend Past it
+    page_size = metadata_page_size(cluster_size)
+    signatures = [(signature.to_bytes(0x04, 'little'), page_type) for signature, page_type in CARVE_PAGE_SIGNATURES]
+    buffer = bytearray(CARVE_BLOCK_SIZE)
+    buffer_view = memoryview(buffer)
+    carve_records = []
+    damaged_pages = 0
+
+    block_offset = start_offset
+    while block_offset < end_offset:
+        block_length = image_file.read_into(block_offset, buffer_view[:min(CARVE_BLOCK_SIZE, end_offset - block_offset)])
+        if block_length == 0:
+            break
+
+        page_positions = []
+        for signature, page_type in signatures:
+            position = buffer.find(signature, 0, block_length)
+            while position >= 0:
+                if (block_offset + position) % cluster_size == 0:
+                    page_positions.append((position, page_type))
+                position = buffer.find(signature, position + 1, block_length)
+
+        for position, page_type in sorted(page_positions):
+            page_offset = block_offset + position
+            page = buffer_view[position:position + page_size] if position + page_size <= block_length else image_file.view(page_offset, page_size)
+            try:
+                carve_records.extend(carve_page(page, page_offset, cluster_size, page_type))
+            except (struct.error, UnicodeDecodeError, ValueError):  # Overwritten or Torn Page - Signature Alone Survived
+                damaged_pages += 1
+
+        block_offset += block_length
+
+    return carve_records, damaged_pages
+
+def collect_live_page_vcns(volume):
+    # VCN of Every Page the Current Check Point Still Reaches (Super Block, Check Points, Nodes of All Tables)
+    image_file, cluster_size = volume.image_file, volume.cluster_size
+    super_block = SUPER_BLOCK.unpack_from(image_file.view(SUPER_BLOCK_CLUSTER * cluster_size + PAGE_HEADER.size, SUPER_BLOCK.size))
+    live_page_vcns = {SUPER_BLOCK_CLUSTER, super_block[11], super_block[12]}
+
+    object_id_table_lcn, parent_child_table_lcn, container_table_vcn = read_check_point(image_file, volume.check_point_cluster, cluster_size)
+    lcn_translator = volume.lcn_translator
+    table_trees = [
+        MsbPlusTree(image_file, container_table_vcn, cluster_size),
+        MsbPlusTree(image_file, lcn_translator.translate(object_id_table_lcn), cluster_size, lcn_translator.translate),
+        MsbPlusTree(image_file, lcn_translator.translate(parent_child_table_lcn), cluster_size, lcn_translator.translate),
+    ]
+    for table_tree in table_trees:
+        live_page_vcns.update(table_tree.node_vcns())
+
+    # Every Object ID Table Entry References the Root of One More Table (Directory Tables)
+    for object_id, lcn in volume.object_id_table.items():
+        try:
+            live_page_vcns.update(MsbPlusTree(image_file, lcn_translator.translate(lcn), cluster_size, lcn_translator.translate).node_vcns())
+        except ReFSError:  # Referenced Page is Not an MSB+ Tree
+            continue
+
+    return live_page_vcns
+
+def initialize_carving_worker(image_path, use_mmap):
+    global worker_volume
+    worker_volume = Volume.open(image_path, use_mmap=use_mmap, require_super_block=False)  # Carving Needs Only VBR Geometry
+
+def carve_page_range_worker(offset_range):
+    return carve_page_range(worker_volume.image_file, worker_volume.cluster_size, *offset_range)
+
+def carve_volume(volume, workers=1, live_page_vcns=None, statistics=None):
+    # Yields Carve Records in Offset Order - Offset Ranges are Scanned by a Process Pool When workers > 1
+    image_size = volume.image_file.size
+    offset_ranges = [(start_offset, min(start_offset + CARVE_RANGE_SIZE, image_size)) for start_offset in range(0, image_size, CARVE_RANGE_SIZE)]
+    if statistics is None:
+        statistics = {}
+    statistics.update(pages=0, damaged_pages=0, live_pages=0, stale_pages=0, bytes_scanned=0)
+
+    def annotate(range_results):
+        for (start_offset, end_offset), (carve_records, damaged_pages) in zip(offset_ranges, range_results):
+            statistics['damaged_pages'] += damaged_pages
+            statistics['bytes_scanned'] += end_offset - start_offset
+            page_offset = None
+            for record in carve_records:
+                if live_page_vcns is not None:
+                    record['live'] = record['vcn'] in live_page_vcns
+                if record['offset'] != page_offset:  # Records of One Page are Consecutive
+                    page_offset = record['offset']
+                    statistics['pages'] += 1
+                    if record['live'] is not None:
+                        statistics['live_pages' if record['live'] else 'stale_pages'] += 1
+                yield record
+
+    if workers > 1:
+        with multiprocessing.Pool(workers, initializer=initialize_carving_worker, initargs=(volume.image_path, volume.use_mmap)) as pool:
+            yield from annotate(pool.imap(carve_page_range_worker, offset_ranges))
+    else:
+        yield from annotate(carve_page_range(volume.image_file, volume.cluster_size, *offset_range) for offset_range in offset_ranges)
+
+TIMELINE_RECORD_FIELDS = ('time', 'macb', 'type', 'path', 'object_id', 'size', 'lcn')
+TIMELINE_SORT_RUN_COUNT = 0x80000  # Count : Timeline Items Sorted in Memory per Run (Bounds Memory of Whole Sort)
+TIMELINE_MERGE_FAN_IN = 0x40  # Count : Runs Merged in One Pass (Bounds Open Temporary Files)
+TIMELINE_RUN_BLOCK_COUNT = 0x1000  # Count : Items per Pickled Block of Run File
+TIMELINE_FORMAT_BATCH_COUNT = 0x1000  # Count : Sorted Items Converted and Written per Batch
+
+def timeline_events(walk_records):
+    # One Event per Distinct Time of Each Entry, MACB Flags Marking Which Times Fall on it (Modified, Accessed, Changed, Born)
+    for sequence, record in enumerate(walk_records):
+        event_flag_dic = {}
+        for flag_index, field in enumerate(('modification_time', 'access_time', 'change_time', 'creation_time')):
+            filetime = record[field]
+            if filetime:  # None or 0 : Not Recorded
+                event_flag_dic.setdefault(filetime, ['.', '.', '.', '.'])[flag_index] = 'macb'[flag_index]
+        for filetime, flags in event_flag_dic.items():
+            # Sequence Breaks Ties of Equal Time and Path - Total Order Whatever the Run Boundaries
+            yield (filetime, record['path'], sequence, ''.join(flags), record['type'], record['object_id'], record['size'], record['lcn'])
+
+def timeline_body_entries(walk_records):
+    # One Body File Line per Entry, Ordered by its Earliest Recorded Time (0 : No Time Recorded)
+    for sequence, record in enumerate(walk_records):
+        times = (record['access_time'], record['modification_time'], record['change_time'], record['creation_time'])
+        yield (min((filetime for filetime in times if filetime), default=0), record['path'], sequence, record['type'], record['object_id'], record['size']) + times
+
+def write_sorted_run(sorted_items, run_directory, run_number):
+    run_path = os.path.join(run_directory, f"run_{run_number:06d}.pickle")
+    with open(run_path, 'wb') as run_file:
+        block = []
+        for item in sorted_items:
+            block.append(item)
+            if len(block) == TIMELINE_RUN_BLOCK_COUNT:
+                pickle.dump(block, run_file, pickle.HIGHEST_PROTOCOL)
+                block = []
+        if block:
+            pickle.dump(block, run_file, pickle.HIGHEST_PROTOCOL)
+    return run_path
+
+def read_sorted_run(run_path):
+    with open(run_path, 'rb', buffering=FILE_EXTRACTION_CHUNK_SIZE // TIMELINE_MERGE_FAN_IN) as run_file:
+        while True:
+            try:
+                block = pickle.load(run_file)
+            except EOFError:
+                return
+            yield from block
+
+def external_sort(items, run_count=TIMELINE_SORT_RUN_COUNT, fan_in=TIMELINE_MERGE_FAN_IN, temporary_directory=None, statistics=None):
+    # Sort Arbitrarily Many Tuples in Bounded Memory - Sorted Runs Spill to Temporary Files, Then are Merged (in Passes When More Runs Than fan_in)
+    if statistics is None:
+        statistics = {}
+    statistics.update(items=0, runs=0, merge_passes=0)
+
+    run_items = []
+    run_paths = []
+    with tempfile.TemporaryDirectory(prefix='refs_timeline_', dir=temporary_directory) as run_directory:
+        for item in items:
+            run_items.append(item)
+            if len(run_items) == run_count:
+                run_items.sort()
+                run_paths.append(write_sorted_run(run_items, run_directory, len(run_paths)))
+                run_items = []
+            statistics['items'] += 1
+
+        run_items.sort()
+        if not run_paths:  # Everything Fits in One Run - No Spill
+            statistics['runs'] = 1 if run_items else 0
+            yield from run_items
+            return
+        if run_items:
+            run_paths.append(write_sorted_run(run_items, run_directory, len(run_paths)))
+        del run_items
+        statistics['runs'] = run_number = len(run_paths)
+
+        while len(run_paths) > fan_in:
+            statistics['merge_passes'] += 1
+            merged_run_paths = []
+            for group_start in range(0, len(run_paths), fan_in):
+                group_paths = run_paths[group_start:group_start + fan_in]
+                merged_run_paths.append(write_sorted_run(heapq.merge(*(read_sorted_run(run_path) for run_path in group_paths)), run_directory, run_number))
+                run_number += 1
+                for run_path in group_paths:
+                    os.remove(run_path)
+            run_paths = merged_run_paths
+
+        statistics['merge_passes'] += 1
+        yield from heapq.merge(*(read_sorted_run(run_path) for run_path in run_paths))
+
+def write_timeline_records(sorted_items, output_file, output_format, utc_offset=0):
+    # sorted_items : timeline_events (jsonl / csv) or timeline_body_entries (body) Through external_sort
+    if output_format == 'body':
+        # Sleuth Kit Body File 3.x : MD5|name|inode|mode_as_string|UID|GID|size|atime|mtime|ctime|crtime (Times in UTC Seconds, mactime Applies the Zone)
+        number_of_records = 0
+        for _, path, _, entry_type, object_id, size, access_time, modification_time, change_time, creation_time in sorted_items:
+            mode = 'd/drwxrwxrwx' if entry_type == 'd' else 'r/rrwxrwxrwx'
+            output_file.write(f"0|{path}|{object_id or 0}|{mode}|0|0|{size or 0}|{convert_filesystem_time_unix(access_time)}|{convert_filesystem_time_unix(modification_time)}|"
+                              f"{convert_filesystem_time_unix(change_time)}|{convert_filesystem_time_unix(creation_time)}\n")
+            number_of_records += 1
+        return number_of_records
+
+    if output_format == 'csv':
+        writer = csv.writer(output_file)
+        writer.writerow(TIMELINE_RECORD_FIELDS)
+        write_row = writer.writerow
+    else:
+        write_row = lambda row: output_file.write(json.dumps(dict(zip(TIMELINE_RECORD_FIELDS, row))) + '\n')
+
+    number_of_records = 0
+    sorted_items = iter(sorted_items)
+    while True:
+        batch = list(islice(sorted_items, TIMELINE_FORMAT_BATCH_COUNT))
+        if not batch:
+            return number_of_records
+        for converted_time, (_, path, _, macb, entry_type, object_id, size, lcn) in zip(convert_filesystem_times([event[0] for event in batch], utc_offset), batch):
+            write_row((converted_time, macb, entry_type, path, hex(object_id) if object_id is not None else None, size, hex(lcn) if lcn is not None else None))
+        number_of_records += len(batch)
+
+METADATA_INDEX_SUFFIX = '.refsidx'  # Sidecar Index Path = Image Path + Suffix
+METADATA_INDEX_VERSION = 3
+
+def reraise_index_error(method):
+    # sqlite3.Error of Sidecar Index (Unwritable Directory, Read-Only Evidence Media, Not an SQLite File) -> ReFSError Naming the Index
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except sqlite3.Error as error:
+            raise ReFSError(f"Sidecar index '{self.index_path}' cannot be used : {error}") from None
+    return wrapper
+
+class MetadataIndex:
+    """SQLite sidecar holding parsed tables and directory listings of one image.
+
+    The index is keyed by image size and a hash of the check point page, so any
+    change to the volume (or a different image) invalidates it on open.
+    """
+
+    @reraise_index_error
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.connection = sqlite3.connect(index_path, check_same_thread=False)  # Volume Lock Serializes Use Across Threads
+        try:
+            self.connection.execute('PRAGMA synchronous = OFF')  # Sidecar Can Always be Rebuilt From Image
+            self.create_schema()
+        except sqlite3.Error:
+            self.connection.close()
+            raise
+
+    def create_schema(self):
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS index_metadata (key TEXT PRIMARY KEY, value);
+            CREATE TABLE IF NOT EXISTS container_table (entry_key INTEGER PRIMARY KEY, number_of_start_cluster INTEGER);
+            CREATE TABLE IF NOT EXISTS object_id_table (object_id INTEGER PRIMARY KEY, lcn INTEGER);
+            CREATE TABLE IF NOT EXISTS parent_child_table (parent_object_id INTEGER, child_object_id INTEGER, child_vcn INTEGER);
+            CREATE TABLE IF NOT EXISTS directory (object_id INTEGER PRIMARY KEY, path TEXT);
+            CREATE TABLE IF NOT EXISTS directory_entry (
+                directory_object_id INTEGER, entry_key INTEGER, type TEXT, name TEXT, object_id INTEGER, size INTEGER,
+                creation_time INTEGER, modification_time INTEGER, change_time INTEGER, access_time INTEGER, lcn INTEGER, vcn INTEGER, data_runs BLOB);
+            CREATE INDEX IF NOT EXISTS parent_child_table_parent ON parent_child_table (parent_object_id);
+            CREATE INDEX IF NOT EXISTS directory_path ON directory (path);
+            CREATE INDEX IF NOT EXISTS directory_entry_directory ON directory_entry (directory_object_id);
+            CREATE INDEX IF NOT EXISTS directory_entry_name ON directory_entry (name COLLATE NOCASE);
+        ''')
+
+    def get_metadata(self, key):
+        row = self.connection.execute('SELECT value FROM index_metadata WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_metadata(self, key, value):
+        self.connection.execute('INSERT OR REPLACE INTO index_metadata (key, value) VALUES (?, ?)', (key, value))
+
+    @reraise_index_error
+    def validate(self, image_size, check_point_hash):
+        # Return True When Stored Tables Belong to This Image and Check Point - Otherwise Start Over Empty
+        if (self.get_metadata('version') == METADATA_INDEX_VERSION and self.get_metadata('image_size') == image_size
+                and self.get_metadata('check_point_hash') == check_point_hash and self.get_metadata('tables_complete')):
+            return True
+
+        # Drop Tables Rather Than Delete Rows - Layout May Differ Between Index Versions
+        for table in ('index_metadata', 'container_table', 'object_id_table', 'parent_child_table', 'directory', 'directory_entry'):
+            self.connection.execute(f'DROP TABLE IF EXISTS {table}')
+        self.create_schema()
+        self.set_metadata('version', METADATA_INDEX_VERSION)
+        self.set_metadata('image_size', image_size)
+        self.set_metadata('check_point_hash', check_point_hash)
+        self.connection.commit()
+        return False
+
+    @reraise_index_error
+    def save_tables(self, container_table_key_dic, object_id_table, directory_tree):
+        # Tables of a Validated Index are Already Stored (Same Check Point) - Re-Reading the Image Adds Nothing
+        if self.get_metadata('tables_complete'):
+            return
+        self.connection.executemany('INSERT INTO container_table VALUES (?, ?)', ((key, value['number_of_start_cluster']) for key, value in container_table_key_dic.items()))
+        self.connection.executemany('INSERT INTO object_id_table VALUES (?, ?)', object_id_table.items())
+        self.connection.executemany('INSERT INTO parent_child_table VALUES (?, ?, ?)', ((parent_object_id, child_object_id, child_vcn) for parent_object_id, children in directory_tree.items() for child_object_id, child_vcn in children))
+        self.set_metadata('tables_complete', 1)
+        self.connection.commit()
+
+    @reraise_index_error
+    def load_tables(self):
+        container_table_key_dic = {key: {'number_of_start_cluster': start_cluster} for key, start_cluster in self.connection.execute('SELECT entry_key, number_of_start_cluster FROM container_table')}
+
+        # Rows Come Out in Primary Key / Insertion Order - Straight Into the Compact Columns
+        object_id_table_rows = self.connection.execute('SELECT object_id, lcn FROM object_id_table ORDER BY object_id').fetchall()
+        object_id_table = ObjectIdArray(array('Q', [row[0] for row in object_id_table_rows]), array('Q', [row[1] for row in object_id_table_rows]))
+
+        parent_child_table_rows = self.connection.execute('SELECT parent_object_id, child_object_id, child_vcn FROM parent_child_table ORDER BY rowid').fetchall()
+        directory_tree = DirectoryTree([row[0] for row in parent_child_table_rows], [row[1] for row in parent_child_table_rows], [row[2] for row in parent_child_table_rows])
+
+        return container_table_key_dic, object_id_table, directory_tree
+
+    @reraise_index_error
+    def save_directory_table(self, directory_object_id, directory_path, lcn_translator, object_id_table, lower_file_table_dic, lower_directory_table_dic):
+        # Directory Entries Keep LCN / VCN of Their Own Directory Table (Same Values the Walk Reports)
+        def directory_lcn_and_vcn(child_object_id):
+            child_lcn = object_id_table.get(child_object_id)
+            return child_lcn, (lcn_translator.translate(child_lcn) if child_lcn is not None else None)
+
+        self.connection.execute('INSERT OR REPLACE INTO directory VALUES (?, ?)', (directory_object_id, directory_path))
+        self.connection.execute('DELETE FROM directory_entry WHERE directory_object_id = ?', (directory_object_id,))
+        self.connection.executemany('INSERT INTO directory_entry VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', [
+            (directory_object_id, key, 'f', value.file_name, None, value.file_logical_size,
+             value.file_creation_time, value.file_last_modification_time, value.file_last_change_time, value.file_last_access_time,
+             value.file_lcn, lcn_translator.translate(value.file_lcn) if value.file_lcn is not None else None,
+             array('Q', [field for data_run in value.file_data_runs for field in data_run]).tobytes())
+            for key, value in lower_file_table_dic.items()
+        ] + [
+            (directory_object_id, key, 'd', value.directory_name, value.directory_object_id, None,
+             value.creation_time, value.last_modification_time, value.last_change_time, value.last_access_time, *directory_lcn_and_vcn(value.directory_object_id), None)
+            for key, value in lower_directory_table_dic.items()
+        ])
+
+    @reraise_index_error
+    def load_directory_table(self, directory_object_id):
+        if self.connection.execute('SELECT 1 FROM directory WHERE object_id = ?', (directory_object_id,)).fetchone() is None:
+            return None
+
+        # Rebuild Same Entries as read_currnet_directory_table
+        lower_file_table_dic = {}
+        lower_directory_table_dic = {}
+        for key, entry_type, name, object_id, size, creation_time, modification_time, change_time, access_time, lcn, data_runs in self.connection.execute(
+                'SELECT entry_key, type, name, object_id, size, creation_time, modification_time, change_time, access_time, lcn, data_runs FROM directory_entry WHERE directory_object_id = ? ORDER BY entry_key', (directory_object_id,)):
+            if entry_type == 'f':
+                data_run_fields = array('Q', data_runs)
+                lower_file_table_dic[key] = FileEntry(sys.intern(name), creation_time, modification_time, change_time, access_time, size, lcn, list(zip(data_run_fields[0::2], data_run_fields[1::2])))
+            else:
+                lower_directory_table_dic[key] = DirectoryEntry(sys.intern(name), object_id, creation_time, modification_time, change_time, access_time)
+
+        return lower_file_table_dic, lower_directory_table_dic
+
+    @reraise_index_error
+    def is_listing_complete(self):
+        return bool(self.get_metadata('listing_complete'))
+
+    @reraise_index_error
+    def mark_listing_complete(self):
+        self.set_metadata('listing_complete', 1)
+        self.connection.commit()
+
+    @reraise_index_error
+    def find_entries(self, pattern):
+        # Pattern With Path Separator Matches Full Path, Otherwise Entry Name (Shell Wildcards, Case Insensitive)
+        column = "directory.path || '\\' || directory_entry.name" if '\\' in pattern else 'directory_entry.name'
+        pattern = pattern.replace('!', '!!').replace('%', '!%').replace('_', '!_').replace('*', '%').replace('?', '_')  # '\\' is Path Separator - Escape With '!'
+        rows = self.connection.execute(
+                f"SELECT directory_entry.type, directory.path || '\\' || directory_entry.name, directory_entry.object_id, directory_entry.size, "
+                f"directory_entry.creation_time, directory_entry.modification_time, directory_entry.change_time, directory_entry.access_time, directory_entry.lcn, directory_entry.vcn "
+                f"FROM directory_entry JOIN directory ON directory.object_id = directory_entry.directory_object_id "
+                f"WHERE {column} LIKE ? ESCAPE '!' ORDER BY 2", (pattern,))
+        return (dict(zip(WALK_RECORD_FIELDS, row), signature=None, file_type=None) for row in rows)  # Query Runs Here - Errors Surface Before Iteration
+
+    @reraise_index_error
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+def hash_check_point(image_file, check_point_cluster, cluster_size):
+    return hashlib.sha256(image_file.view(check_point_cluster * cluster_size, metadata_page_size(cluster_size))).hexdigest()
+
+def read_directory_table_indexed(volume, base_cluster, directory_object_id, directory_path, tree=None):
+    # Directory Listing From Sidecar Index When Already Parsed, Otherwise Parse and Remember it
+    metadata_index = volume.metadata_index
+    if metadata_index is not None:
+        directory_table = metadata_index.load_directory_table(directory_object_id)
+        if directory_table is not None:
+            return directory_table
+
+    lower_file_table_dic, lower_directory_table_dic = read_currnet_directory_table(volume.image_file, base_cluster, volume.cluster_size, volume.lcn_translator, directory_object_id, tree)
+    if metadata_index is not None:
+        metadata_index.save_directory_table(directory_object_id, directory_path, volume.lcn_translator, volume.object_id_table, lower_file_table_dic, lower_directory_table_dic)
+
+    return lower_file_table_dic, lower_directory_table_dic
+
+def read_currnet_directory_table(image_file, base_cluster, cluster_size, lcn_translator, directory_object_id = 0x600, tree=None):
     image_file.seek(base_cluster * cluster_size)
 
     page_header = read_struct(image_file, PAGE_HEADER_STRUCTURE)
 
     if (hex(page_header[0]) != "0x2b42534d"):  # Compair page header signature "MSB+"
         if (page_header[11] != directory_object_id):  # Compair page header to Reference Object ID
-            sys.exit(f"This is not a table corresponding to the reference Object ID.\n")
+            raise PageSignatureError(f"This is not a table corresponding to the reference Object ID.", base_cluster)
         else:
-            sys.exit(f"This block is not Table.\n")
+            raise PageSignatureError(f"This block is not Table.", base_cluster)
     
-    # Return Type of Four Variable - | File Name | File LCN | File Object ID | / | Directory Name | Directory Object ID | Directory Last Access Time |
-    image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE))  # Move to Index Root
-    return read_index(image_file, base_cluster, cluster_size, "Directory Table", container_table_key_dic, object_id_table_lcn_dic)
-
-def read_index(image_file, base_cluster, cluster_size, table_type, container_table_key_dic, object_id_table_lcn_dic):
-    base_entry_offset_in_cluster = image_file.tell()
-
-    index_root = read_struct(image_file, INDEX_ROOT_STRUCTURE)
-    if (table_type == "File Table"):
-        file_table_time_size = read_struct(image_file, FILE_TABLE_TIME_SIZE_STRUCTURE)
-
-        # print(f"File Last Access Time : {convert_filesystem_time(file_table_time_size[3])}, Logical Size : {hex(file_table_time_size[7])}")
-        global file_last_access_time; file_last_access_time = file_table_time_size[3]
-
-    image_file.seek(base_entry_offset_in_cluster + index_root[0])  # Move to Index Header
-
-    index_header = read_struct(image_file, INDEX_HEADER_STRUCTURE)
-    number_of_entries = index_header[6]
-    image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_header[5])  # Move to Index Key (+ Index Header)
-
+    # Return Type of Two Dictionary - Entry Position -> FileEntry / Entry Position -> DirectoryEntry
+    image_file.seek(base_cluster * cluster_size + PAGE_HEADER.size)  # Move to Index Root
+    return read_index(image_file, base_cluster, cluster_size, "Directory Table", lcn_translator, tree)
+
+def find_directory_entry(image_file, base_cluster, cluster_size, lcn_translator, entry_name, tree=None):
+    # Point Lookup of One Name - Reads One Page per Tree Level Instead of Parsing Whole Directory Table
+    if tree is None:
+        tree = MsbPlusTree(image_file, base_cluster, cluster_size, lcn_translator.translate, directory_table_key)
+    index_entry = tree.lookup(entry_name.upper())
+    if index_entry is None:
+        return None
+
+    # Same Entry as One Entry of read_currnet_directory_table (FileEntry or DirectoryEntry)
+    lower_file_table_dic, lower_directory_table_dic = parse_index_page([index_entry], cluster_size, "Directory Table")
+    return next(iter(lower_file_table_dic.values()), None) or next(iter(lower_directory_table_dic.values()), None)
+
+def read_index(image_file, base_cluster, cluster_size, table_type, lcn_translator, tree=None):
+    # Container Table Page References are VCN Already (Table Itself Defines LCN -> VCN), Other Tables Reference LCN
+    if tree is None:
+        tree = MsbPlusTree(image_file, base_cluster, cluster_size, lcn_translator.translate if lcn_translator is not None else None)
+
+    # Leaf Entries of Whole Tree in Key Order - Inner Nodes are Followed as They are Reached (Already Parsed Ones When tree is Kept by the Caller)
+    return parse_index_page(tree.iterate(), cluster_size, table_type)
+
+def metadata_page_size(cluster_size):
+    return max(METADATA_PAGE_SIZE, cluster_size)  # ReFS 3.x Metadata Page is 16 KiB (One Cluster When Cluster Size is 64 KiB)
+
+def iterate_index_entries(page, index_root_offset):
+    index_root = INDEX_ROOT.unpack_from(page, index_root_offset)
+    index_header_offset = index_root_offset + index_root[0]  # Index Header (+ Index Root)
+
+    index_header = INDEX_HEADER.unpack_from(page, index_header_offset)
+    index_key_offset = index_header_offset + index_header[5]  # Index Key Array (+ Index Header)
+
+    for key in range(index_header[6]):  # Number of Entries
+        index_entry_offset = index_header_offset + (INDEX_KEY.unpack_from(page, index_key_offset + (key * 0x04))[0] & 0xFFFF)  # Lower 2 Byte of Index Key (+ Index Header)
+        yield key, index_entry_offset, INDEX_ENTRY.unpack_from(page, index_entry_offset)
+
+def object_id_table_key(key):
+    return int.from_bytes(key, 'little')  # 16 Byte Key Compared as One Little Endian Integer (Object ID in Upper 8 Byte)
+
+def directory_table_key(key):
+    return str(key[0x04:], 'utf-16-le', 'replace').upper()  # Entry Name After 4 Byte Key Type, Case Insensitive Order
+
+class MsbPlusNode:
+    __slots__ = ('page', 'is_inner', 'entries', 'keys')
+
+    def __init__(self, page, is_inner, entries):
+        self.page = page
+        self.is_inner = is_inner
+        self.entries = entries  # | Index Entry Offset | Index Entry | in Key Array (Sorted) Order
+        self.keys = None  # Comparable Keys, Built on First Lookup
+
+class MsbPlusTree:
+    """Lazy reader of one MSB+ tree (ReFS metadata table).
+
+    Nodes are read only when a lookup or iteration reaches them and are kept in a
+    small LRU cache. An inner node (index height > 0) holds page references whose
+    keys are the first key of each child, so a point lookup reads one page per
+    level. `translate_reference` maps a child page reference to its VCN (None when
+    references are VCN already, as in the container table).
+    """
+
+    def __init__(self, image_file, root_vcn, cluster_size, translate_reference=None, key_function=bytes, node_cache_count=MSB_PLUS_NODE_CACHE_COUNT):
+        self.image_file = image_file
+        self.root_vcn = root_vcn
+        self.cluster_size = cluster_size
+        self.translate_reference = translate_reference
+        self.key_function = key_function
+        self.node_cache_count = node_cache_count
+        self.nodes_read = 0
+        self._nodes = OrderedDict()  # VCN -> MsbPlusNode (Least Recently Used First)
+
+    def node(self, vcn):
+        node = self._nodes.get(vcn)
+        if node is not None:
+            self._nodes.move_to_end(vcn)
+            return node
+
+        page = self.image_file.view(vcn * self.cluster_size, metadata_page_size(self.cluster_size))
+        if len(page) < metadata_page_size(self.cluster_size):  # Truncated Image
+            raise ReFSError(f"Page at VCN {hex(vcn)} is beyond end of image.")
+        if PAGE_HEADER.unpack_from(page)[0] != MSB_PLUS_PAGE_SIGNATURE:
+            raise PageSignatureError(f"Page at VCN {hex(vcn)} is not an MSB+ tree node.", vcn)
+
+        index_root_offset = PAGE_HEADER.size
+        index_header = INDEX_HEADER.unpack_from(page, index_root_offset + INDEX_ROOT.unpack_from(page, index_root_offset)[0])
+        node = MsbPlusNode(page, index_header[3] > 0, [(index_entry_offset, index_entry) for _, index_entry_offset, index_entry in iterate_index_entries(page, index_root_offset)])  # Index Height > 0 : Inner Node
+        self.nodes_read += 1
+
+        self._nodes[vcn] = node
+        if len(self._nodes) > self.node_cache_count:  # Evict Least Recently Used Node
+            self._nodes.popitem(last=False)
+        return node
+
+    def entry_key(self, node, index_entry_offset, index_entry):
+        key_offset = index_entry_offset + index_entry[1]
+        return node.page[key_offset:key_offset + index_entry[2]]
+
+    def child_vcn(self, node, index_entry_offset, index_entry):
+        page_reference = PAGE_REFERENCE.unpack_from(node.page, index_entry_offset + index_entry[4])
+        return page_reference[0] if self.translate_reference is None else self.translate_reference(page_reference[0])
+
+    def node_keys(self, node):
+        if node.keys is None:
+            node.keys = [self.key_function(self.entry_key(node, index_entry_offset, index_entry)) for index_entry_offset, index_entry in node.entries]
+        return node.keys
+
+    def child_position(self, node, key):
+        # Last Child Whose First Key <= Key (First Child When Key Precedes All)
+        keys = self.node_keys(node)
+        low, high = 0, len(keys)
+        while low < high:
+            middle = (low + high) // 2
+            if keys[middle] <= key:
+                low = middle + 1
+            else:
+                high = middle
+        return max(low - 1, 0)
+
+    def lookup(self, key):
+        # Returns | Page | Index Entry Offset | Index Entry | of Matching Leaf Entry, None When Key is Absent
+        node = self.node(self.root_vcn)
+        while node.is_inner:
+            if not node.entries:
+                return None
+            index_entry_offset, index_entry = node.entries[self.child_position(node, key)]
+            node = self.node(self.child_vcn(node, index_entry_offset, index_entry))
+
+        keys = self.node_keys(node)
+        position = self.child_position(node, key)
+        if keys and keys[position] == key:
+            index_entry_offset, index_entry = node.entries[position]
+            return node.page, index_entry_offset, index_entry
+        return None
+
+    def iterate(self, start_key=None, end_key=None):
+        # Leaf Entries in Key Order, Limited to start_key <= Key <= end_key When Given
+        node_stack = [(self.node(self.root_vcn), start_key)]
+        while node_stack:
+            node, lower_key = node_stack.pop()
+            first_position = self.child_position(node, lower_key) if lower_key is not None and node.entries else 0
+
+            if node.is_inner:
+                children = []
+                for position in range(first_position, len(node.entries)):
+                    if end_key is not None and position > first_position and self.node_keys(node)[position] > end_key:
+                        break
+                    children.append((node, position, lower_key if position == first_position else None))
+                for parent, position, child_lower_key in reversed(children):  # Visit Children Left to Right
+                    index_entry_offset, index_entry = parent.entries[position]
+                    node_stack.append((self.node(self.child_vcn(parent, index_entry_offset, index_entry)), child_lower_key))
+                continue
+
+            for position in range(first_position, len(node.entries)):
+                index_entry_offset, index_entry = node.entries[position]
+                if start_key is not None or end_key is not None:
+                    key = self.node_keys(node)[position]
+                    if start_key is not None and key < start_key:
+                        continue
+                    if end_key is not None and key > end_key:
+                        return
+                yield node.page, index_entry_offset, index_entry
+
+    def node_vcns(self):
+        # VCN of Every Node Reachable From the Root (Pages in Use by This Table)
+        vcn_stack = [self.root_vcn]
+        while vcn_stack:
+            vcn = vcn_stack.pop()
+            yield vcn
+            node = self.node(vcn)
+            if node.is_inner:
+                vcn_stack.extend(self.child_vcn(node, index_entry_offset, index_entry) for index_entry_offset, index_entry in node.entries)
+
+class ObjectIdTable(Mapping):
+    """Object ID -> LCN view over the Object ID Table tree.
+
+    Only looked-up entries are parsed, and at most lcn_cache_count of them are kept
+    (least recently used are dropped); iteration walks the leaves without keeping
+    them. Pickled (parallel walk workers) as an ObjectIdArray.
+    """
+
+    def __init__(self, tree, lcn_cache_count=OBJECT_ID_CACHE_COUNT):
+        self.tree = tree
+        self.lcn_cache_count = lcn_cache_count
+        self._lcn_dic = OrderedDict()  # Object ID -> LCN (Least Recently Used First)
+        self._length = None
+
+    @staticmethod
+    def parse_entry(page, index_entry_offset, index_entry):
+        object_id_table_key = OBJECT_ID_TABLE_KEY.unpack_from(page, index_entry_offset + index_entry[1])
+        page_reference = PAGE_REFERENCE.unpack_from(page, index_entry_offset + index_entry[4] + OBJECT_ID_TABLE_VALUE.size)  # Jump to Index Entry's Page Reference Area
+        return object_id_table_key[1], page_reference[0]  # | Object ID | LCN of Object ID Table Entry |
+
+    def __getitem__(self, object_id):
+        lcn = self._lcn_dic.get(object_id)
+        if lcn is not None:
+            self._lcn_dic.move_to_end(object_id)
+            return lcn
+
+        index_entry = self.tree.lookup(object_id << 64) if isinstance(object_id, int) and object_id >= 0 else None
+        if index_entry is None:
+            raise KeyError(object_id)
+        lcn = self._lcn_dic[object_id] = self.parse_entry(*index_entry)[1]
+        if len(self._lcn_dic) > self.lcn_cache_count:  # Evict Least Recently Used Object ID
+            self._lcn_dic.popitem(last=False)
+        return lcn
+
+    def items(self):
+        for index_entry in self.tree.iterate():
+            yield self.parse_entry(*index_entry)
+
+    def __iter__(self):
+        for object_id, _ in self.items():
+            yield object_id
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(1 for _ in self.tree.iterate())
+        return self._length
+
+    def to_array(self):
+        object_ids = array('Q')
+        lcns = array('Q')
+        for object_id, lcn in self.items():  # Leaves are in Key Order - Object IDs Come Out Sorted
+            object_ids.append(object_id)
+            lcns.append(lcn)
+        return ObjectIdArray(object_ids, lcns)
+
+    def __reduce__(self):
+        return self.to_array().__reduce__()
+
+class ObjectIdArray(Mapping):
+    """Object ID -> LCN held as two parallel sorted array('Q') columns (16 bytes per entry)."""
+
+    def __init__(self, object_ids, lcns):
+        self.object_ids = object_ids
+        self.lcns = lcns
+
+    def __getitem__(self, object_id):
+        position = bisect.bisect_left(self.object_ids, object_id)
+        if position == len(self.object_ids) or self.object_ids[position] != object_id:
+            raise KeyError(object_id)
+        return self.lcns[position]
+
+    def items(self):
+        return zip(self.object_ids, self.lcns)
+
+    def __iter__(self):
+        return iter(self.object_ids)
+
+    def __len__(self):
+        return len(self.object_ids)
+
+    def __reduce__(self):
+        return ObjectIdArray, (self.object_ids, self.lcns)
+
+class DirectoryTree(Mapping):
+    """Parent Object ID -> [(Child Object ID, Child VCN), ...] in compressed sparse row form.
+
+    Parents are one sorted array('Q'); children of the parent at position i are
+    child_object_ids[child_offsets[i]:child_offsets[i + 1]] (same for child_vcns),
+    kept in Parent Child Table order. About 16 bytes per child instead of a tuple
+    in a list per child.
+    """
+
+    def __init__(self, parent_object_ids, child_object_ids, child_vcns):
+        # Stable Sort by Parent - Children of One Parent Keep Their Table Order
+        order = sorted(range(len(parent_object_ids)), key=parent_object_ids.__getitem__)
+
+        self.parent_object_ids = array('Q')
+        self.child_offsets = array('Q', [0])
+        self.child_object_ids = array('Q', [child_object_ids[position] for position in order])
+        self.child_vcns = array('Q', [child_vcns[position] for position in order])
+        for child_index, position in enumerate(order):
+            parent_object_id = parent_object_ids[position]
+            if not self.parent_object_ids or self.parent_object_ids[-1] != parent_object_id:
+                if self.parent_object_ids:
+                    self.child_offsets.append(child_index)
+                self.parent_object_ids.append(parent_object_id)
+        if self.parent_object_ids:
+            self.child_offsets.append(len(order))
+
+    def __getitem__(self, parent_object_id):
+        position = bisect.bisect_left(self.parent_object_ids, parent_object_id)
+        if position == len(self.parent_object_ids) or self.parent_object_ids[position] != parent_object_id:
+            raise KeyError(parent_object_id)
+        start, end = self.child_offsets[position], self.child_offsets[position + 1]
+        return list(zip(self.child_object_ids[start:end], self.child_vcns[start:end]))
+
+    def __iter__(self):
+        return iter(self.parent_object_ids)
+
+    def __len__(self):
+        return len(self.parent_object_ids)
+
+    def number_of_children(self):
+        return len(self.child_object_ids)
+
+    def __reduce__(self):
+        return _restore_directory_tree, (self.parent_object_ids, self.child_offsets, self.child_object_ids, self.child_vcns)
+
+def _restore_directory_tree(parent_object_ids, child_offsets, child_object_ids, child_vcns):
+    # Unpickle Without Sorting Again - Arrays are Already in CSR Order
+    directory_tree = DirectoryTree.__new__(DirectoryTree)
+    directory_tree.parent_object_ids, directory_tree.child_offsets = parent_object_ids, child_offsets
+    directory_tree.child_object_ids, directory_tree.child_vcns = child_object_ids, child_vcns
+    return directory_tree
+
+class FileEntry:
+    __slots__ = ('file_name', 'file_creation_time', 'file_last_modification_time', 'file_last_change_time', 'file_last_access_time', 'file_logical_size', 'file_lcn', 'file_data_runs')
+
+    def __init__(self, file_name, file_creation_time, file_last_modification_time, file_last_change_time, file_last_access_time, file_logical_size, file_lcn, file_data_runs):
+        self.file_name = file_name
+        self.file_creation_time = file_creation_time
+        self.file_last_modification_time = file_last_modification_time
+        self.file_last_change_time = file_last_change_time
+        self.file_last_access_time = file_last_access_time
+        self.file_logical_size = file_logical_size
+        self.file_lcn = file_lcn  # None When No Data Run Matches File Table Layout
+        self.file_data_runs = file_data_runs  # | LCN (0 = Sparse) | Number of Clusters |
+
+class DirectoryEntry:
+    __slots__ = ('directory_name', 'directory_object_id', 'creation_time', 'last_modification_time', 'last_change_time', 'last_access_time')
+
+    def __init__(self, directory_name, directory_object_id, creation_time, last_modification_time, last_change_time, last_access_time):
+        self.directory_name = directory_name
+        self.directory_object_id = directory_object_id
+        self.creation_time = creation_time
+        self.last_modification_time = last_modification_time
+        self.last_change_time = last_change_time
+        self.last_access_time = last_access_time
+
+def parse_index_page(index_entries, cluster_size, table_type):
+    # Container Table -> Key Dictionary / Parent Child Table -> Parent and Child Object ID Columns / Directory Table -> File and Directory Entries
+    container_table_key_dic = {}
+    parent_object_ids = array('Q')
+    child_object_ids = array('Q')
     lower_file_table_of_current_directory = {}
     lower_directory_table_of_current_directory = {}
-    for key in range(number_of_entries):
-        image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_header[5] + (key * 0x04))  # Move to Each Index Key Entry (+ Index Header, Index Key)
+    for key, (page, index_entry_offset, index_entry) in enumerate(index_entries):
+        index_entry_key_offset = index_entry_offset + index_entry[1]  # Index Entry Key (+ Index Entry)
+        index_entry_value_offset = index_entry_offset + index_entry[4]  # Index Entry Value (+ Index Entry)
 
-        index_key = (read_struct(image_file, INDEX_KEY_STRUCTURE)[0] & 0xFFFF)  # Return Lower 2 Byte
-        image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key)  # Move to Index Entry (+ Index Header)
-        
-        index_entry = read_struct(image_file, INDEX_ENTRY_STRUCTURE)
-        
         # Compair Current Table Type
-        if (table_type == "Container Table"):  # Table Type is Container Table
-            image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[4])  # Move to Index Entry Value (+ Index Header, Index Entry)
-
-            page_reference = read_struct(image_file, PAGE_REFERENCE_STRUCTURE)
-            image_file.seek(page_reference[0] * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE))  # Move to Index Root
-            read_index(image_file, page_reference[0], cluster_size, "Container Table Key-Value", container_table_key_dic, None)
-    
-        elif (table_type == "Container Table Key-Value"):  # Table Type is Container Table Key-Value
-            image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[4])  # Move to Index Entry Value (+ Index Header, Index Entry)
-            container_table = read_struct(image_file, CONTAINER_TABLE_STRUCTURE)
+        if (table_type == "Container Table"):  # Table Type is Container Table (Leaf Entry is Key-Value)
+            container_table = CONTAINER_TABLE.unpack_from(page, index_entry_value_offset)
 
             container_table_key_dic[container_table[0]] = {  # Entry Key
                 "number_of_start_cluster": container_table[10]  # Number of Start Cluster
             }
 
-        elif (table_type == "Object ID Table"):  # Table Type is Object ID Table
-            image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[1])  # Move to Index Entry Key (+ Index Header, Index Entry)
-            object_id_table_key = read_struct(image_file, OBJECT_ID_TABLE_KEY_STRUCTURE)
-            
-            image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE) + index_root[0] + index_key + index_entry[4])  # Move to Index Entry Value (+ Index Header, Index Entry)
-            object_id_table_value = read_struct(image_file, OBJECT_ID_TABLE_VALUE_STRUCTURE)  # Jump to Index Entry's Page Reference Area
-            page_reference = read_struct(image_file, PAGE_REFERENCE_STRUCTURE)
-        
-            object_id_table_lcn_dic[object_id_table_key[1]] = {  # Object ID of Object ID Table Entry
-                "LCN": page_reference[0]  # LCN of Object ID Table Entry
-            }
-        
         elif (table_type == "Parent Child Table"):  # Table Type is Parent Child Table
-            image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key)  # Move to Index Entry (+ Index Header)
-            parent_child_table_key = read_struct(image_file, PARENT_CHILD_TABLE_STRUCTURE)
-
-            parent_directory_object_id = parent_child_table_key[3]
-            child_directory_object_id = parent_child_table_key[5]
-            
-            # Convert Object ID to LCN form Object ID Table LCN Dictionary
-            parent_directory_lcn = int(object_id_table_lcn_dic[parent_directory_object_id]["LCN"])
-            child_directory_lcn = int(object_id_table_lcn_dic[child_directory_object_id]["LCN"])
-
-            # Convert LCN to VCN
-            parent_directory_vcn = lcn_to_vcn(cluster_size, container_size, parent_directory_lcn, container_table_key_dic)
-            child_directory_vcn = lcn_to_vcn(cluster_size, container_size, child_directory_lcn, container_table_key_dic)
+            parent_child_table_key = PARENT_CHILD_TABLE.unpack_from(page, index_entry_offset)
 
-            # Save Root Directory VCN
-            if (int(parent_directory_object_id) == 0x600):
-                global root_vcn; root_vcn = parent_directory_vcn
-
-            # Save Parent Child Table Dictionary
-            if int(parent_directory_object_id) not in master_directory_tree_dic:
-                master_directory_tree_dic[int(parent_directory_object_id)] = []
-            master_directory_tree_dic[int(parent_directory_object_id)].append((int(child_directory_object_id), int(child_directory_vcn)))
+            # Object ID Pairs Only - VCN of Each Child is Resolved for Whole Column at Once
+            parent_object_ids.append(parent_child_table_key[3])
+            child_object_ids.append(parent_child_table_key[5])
 
         elif (table_type == "Directory Table"):  # Table Type is Directory Table
-            image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[1])  # Move to Index Entry Value (+ Index Header, Index Entry)
-            index_entry_key = read_struct(image_file, INDEX_KEY_STRUCTURE)
-
-            if (index_entry_key[0] == 0x10030):  # This Index Entry is 'File Table'
-                image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[1])  # Move to Index Entry Key (+ Index Header, Index Entry)
-                index_entry_key = read_struct(image_file, FILE_TABLE_NAME_STRUCTURE, int(index_entry[2]))
+            index_entry_key_type = INDEX_KEY.unpack_from(page, index_entry_key_offset)[0]
+            # Name Follows 4 Byte Key Type - Decode it as UTF-16LE Like directory_table_key (Interned - Repeated Names Share One String)
+            index_entry_name = sys.intern(str(page[index_entry_key_offset + 0x04:index_entry_key_offset + index_entry[2]], 'utf-16-le', 'replace'))
 
+            if (index_entry_key_type == 0x10030):  # This Index Entry is 'File Table'
                 # Parse File Metadata (Time, LCN, Logical Size) in File Table
-                image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[4])  # Move to Index Entry Value (+ Index Header, Index Entry)
-                global current_file_meta_table_of_directory; current_file_meta_table_of_directory = {}
-                read_index(image_file, base_cluster, cluster_size, "File Table", container_table_key_dic, object_id_table_lcn_dic)
+                file_meta = parse_file_table(page, index_entry_value_offset, cluster_size)
 
-                # print(f"current_file_meta_table_of_directory: {current_file_meta_table_of_directory}")
+                lower_file_table_of_current_directory[key] = FileEntry(
+                    index_entry_name, file_meta['file_creation_time'], file_meta['file_last_modification_time'], file_meta['file_last_change_time'], file_meta['file_last_access_time'],
+                    file_meta['file_logical_size'], file_meta['file_lcn'], file_meta['file_data_runs']
+                )
 
-                # Return Type of Four Variable - | File Name | File LCN | File Object ID |
-                lower_file_table_of_current_directory[key] = {
-                    'file_name': index_entry_key[2].replace('\x00', ''),
-                    'file_last_access_time': current_file_meta_table_of_directory[0]['file_last_access_time'],
-                    'file_lcn': current_file_meta_table_of_directory[0]['file_lcn'],
-                    'file_logical_size': current_file_meta_table_of_directory[0]['file_logical_size']
-                }
+            elif (index_entry_key_type == 0x20030):  # This Index Entry is 'Directory Table'
+                index_entry_value = DIRECTORY_TABLE_METADATA.unpack_from(page, index_entry_value_offset)
 
-                # print(lower_file_table_of_current_directory[key])
+                lower_directory_table_of_current_directory[key] = DirectoryEntry(
+                    index_entry_name, index_entry_value[1], index_entry_value[2], index_entry_value[3], index_entry_value[4], index_entry_value[5]
+                )
 
-            elif (index_entry_key[0] == 0x20030):  # This Index Entry is 'Directory Table'
-                image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE) + index_root[0] + index_key + index_entry[1])  # Move to Index Entry Key (+ Index Header, Index Entry)
-                index_entry_key = read_struct(image_file, DIRECTORY_TABLE_NAME_STRUCTURE, int(index_entry[2]))
+    if (table_type == "Container Table"):
+        return container_table_key_dic
+    if (table_type == "Parent Child Table"):
+        return parent_object_ids, child_object_ids
 
-                image_file.seek(base_cluster * cluster_size + struct.calcsize(PAGE_HEADER_STRUCTURE) + index_root[0] + index_key + index_entry[4])  # Move to Index Entry Value (+ Index Header, Index Entry)
-                index_entry_value = read_struct(image_file, DIRECTORY_TABLE_METADATA_STRUCTURE)
-
-                # Return Type of Four Variable - | Directory Name | Directory Object ID | Directory Last Access Time |
-                lower_directory_table_of_current_directory[key] = {'directory_name': index_entry_key[1].replace('\x00', ''), 'directory_object_id': index_entry_value[1], 'last_access_time': index_entry_value[5]}
-        
-        elif (table_type == "File Table"):  # Table Type is Directory Table
-            image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[4])  # Move to Index Entry Value (+ Index Header, Index Entry)
-            file_table_size = read_struct(image_file, FILE_TABLE_SIZE_STRUCTURE)
-            
-            if (file_table_time_size[7] == file_table_size[6]) and (file_table_size[6] == file_table_size[7]):
-                
-                # Read Cluster Run
-                image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[4] + file_table_size[0])  # Move to Index Entry Value (+ Index Header, Index Entry)
-                file_table_datarun_metadata = read_struct(image_file, '<I')
-
-                image_file.seek(base_entry_offset_in_cluster + index_root[0] + index_key + index_entry[4] + file_table_size[0] + file_table_datarun_metadata[0])  # Move to Index Entry Value (+ Index Header, Index Entry)
-                file_table_datarun = read_struct(image_file, FILE_TABLE_DATARUN_STRUCTURE)
-                if (file_table_size[4] == (file_table_datarun[4] * cluster_size)):
-                    # print(f"File LCN : {hex(file_table_datarun[0])}")
-                    current_file_meta_table_of_directory[0] = {'file_last_access_time': file_last_access_time, 'file_logical_size': file_table_size[6], 'file_lcn': file_table_datarun[0]}
-
-    # Return Type of Four Variable - | File Name | File LCN | File Object ID | / | Directory Name | Directory Object ID | Directory Last Access Time |
+    # Return Type of Two Dictionary - Entry Position -> FileEntry / Entry Position -> DirectoryEntry
     return lower_file_table_of_current_directory, lower_directory_table_of_current_directory
 
-def lcn_to_vcn(cluster_size, container_size, lcn, container_table_key_dic):
-    clusters_per_container = int(container_size / cluster_size)  # CPC = Clusters Per Container
+def parse_file_table(page, index_root_offset, cluster_size):
+    # File Table is an Index Embedded in Directory Table Entry Value - Time and Size Follow its Index Root
+    file_table_time_size = FILE_TABLE_TIME_SIZE.unpack_from(page, index_root_offset + INDEX_ROOT.size)
+
+    # Time Values are Kept Even When No Data Run Matches (File Has No LCN Then)
+    file_meta = {
+        'file_creation_time': file_table_time_size[0], 'file_last_modification_time': file_table_time_size[1],
+        'file_last_change_time': file_table_time_size[2], 'file_last_access_time': file_table_time_size[3],
+        'file_logical_size': file_table_time_size[7], 'file_lcn': None, 'file_data_runs': []
+    }
+    for key, index_entry_offset, index_entry in iterate_index_entries(page, index_root_offset):
+        index_entry_value_offset = index_entry_offset + index_entry[4]  # Index Entry Value (+ Index Entry)
+        file_table_size = FILE_TABLE_SIZE.unpack_from(page, index_entry_value_offset)
+
+        if (file_table_time_size[7] == file_table_size[6]) and (file_table_size[6] == file_table_size[7]):
+            # Read Cluster Run - Only a Single Run Covering the Whole Allocation is Understood. Fragmented Files Keep Their Extents in an
+            # Embedded Extent Index Whose Layout is Not Parsed Here, so They are Left Without LCN (Reported as Unsupported, Not Guessed)
+            file_table_datarun_metadata_offset = index_entry_value_offset + file_table_size[0]
+            file_table_datarun_offset = file_table_datarun_metadata_offset + INDEX_KEY.unpack_from(page, file_table_datarun_metadata_offset)[0]
+            file_table_datarun = FILE_TABLE_DATARUN.unpack_from(page, file_table_datarun_offset)
+
+            if (file_table_size[4] == (file_table_datarun[4] * cluster_size)):
+                file_meta['file_logical_size'] = file_table_size[6]
+                file_meta['file_lcn'] = file_table_datarun[0]
+                file_meta['file_data_runs'] = [(file_table_datarun[0], file_table_datarun[4])]  # | LCN | Number of Clusters |
+
+    return file_meta
+
+class LcnTranslator:
+    """LCN -> VCN translation with container geometry computed once.
+
+    VCN = (Start Cluster of Container Entry) + (LCN & (Clusters Per Container - 1)),
+    where the container entry key is LCN >> (CPC Shift + 1).
+    """
+
+    def __init__(self, cluster_size, container_size, container_table_key_dic):
+        self.cluster_size = cluster_size
+        self.container_size = container_size
+        self.container_table_key_dic = container_table_key_dic
+
+        self.clusters_per_container = container_size // cluster_size  # CPC = Clusters Per Container
+        self.clusters_per_container_shift = self.clusters_per_container.bit_length() - 1  # CPC Shift = Right shift CPC until it equals 1
+        self.entry_key_shift = self.clusters_per_container_shift + 1  # Entry Key = Right shift LCN with 'CPC + 1'
+        self.cluster_offset_mask = self.clusters_per_container - 0x01
+
+        # Sorted Entry Key and Start Cluster Arrays (Batch Lookup) and Key -> Start Cluster Dictionary (Scalar Lookup)
+        self.entry_keys = array('Q', sorted(container_table_key_dic))
+        self.start_clusters = array('Q', (container_table_key_dic[entry_key]['number_of_start_cluster'] for entry_key in self.entry_keys))
+        self.start_cluster_dic = dict(zip(self.entry_keys, self.start_clusters))
+
+    def translate(self, lcn):
+        start_cluster = self.start_cluster_dic.get(lcn >> self.entry_key_shift)
+        if start_cluster is None:  # Computed Entry Key Does Not Exist in Container Table Key Dictionary
+            raise UnknownContainerError(lcn >> self.entry_key_shift)
+        return start_cluster + (lcn & self.cluster_offset_mask)
+
+    def translate_array(self, lcns):
+        # NumPy Array In -> NumPy Array Out (Vectorized), Any Other Iterable -> array('Q')
+        if numpy is not None and isinstance(lcns, numpy.ndarray):
+            lcns = lcns.astype(numpy.uint64, copy=False)
+            entry_keys = numpy.frombuffer(self.entry_keys, dtype=numpy.uint64)
+            lookup_keys = lcns >> numpy.uint64(self.entry_key_shift)
+
+            positions = numpy.searchsorted(entry_keys, lookup_keys)
+            found = positions < len(entry_keys)
+            found[found] = entry_keys[positions[found]] == lookup_keys[found]
+            if not found.all():
+                raise UnknownContainerError(int(lookup_keys[~found][0]))
+
+            return numpy.frombuffer(self.start_clusters, dtype=numpy.uint64)[positions] + (lcns & numpy.uint64(self.cluster_offset_mask))
+
+        start_cluster_dic = self.start_cluster_dic
+        entry_key_shift = self.entry_key_shift
+        cluster_offset_mask = self.cluster_offset_mask
+        try:
+            return array('Q', [start_cluster_dic[lcn >> entry_key_shift] + (lcn & cluster_offset_mask) for lcn in lcns])
+        except KeyError as error:
+            raise UnknownContainerError(error.args[0]) from None
+
+    def translate_runs(self, data_runs):
+        # Data Run (LCN, Cluster Count) -> VCN Runs, Split Where the Run Crosses a Container Boundary
+        vcn_runs = []
+        for lcn, cluster_count in data_runs:
+            while cluster_count > 0:
+                run_length = min(cluster_count, self.clusters_per_container - (lcn & self.cluster_offset_mask))
+                vcn = self.translate(lcn)
+                if vcn_runs and vcn_runs[-1][0] + vcn_runs[-1][1] == vcn:  # Physically Adjacent - Merge
+                    vcn_runs[-1] = (vcn_runs[-1][0], vcn_runs[-1][1] + run_length)
+                else:
+                    vcn_runs.append((vcn, run_length))
+                lcn += run_length
+                cluster_count -= run_length
+        return vcn_runs
+
+SUPER_BLOCK_CLUSTER = 0x1E  # Cluster of Primary Super Block
+
+class Volume:
+    """One opened ReFS volume: image reader, geometry and parsed metadata tables.
+
+    Parsers take the volume instead of sharing module globals, so several volumes
+    (or worker processes) can be open at once. Tables are held compactly:
+    Object ID Table as an ObjectIdArray and the Parent Child Table
+    as a DirectoryTree; the Container Table stays a dictionary (one entry per container).
+    """
+
+    def __init__(self, image_file, image_path=None, use_mmap=True, require_super_block=True):
+        self.image_file = image_file
+        self.image_path = image_path
+        self.use_mmap = use_mmap
+
+        # VBR -> Sector Size, Cluster Size, Container Size / Super Block -> Check Point Cluster
+        self.sector_size, self.cluster_size, self.container_size = read_vbr(image_file, 0)
+        try:
+            self.check_point_cluster = read_super_block(image_file, SUPER_BLOCK_CLUSTER, self.cluster_size)
+        except ReFSError:
+            if require_super_block:
+                raise
+            self.check_point_cluster = None  # Overwritten or Truncated Super Block - VBR Geometry Alone Still Allows Carving
+
+        self.file_signature_scanner = FileSignatureScanner(image_file, self.cluster_size)
+        self.lock = threading.RLock()  # Tables, Tree Node Caches and Sidecar Index are Shared by Every Caller of This Volume
+        self.metadata_index = None
+        self.container_table_key_dic = None
+        self.lcn_translator = None
+        self.object_id_table = None
+        self.directory_tree = None
+        self.directory_table_trees = OrderedDict()  # Directory Table VCN -> MsbPlusTree (Least Recently Used First)
+
+    @classmethod
+    def open(cls, image_path, use_mmap=True, require_super_block=True):
+        return cls(open_image(image_path, use_mmap=use_mmap), image_path, use_mmap, require_super_block)
+
+    def open_metadata_index(self, index_path):
+        # Sidecar Index is Valid Only For the Same Image Size and Check Point Page
+        self.metadata_index = MetadataIndex(index_path)
+        check_point_hash = hash_check_point(self.image_file, self.check_point_cluster, self.cluster_size) if self.check_point_cluster is not None else None
+        return self.metadata_index.validate(self.image_file.size, check_point_hash)
+
+    def set_tables(self, container_table_key_dic, object_id_table, directory_tree):
+        self.container_table_key_dic = container_table_key_dic
+        self.lcn_translator = LcnTranslator(self.cluster_size, self.container_size, container_table_key_dic)
+        self.object_id_table = object_id_table
+        self.directory_tree = directory_tree
+        self.directory_table_trees.clear()  # Trees Translate Through the Previous LCN Translator
+
+    def read_tables(self, use_index=False):
+        if use_index:
+            # Sidecar Index -> Container Table, Object ID Table and Parent Child Table Without Parsing
+            self.set_tables(*self.metadata_index.load_tables())
+            return
+
+        if self.check_point_cluster is None:
+            raise ReFSError(f"Super Block at cluster {hex(SUPER_BLOCK_CLUSTER)} is unreadable, metadata tables cannot be located.")
+
+        # Check Point -> Object ID Table LCN, Parent Child Table LCN, Container Table VCN
+        object_id_table_lcn, parent_child_table_lcn, container_table_vcn = read_check_point(self.image_file, self.check_point_cluster, self.cluster_size)
+
+        # Container Table -> Container Table Key Dictionary -> LCN Translator
+        container_table_key_dic = read_container_table(self.image_file, container_table_vcn, self.cluster_size)
+        lcn_translator = LcnTranslator(self.cluster_size, self.container_size, container_table_key_dic)
+
+        # Object ID Table -> Object ID -> LCN / Parent Child Table -> Directory Tree of Whole File System
+        object_id_table = read_object_id_array(self.image_file, lcn_translator.translate(object_id_table_lcn), self.cluster_size, lcn_translator)
+        directory_tree = read_parent_child_table(self.image_file, lcn_translator.translate(parent_child_table_lcn), self.cluster_size, lcn_translator, object_id_table)
+        self.set_tables(container_table_key_dic, object_id_table, directory_tree)
+
+        if self.metadata_index is not None:
+            self.metadata_index.save_tables(container_table_key_dic, object_id_table, directory_tree)
+
+    def directory_vcn(self, object_id):
+        return self.lcn_translator.translate(self.object_id_table[object_id])
+
+    def directory_table_tree(self, directory_vcn):
+        # Same Tree (and its Parsed Nodes) for Every Lookup and Listing of a Recently Used Directory - The Walk Reads Each Directory Once and Does Not Use it
+        tree = self.directory_table_trees.get(directory_vcn)
+        if tree is not None:
+            self.directory_table_trees.move_to_end(directory_vcn)
+            return tree
+
+        tree = self.directory_table_trees[directory_vcn] = MsbPlusTree(self.image_file, directory_vcn, self.cluster_size, self.lcn_translator.translate, directory_table_key, DIRECTORY_TABLE_NODE_CACHE_COUNT)
+        if len(self.directory_table_trees) > DIRECTORY_TABLE_TREE_CACHE_COUNT:  # Evict Least Recently Used Tree
+            self.directory_table_trees.popitem(last=False)
+        return tree
+
+    def ensure_tables(self):
+        with self.lock:
+            if self.directory_tree is None:
+                self.read_tables()
+
+    def lookup_path(self, path):
+        # Volume Path ('\\Dir\\File', '/' Also Accepted) -> Walk Record, One Case Insensitive Point Lookup per Component
+        with self.lock:
+            self.ensure_tables()
+            root_directory_lcn = self.object_id_table[0x600]
+            record = root_directory_walk_record(0x600, root_directory_lcn, self.lcn_translator.translate(root_directory_lcn))
+            for component in path.replace('/', '\\').split('\\'):
+                if not component:
+                    continue
+                if record['type'] != 'd' or record['vcn'] is None:
+                    raise PathNotFoundError(path)
+
+                entry = find_directory_entry(self.image_file, record['vcn'], self.cluster_size, self.lcn_translator, component, self.directory_table_tree(record['vcn']))
+                directory_path = '' if record['path'] == '\\' else record['path']
+                if entry is None:
+                    raise PathNotFoundError(path)
+                elif isinstance(entry, FileEntry):
+                    record = file_walk_record(entry, self.lcn_translator.translate(entry.file_lcn) if entry.file_lcn is not None else None)
+                else:
+                    child_lcn = self.object_id_table.get(entry.directory_object_id)
+                    record = directory_walk_record(entry, child_lcn, self.lcn_translator.translate(child_lcn) if child_lcn is not None else None)
+                record['path'] = directory_path + '\\' + record['path']
+            return record
+
+    def stat(self, path):
+        # Walk Record of One Entry, With Signature and File Type of a File
+        with self.lock:
+            record = self.lookup_path(path)
+            if record['type'] == 'f' and record['vcn'] is not None:
+                record['signature'], record['file_type'] = self.file_signature_scanner.scan((record['vcn'],))[record['vcn']]
+            return record
+
+    def list_dir(self, path='\\'):
+        # Walk Records of One Directory (Files, Then Directories) - Same Records the Walk Yields for it
+        with self.lock:
+            record = self.lookup_path(path)
+            if record['type'] != 'd':
+                raise ReFSError(f"Path '{path}' is not a directory.")
+            if record['vcn'] is None:
+                raise ReFSError(f"Directory '{path}' has no directory table in Object ID Table.")
+
+            directory_path = '' if record['path'] == '\\' else record['path']
+            file_records, directory_records = complete_directory_records(self, record['object_id'], directory_path, *read_directory_records(self, record['object_id'], record['vcn'], directory_path, tree=self.directory_table_tree(record['vcn'])))
+            return file_records + directory_records
+
+    def file_record(self, path):
+        record = self.lookup_path(path)
+        if record['type'] != 'f':
+            raise ReFSError(f"Path '{path}' is not a file.")
+        if record['size'] and not record['data_runs']:
+            raise ReFSError(f"File '{path}' has no data run (unsupported file table layout).")
+        return record
+
+    def read_file(self, path, output_file=None):
+        # Whole Content as Bytes, or Written to Seekable output_file (Returns Logical Size) - Image Reads Run Outside the Volume Lock
+        record = self.file_record(path)
+        if output_file is not None:
+            return extract_file(self.image_file, self.lcn_translator, record['data_runs'], record['size'], output_file)
+        return b''.join(bytes(chunk) for chunk in read_file_chunks(self.image_file, self.lcn_translator, record['data_runs'], record['size']))
+
+    def close(self):
+        if self.metadata_index is not None:
+            self.metadata_index.close()
+            self.metadata_index = None
+        self.file_signature_scanner.close()  # Reader Threads Before the Image They Read
+        self.image_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def read_struct(image_file, structure):
+    compiled_struct = STRUCT_REGISTRY.get(structure)
+    if compiled_struct is None:  # Ad-hoc Format - Compile Once and Keep in Registry
+        compiled_struct = STRUCT_REGISTRY[structure] = struct.Struct(structure)
+
+    # Unpack Directly From Image View (No Intermediate Read Buffer)
+    offset = image_file.tell()
+    structure_view = image_file.view(offset, compiled_struct.size)
+    if len(structure_view) < compiled_struct.size:  # Truncated Image
+        raise ReFSError(f"Structure at offset '{hex(offset)}' is beyond end of image.")
+    unpacked_data = compiled_struct.unpack_from(structure_view)
+    image_file.seek(offset + compiled_struct.size)
 
-    clusters_per_container_shift = 0  # CPC Shift = Right shift CPC until it equals 1
-    clusters_per_container_temp = clusters_per_container
-    while clusters_per_container_temp > 1:
-        clusters_per_container_temp >>= 1
-        clusters_per_container_shift += 1
-    
-    entry_key = lcn >> (clusters_per_container_shift + 1)  # Entry Key = Right shift LCN with 'CPC + 1'
-    
-    # Computed Entry Key Does Not Exist in Container Table Key Dictionary
-    if entry_key not in container_table_key_dic:
-        sys.exit(f"Entry key '{entry_key}' does not exist in Container Table Key Dictionary.\n")
-
-    return container_table_key_dic[entry_key]['number_of_start_cluster'] + (lcn & (clusters_per_container - 0x01)) # VCN = (Start Cluster) + ((LCN) & (Clusters Per Container - 1))
-
-def read_struct(image_file, structure, read_length=0):
-    struct_size = struct.calcsize(structure)
-    buffer = image_file.read(struct_size)
-    unpacked_data = list(struct.unpack(structure, buffer))
-
-    if structure == FILE_TABLE_NAME_STRUCTURE:
-        # Read twice the File Name Length value and decode it using UTF-8
-        unpacked_data.append(struct.unpack(f'<{read_length - 0x04}s', image_file.read(read_length - 0x04))[0].decode('utf-8'))
-    elif structure == DIRECTORY_TABLE_NAME_STRUCTURE:
-        # Read twice the Directory Name Length value and decode it using UTF-8
-        unpacked_data.append(struct.unpack(f'<{read_length}s', image_file.read(read_length))[0].decode('utf-8'))
-    
     return unpacked_data
 
-def convert_filesystem_time(filetime):
+def convert_filesystem_time(filetime, utc_offset=DISPLAY_UTC_OFFSET):
     if (filetime == 'Unknown'):
         return filetime
 
-    FILETIME_EPOCH = datetime(1601, 1, 1)
-    seconds_since_epoch = filetime / 10**7
-    timestamp_utc = FILETIME_EPOCH + timedelta(seconds=seconds_since_epoch)
-    timestamp_kst = timestamp_utc + timedelta(hours=9)
-
-    return timestamp_kst.strftime('%Y-%m-%d %H:%M')
+    # 'YYYY-MM-DD HH:MM' in Display Time Zone (KST Unless --timezone is Given)
+    return convert_filesystem_times((filetime,), utc_offset)[0][:16].replace('T', ' ')
+
+PROFILE_TOP_COUNT = 0x14  # Count : Rows of cProfile and tracemalloc Listings in Profile Report
+
+class HotPathProfiler:
+    """Calls, bytes, seeks and inclusive time of the parsing hot paths.
+
+    Probes are installed by wrapping module functions and methods only while
+    profiling is on (`install` / `uninstall`), so an unprofiled run executes the
+    original code with no added checks. Times are inclusive: a directory table
+    read also counts in the read_index, MSB+ node and image view probes it calls.
+    Bytes and seeks are inclusive too: each image view / read_into is charged to
+    every probe active around it in the same thread. Worker processes of -j are
+    not measured.
+    """
+
+    def __init__(self):
+        self.probe_dic = {}  # Probe Name -> [Calls, Bytes, Seeks, Seconds]
+        self.last_read_end_dic = {}  # (Probe Name, Image Object ID) -> End Offset of Previous Read (Seek : Read Not Starting There)
+        self.image_statistics = None
+        self.lock = threading.Lock()
+        self._thread_state = threading.local()  # .frames : Stack of [Bytes, Seeks] Charged to Calls Being Timed in This Thread
+        self._originals = []  # | Owner | Attribute Name | Original Attribute |
+
+    def record(self, probe_name, seconds, byte_count=0, image_file=None, offset=None, charged=(0, 0)):
+        # Returns 1 When This Read is a Seek - charged : Bytes and Seeks of Image Reads Made Inside the Call
+        with self.lock:
+            probe = self.probe_dic.get(probe_name)
+            if probe is None:
+                probe = self.probe_dic[probe_name] = [0, 0, 0, 0.0]
+            probe[0] += 1
+            probe[1] += byte_count + charged[0]
+            probe[2] += charged[1]
+            probe[3] += seconds
+            is_seek = 0
+            if offset is not None:
+                # Per Probe - Logical (view / read_into) and Physical Reads of One Image are Separate Sequences
+                read_key = (probe_name, id(image_file))
+                if self.last_read_end_dic.get(read_key) != offset:
+                    is_seek = 1
+                    probe[2] += 1
+                self.last_read_end_dic[read_key] = offset + byte_count
+            return is_seek
+
+    def active_frames(self):
+        frames = getattr(self._thread_state, 'frames', None)
+        if frames is None:
+            frames = self._thread_state.frames = []
+        return frames
+
+    def wrap(self, owner, attribute_name, probe_name, measure=None, charge_callers=False):
+        # measure(args, kwargs, result) -> (Probe Name, Bytes, Image File, Offset) Overrides Defaults of One Call
+        # charge_callers : Bytes and Seek of This Read are Added to Every Probe Active Around it (Tables Show the I/O They Cause)
+        original = owner.__dict__[attribute_name] if isinstance(owner, type) else getattr(owner, attribute_name)
+        perf_counter = time.perf_counter
+
+        def probe(*args, **kwargs):
+            frames = self.active_frames()
+            frame = [0, 0]
+            frames.append(frame)
+            start_time = perf_counter()
+            result = None
+            try:
+                result = original(*args, **kwargs)
+                return result
+            finally:
+                elapsed_time = perf_counter() - start_time
+                frames.pop()
+                probe_name_of_call, *measurements = (probe_name,) if measure is None else measure(args, kwargs, result)
+                is_seek = self.record(probe_name_of_call, elapsed_time, *measurements, charged=frame)
+                if charge_callers and measurements:
+                    for caller_frame in frames:
+                        caller_frame[0] += measurements[0]
+                        caller_frame[1] += is_seek
+
+        probe.__wrapped__ = original
+        self._originals.append((owner, attribute_name, original))
+        setattr(owner, attribute_name, probe)
+
+    def install(self):
+        module = sys.modules[__name__]
+
+        # Stages - Which Table the Time Goes Into
+        self.wrap(module, 'read_container_table', 'read_container_table')
+        self.wrap(module, 'read_object_id_table', 'read_object_id_table')
+        self.wrap(module, 'read_parent_child_table', 'read_parent_child_table')
+        self.wrap(module, 'read_directory_table_indexed', 'directory table')
+        self.wrap(module, 'read_index', 'read_index', lambda args, kwargs, result: (f"read_index ({kwargs.get('table_type', args[3] if len(args) > 3 else '')})",))
+        self.wrap(FileSignatureScanner, 'scan', 'file signature scan')
+
+        # Parsing and Translation
+        self.wrap(module, 'read_struct', 'read_struct')  # Bytes and Seeks Come From the Image View of the Structure
+        self.wrap(MsbPlusTree, 'node', 'msb+ node')
+        self.wrap(ObjectIdTable, '__getitem__', 'object id lookup')
+        self.wrap(ObjectIdArray, '__getitem__', 'object id lookup')
+        for attribute_name in ('translate', 'translate_array', 'translate_runs'):
+            self.wrap(LcnTranslator, attribute_name, 'lcn_to_vcn')
+
+        # Image Reads - View : Metadata Through Cache or Map, read_into : File Content, Physical : Actual I/O When Not Mapped
+        self.wrap(ImageReader, 'view', 'image view', lambda args, kwargs, result: ('image view', len(result) if result is not None else 0, args[0], args[1]), charge_callers=True)
+        self.wrap(ImageReader, 'read_into', 'image read_into', lambda args, kwargs, result: ('image read_into', result or 0, args[0], args[1]), charge_callers=True)
+        self.wrap(ImageReader, '_read_into_at', 'image read (physical)', lambda args, kwargs, result: ('image read (physical)', result or 0, args[0].image_file, args[1]))
+        self.wrap(EwfImage, 'load_chunk', 'ewf chunk load')
+
+    def uninstall(self):
+        while self._originals:
+            owner, attribute_name, original = self._originals.pop()
+            setattr(owner, attribute_name, original)
+
+    def report(self, elapsed_time, memory_report=None):
+        return {
+            'elapsed_seconds': elapsed_time,
+            'probes': {probe_name: {'calls': calls, 'bytes': byte_count, 'seeks': seeks, 'seconds': seconds}
+                       for probe_name, (calls, byte_count, seeks, seconds) in sorted(self.probe_dic.items(), key=lambda item: -item[1][3])},
+            'image_cache': self.image_statistics,
+            'memory': memory_report,
+        }
+
+def trace_memory_report():
+    # Current and Peak Traced Bytes With Largest Allocation Sites (tracemalloc Must be Running)
+    current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    top_statistics = tracemalloc.take_snapshot().statistics('lineno')[:PROFILE_TOP_COUNT]
+    return {
+        'current_bytes': current_bytes, 'peak_bytes': peak_bytes,
+        'top_allocations': [{'location': f"{statistic.traceback[0].filename}:{statistic.traceback[0].lineno}", 'bytes': statistic.size, 'count': statistic.count} for statistic in top_statistics],
+    }
+
+def print_profile_report(profile_report, output_file):
+    elapsed_time = max(profile_report['elapsed_seconds'], 1e-9)
+    if profile_report['probes']:
+        header = f"{'Probe':<32} {'Calls':>10} {'Bytes':>14} {'Seeks':>9} {'Seconds':>9} {'Avg (us)':>10} {'% of Run':>8}"
+        print(header, file=output_file)
+        print("-" * len(header), file=output_file)
+    for probe_name, probe in profile_report['probes'].items():
+        print(f"{probe_name:<32} {probe['calls']:>10} {probe['bytes']:>14} {probe['seeks']:>9} {probe['seconds']:>9.3f} "
+              f"{probe['seconds'] / max(probe['calls'], 1) * 1e6:>10.1f} {probe['seconds'] / elapsed_time * 100:>7.1f}%", file=output_file)
+    print(f"Elapsed : {profile_report['elapsed_seconds']:.3f} s" + (" (Times are Inclusive - Nested Probes Overlap)" if profile_report['probes'] else ""), file=output_file)
+    if profile_report['image_cache'] is not None:
+        print(f"Image Cache : {profile_report['image_cache']}", file=output_file)
+
+    memory_report = profile_report['memory']
+    if memory_report is not None:
+        print(f"Traced Memory : {memory_report['current_bytes']} Bytes Current, {memory_report['peak_bytes']} Bytes Peak - Largest Allocation Sites Still Live at End :", file=output_file)
+        for allocation in memory_report['top_allocations']:
+            print(f"  {allocation['bytes']:>14} Bytes {allocation['count']:>10} Blocks  {allocation['location']}", file=output_file)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", "--imagefile", required=True, help="Enter Image File Format By ReFS File System.")
+    parser.add_argument("--no-mmap", action="store_true", help="Read Image Through LRU Block Cache Instead of Memory Mapping (Network Storage).")
+    parser.add_argument("--cache-stats", action="store_true", help="Print Image Cache Hits, Misses and Bytes Read on Exit.")
+    parser.add_argument("--walk", action="store_true", help="Walk Whole Volume Without Prompt and Stream One Record per File and Directory.")
+    parser.add_argument("--format", choices=("jsonl", "csv", "body"), default="jsonl", help="Record Format of Walk Output (Default : jsonl, body : Sleuth Kit Body File of Timeline Only).")
+    parser.add_argument("-o", "--output", help="Output File of Walk Records (Default : Standard Output) or Output Directory of Extraction.")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="Worker Processes Parsing Directory Tables During Walk / Timeline or Scanning Offset Ranges During Carve (Default : 1, Serial).")
+    parser.add_argument("--index", nargs="?", const="", help="Keep Parsed Tables and Directory Listings in Sidecar Index (Default Path : Image Path + '.refsidx').")
+    parser.add_argument("--find", metavar="PATTERN", help="Find Entries by Name or Path Pattern (*, ?) Through Sidecar Index.")
+    parser.add_argument("--extract", metavar="PATTERN", help="Extract Files Matching Name or Path Pattern (*, ?) Into Output Directory Given by -o.")
+    parser.add_argument("--carve", action="store_true", help="Scan Whole Image for MSB+ / CHKP / SUPB Pages and Report Entries Recovered From Them, Live or Stale (-j Splits the Scan by Offset Range).")
+    parser.add_argument("--timeline", action="store_true", help="Write Chronologically Sorted Timeline of All Four Times of Every Entry (External Sort, Bounded Memory).")
+    parser.add_argument("--timezone", default="+09:00", help="Time Zone of Displayed and Timeline Times, UTC or Fixed Offset Such as -05:00 (Default : +09:00, KST).")
+    parser.add_argument("--temp-dir", help="Directory of Timeline Sort Runs (Default : System Temporary Directory).")
+    parser.add_argument("--hash", nargs="?", const=",".join(HASH_ALGORITHMS), metavar="ALGORITHMS", help="Hash Content of Every File in Physical Order, Comma Separated md5 / sha1 / sha256 (Default : All Three in One Pass).")
+    parser.add_argument("--known-hashes", metavar="PATH", help="Hash Set (NSRL CSV, md5sum, hashdeep or One Hash per Line) Marking Known Files During Hash.")
+    parser.add_argument("--exclude-known", action="store_true", help="Leave Files Found in --known-hashes Out of Hash Output.")
+    parser.add_argument("--profile", action="store_true", help="Instrument Hot Paths (Tables, read_index, read_struct, LCN Translation, Image Reads) and Print Summary Table to Standard Error.")
+    parser.add_argument("--profile-json", metavar="PATH", help="Write Profile Report as JSON (Implies --profile).")
+    parser.add_argument("--cprofile", metavar="PATH", help="Capture Whole Run With cProfile Into PATH (pstats Format), Top Functions Listed in Profile Report.")
+    parser.add_argument("--tracemalloc", action="store_true", help="Trace Memory Allocations - Peak and Largest Allocation Sites Listed in Profile Report (Slows the Run).")
     args = parser.parse_args()
-
-    base_cluster = 0
-    with open(args.imagefile, 'rb') as image_file:
-        # VBR -> Sector Size, Cluster Size, Container Size
-        sector_size, cluster_size, container_size = read_vbr(image_file, base_cluster)
-        
-        super_block_cluster = 0x1E
-        # Super Block -> Check Point Cluster
-        check_point_cluster = read_super_block(image_file, super_block_cluster, cluster_size)
-
-        # Check Point -> Object ID Table Cluster, Parent Child Table LCN, Container Table LCN
-        object_id_table_lcn, parent_child_table_lcn, container_table_vcn = read_check_point(image_file, check_point_cluster, cluster_size)
-        
-        # Container Table -> Create Container Table Key Dictionary
-        container_table_key_dic = read_container_table(image_file, container_table_vcn, cluster_size)
-        # for key, value in container_table_key_dic.items():
-            # print(f"Key: {hex(key)}, Number of Start Cluster: {hex(value["number_of_start_cluster"])}")
-
-        # Object ID Table -> Object ID Table Object ID Dictionary
-        object_id_table_vcn = lcn_to_vcn(cluster_size, container_size, object_id_table_lcn, container_table_key_dic)
-        object_id_table_lcn_dic = read_object_id_table(image_file, object_id_table_vcn, cluster_size, container_table_key_dic)
-        # for key, value in object_id_table_lcn_dic.items():
-            # print(f"Key: {hex(key)}, LCN: {hex(value["LCN"])}")
-        
-        # Parent Child Table -> Itinerate Parent Child Table -> Create All of Directory Tree in File System.
-        parent_child_table_vcn = lcn_to_vcn(cluster_size, container_size, parent_child_table_lcn, container_table_key_dic)
-        read_parent_child_table(image_file, parent_child_table_vcn, cluster_size, container_table_key_dic, object_id_table_lcn_dic)
-
-        # Read Directory Tree in File System based on User Input.
-        traversing_directory_hierarchy(image_file, base_cluster, cluster_size, container_table_key_dic, object_id_table_lcn_dic)
-    
+    if args.extract and not args.output:
+        parser.error("--extract requires -o OUTPUT_DIRECTORY")
+    if args.format == 'body' and not args.timeline:
+        parser.error("--format body requires --timeline")
+    try:
+        utc_offset = parse_utc_offset(args.timezone)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.hash is not None:
+        hash_algorithms = tuple(algorithm.strip().lower() for algorithm in args.hash.split(',') if algorithm.strip())
+        if not hash_algorithms or not set(hash_algorithms) <= set(HASH_ALGORITHMS) or len(set(hash_algorithms)) != len(hash_algorithms):
+            parser.error(f"--hash takes a comma separated subset of {', '.join(HASH_ALGORITHMS)}")
+    if (args.known_hashes or args.exclude_known) and args.hash is None:
+        parser.error("--known-hashes and --exclude-known require --hash")
+    if args.exclude_known and not args.known_hashes:
+        parser.error("--exclude-known requires --known-hashes")
+
+    # Probes are Installed Only When Asked - Unprofiled Run Executes Original Functions
+    profiler = HotPathProfiler() if args.profile or args.profile_json else None
+    if profiler is not None:
+        profiler.install()
+    if args.tracemalloc:
+        tracemalloc.start()
+    run_profiler = cProfile.Profile() if args.cprofile else None
+    if run_profiler is not None:
+        run_profiler.enable()
+    run_start_time = time.perf_counter()
+
+    try:
+        # Carving Reads Pages by Signature - Volume Opens Even When Super Block is Overwritten
+        with Volume.open(args.imagefile, use_mmap=not args.no_mmap, require_super_block=not args.carve) as volume:
+            index_is_valid = False
+            if args.index is not None or args.find:
+                index_is_valid = volume.open_metadata_index(args.index or args.imagefile + METADATA_INDEX_SUFFIX)
+
+            # Container Table, Object ID Table and Parent Child Table -> Directory Tree of Whole File System
+            if not args.carve:
+                volume.read_tables(use_index=index_is_valid)
+
+            if args.carve:
+                # Pages Reached From Current Check Point are Live, Every Other Carved Page is Stale (Unknown When Live Tables are Unreadable)
+                try:
+                    volume.read_tables(use_index=index_is_valid)
+                    live_page_vcns = collect_live_page_vcns(volume)
+                except ReFSError as error:
+                    print(f"Live Tables Unreadable, Pages are Not Marked Live or Stale : {error}", file=sys.stderr)
+                    live_page_vcns = None
+
+                output_file = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+                carve_statistics = {}
+                start_time = time.perf_counter()
+                try:
+                    number_of_records = write_walk_records(carve_volume(volume, args.workers, live_page_vcns, carve_statistics), output_file, args.format, CARVE_RECORD_FIELDS)
+                except BrokenPipeError:  # Output Consumer (e.g. head) Closed Early
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                else:
+                    elapsed_time = max(time.perf_counter() - start_time, 1e-9)
+                    print(f"Carved {carve_statistics['pages']} Pages ({carve_statistics['live_pages']} Live, {carve_statistics['stale_pages']} Stale, {carve_statistics['damaged_pages']} Damaged), "
+                          f"{number_of_records} Records, {carve_statistics['bytes_scanned'] / elapsed_time / 0x100000:.1f} MB/s", file=sys.stderr)
+                finally:
+                    if output_file is not sys.stdout:
+                        output_file.close()
+            elif args.timeline:
+                # Walk Without Signature Reads, Spill Sorted Runs of Events, Merge Them Into Output
+                output_file = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+                sort_statistics = {}
+                start_time = time.perf_counter()
+                try:
+                    if args.workers > 1:
+                        walk_records = walk_directory_hierarchy_parallel(volume, args.workers, scan_signatures=False)
+                    else:
+                        walk_records = walk_directory_hierarchy(volume, scan_signatures=False)
+                    timeline_items = timeline_body_entries(walk_records) if args.format == 'body' else timeline_events(walk_records)
+                    number_of_records = write_timeline_records(external_sort(timeline_items, temporary_directory=args.temp_dir, statistics=sort_statistics), output_file, args.format, utc_offset)
+                except BrokenPipeError:  # Output Consumer (e.g. head) Closed Early
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                else:
+                    print(f"Timeline : {number_of_records} Records, {sort_statistics['runs']} Sort Runs, {sort_statistics['merge_passes']} Merge Passes, "
+                          f"{time.perf_counter() - start_time:.1f} s", file=sys.stderr)
+                finally:
+                    if output_file is not sys.stdout:
+                        output_file.close()
+            elif args.hash is not None:
+                # Collect File Records by Walking (No Signature Reads), Then Hash Every File in One Sequential Pass
+                known_hash_set = KnownHashSet.load(args.known_hashes) if args.known_hashes else None
+                if args.workers > 1:
+                    walk_records = walk_directory_hierarchy_parallel(volume, args.workers, scan_signatures=False)
+                else:
+                    walk_records = walk_directory_hierarchy(volume, scan_signatures=False)
+                file_records = [record for record in walk_records if record['type'] == 'f']
+
+                output_file = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+                hash_statistics = {}
+                start_time = time.perf_counter()
+                try:
+                    hash_records = hash_files(volume.image_file, volume.lcn_translator, file_records, hash_algorithms, known_hash_set, statistics=hash_statistics)
+                    if args.exclude_known:
+                        hash_records = (record for record in hash_records if not record['known'])
+                    write_walk_records(hash_records, output_file, args.format, ('path', 'size', 'lcn', 'vcn') + hash_algorithms + ('known', 'error'))
+                except BrokenPipeError:  # Output Consumer (e.g. head) Closed Early
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                else:
+                    elapsed_time = max(time.perf_counter() - start_time, 1e-9)
+                    print(f"Hashed {hash_statistics['files']} Files ({hash_statistics['bytes_hashed']} Bytes, {hash_statistics['known_files']} Known, {hash_statistics['failed_files']} Without Digest), "
+                          f"{hash_statistics['bytes_hashed'] / elapsed_time / 0x100000:.1f} MB/s", file=sys.stderr)
+                finally:
+                    if output_file is not sys.stdout:
+                        output_file.close()
+            elif args.find:
+                # Complete Directory Listings Once by Walking, Then Answer From Index
+                if not volume.metadata_index.is_listing_complete():
+                    for _ in walk_directory_hierarchy(volume, scan_signatures=False):  # Index Does Not Keep Signatures
+                        pass
+                    volume.metadata_index.mark_listing_complete()
+                try:
+                    write_walk_records(volume.metadata_index.find_entries(args.find), sys.stdout, args.format)
+                except BrokenPipeError:  # Output Consumer (e.g. head) Closed Early
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            elif args.extract:
+                # Collect Matching Files by Walking, Then Write Their Content in Image Offset Order
+                file_records = [record for record in walk_directory_hierarchy(volume)
+                                if record['type'] == 'f' and match_walk_record(record, args.extract)]
+                number_of_files, bytes_written, skipped_records = extract_files(volume.image_file, volume.lcn_translator, file_records, args.output)
+                for record in skipped_records:
+                    print(f"Skipped (No Data Run - Unsupported File Table Layout) : {record['path']}", file=sys.stderr)
+                print(f"Extracted {number_of_files} Files ({bytes_written} Bytes) to '{args.output}'.", file=sys.stderr)
+            elif args.walk:
+                # Stream Every File and Directory Record of Whole Volume
+                output_file = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+                try:
+                    if args.workers > 1:
+                        walk_records = walk_directory_hierarchy_parallel(volume, args.workers)
+                    else:
+                        walk_records = walk_directory_hierarchy(volume)
+                    write_walk_records(walk_records, output_file, args.format)
+                except BrokenPipeError:  # Output Consumer (e.g. head) Closed Early
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                finally:
+                    if output_file is not sys.stdout:
+                        output_file.close()
+            else:
+                # Read Directory Tree in File System based on User Input.
+                try:
+                    traversing_directory_hierarchy(volume, utc_offset)
+                except (EOFError, KeyboardInterrupt):  # End of Input Leaves Interactive Mode
+                    print()
+
+            if args.cache_stats:
+                print(f"Image Cache : {volume.image_file.statistics()}", file=sys.stderr)
+            if profiler is not None:
+                profiler.image_statistics = volume.image_file.statistics()
+    except (ReFSError, OSError) as error:  # Invalid or Unreadable Image (OSError : Missing File, Permission, I/O Error)
+        sys.exit(f"{error}\n")
+    finally:
+        # Reported Even When the Run Fails - Shows How Far Parsing Got
+        run_elapsed_time = time.perf_counter() - run_start_time
+        if run_profiler is not None:
+            run_profiler.disable()
+            run_profiler.dump_stats(args.cprofile)
+        memory_report = trace_memory_report() if args.tracemalloc else None
+        if args.tracemalloc:
+            tracemalloc.stop()
+        if profiler is not None:
+            profiler.uninstall()
+            profile_report = profiler.report(run_elapsed_time, memory_report)
+            print_profile_report(profile_report, sys.stderr)
+            if args.profile_json:
+                with open(args.profile_json, 'w', encoding='utf-8') as profile_file:
+                    json.dump(profile_report, profile_file, indent=2)
+        elif memory_report is not None:
+            print_profile_report({'elapsed_seconds': run_elapsed_time, 'probes': {}, 'image_cache': None, 'memory': memory_report}, sys.stderr)
+        if run_profiler is not None:
+            print(f"cProfile Written to '{args.cprofile}' - Top Functions by Cumulative Time :", file=sys.stderr)
+            pstats.Stats(run_profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(PROFILE_TOP_COUNT)
@@ -0,0 +1,178 @@
+import refs_analyzer
+from refs_image_generator import build_synthetic_image
+import statistics
+import tracemalloc
+import argparse
+import tempfile
+import json
+import time
+import sys
+import os
+
+BENCHMARK_STAGES = ('read_container_table', 'read_object_id_table', 'read_parent_child_table', 'read_currnet_directory_table', 'walk_directory_hierarchy', 'walk_directory_hierarchy_parallel')
+REGRESSION_TOLERANCE = 0.20  # Ratio : Stage is Reported as Regression Below 80% of Baseline Entries per Second
+
+def open_volume(image_path, use_mmap):
+    # Fresh Reader Each Run - Image Cache of the Previous Run Does Not Hide Reads
+    volume = refs_analyzer.Volume.open(image_path, use_mmap=use_mmap)
+    table_references = refs_analyzer.read_check_point(volume.image_file, volume.check_point_cluster, volume.cluster_size)
+    return volume, table_references
+
+def run_stage(stage, volume, table_references, workers=1):
+    # Returns Callable Giving (Number of Entries, Parsed Result) - Tables the Stage Depends On are Parsed Before Timing Starts
+    image_file, cluster_size = volume.image_file, volume.cluster_size
+    object_id_table_lcn, parent_child_table_lcn, container_table_vcn = table_references
+    if stage == 'read_container_table':
+        def read_container_table():
+            container_table_key_dic = refs_analyzer.read_container_table(image_file, container_table_vcn, cluster_size)
+            return len(container_table_key_dic), container_table_key_dic
+        return read_container_table
+
+    container_table_key_dic = refs_analyzer.read_container_table(image_file, container_table_vcn, cluster_size)
+    lcn_translator = refs_analyzer.LcnTranslator(cluster_size, volume.container_size, container_table_key_dic)
+    object_id_table_vcn = lcn_translator.translate(object_id_table_lcn)
+    if stage == 'read_object_id_table':
+        def read_object_id_table():
+            # Same Call as Volume.read_tables - Retained Memory is What volume.object_id_table Holds
+            object_id_table = refs_analyzer.read_object_id_array(image_file, object_id_table_vcn, cluster_size, lcn_translator)
+            return len(object_id_table), object_id_table
+        return read_object_id_table
+
+    object_id_table = refs_analyzer.read_object_id_array(image_file, object_id_table_vcn, cluster_size, lcn_translator)
+    parent_child_table_vcn = lcn_translator.translate(parent_child_table_lcn)
+    if stage == 'read_parent_child_table':
+        def read_parent_child_table():
+            directory_tree = refs_analyzer.read_parent_child_table(image_file, parent_child_table_vcn, cluster_size, lcn_translator, object_id_table)
+            return directory_tree.number_of_children(), directory_tree
+        return read_parent_child_table
+
+    directory_tree = refs_analyzer.read_parent_child_table(image_file, parent_child_table_vcn, cluster_size, lcn_translator, object_id_table)
+    volume.set_tables(container_table_key_dic, object_id_table, directory_tree)
+
+    if stage == 'read_currnet_directory_table':
+        directory_vcn_dic = {object_id: lcn_translator.translate(lcn) for object_id, lcn in object_id_table.items()}
+
+        def read_directory_tables():
+            # Every Listing is Kept - Retained Memory is What Holding All Directory Entries Costs
+            directory_tables = []
+            for object_id, directory_vcn in directory_vcn_dic.items():
+                directory_tables.append(refs_analyzer.read_currnet_directory_table(image_file, directory_vcn, cluster_size, lcn_translator, object_id))
+            return sum(len(lower_file_table_dic) + len(lower_directory_table_dic) for lower_file_table_dic, lower_directory_table_dic in directory_tables), directory_tables
+        return read_directory_tables
+
+    if stage == 'walk_directory_hierarchy_parallel':
+        # Pool Start-Up is Timed - It is Part of What -j Costs Against the Serial Walk
+        return lambda: (sum(1 for _ in refs_analyzer.walk_directory_hierarchy_parallel(volume, workers)), None)
+
+    return lambda: (sum(1 for _ in refs_analyzer.walk_directory_hierarchy(volume)), None)
+
+def measure_stage_memory(stage, image_path, use_mmap, workers=1):
+    # Separate Untimed Run Under tracemalloc - Retained is Held by the Parsed Result, Peak Includes Temporaries
+    volume, table_references = open_volume(image_path, use_mmap)
+    with volume:
+        traced_stage = run_stage(stage, volume, table_references, workers)
+        tracemalloc.start()
+        try:
+            number_of_entries, result = traced_stage()
+            retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+
+    number_of_entries = max(number_of_entries, 1)
+    return retained_bytes / number_of_entries, peak_bytes / number_of_entries
+
+def benchmark_stage(stage, image_path, repeat, use_mmap, workers=1):
+    elapsed_times = []
+    bytes_read = []
+    for _ in range(repeat):
+        volume, table_references = open_volume(image_path, use_mmap)
+        with volume:
+            timed_stage = run_stage(stage, volume, table_references, workers)
+            bytes_read_before = volume.image_file.statistics()['bytes_read']
+            start_time = time.perf_counter()
+            number_of_entries, _ = timed_stage()
+            elapsed_times.append(time.perf_counter() - start_time)
+            bytes_read.append(volume.image_file.statistics()['bytes_read'] - bytes_read_before)
+
+    retained_bytes_per_entry, peak_bytes_per_entry = measure_stage_memory(stage, image_path, use_mmap, workers)
+    best_time = min(elapsed_times)
+    return {
+        'entries': number_of_entries, 'best_seconds': best_time, 'median_seconds': statistics.median(elapsed_times),
+        'entries_per_second': number_of_entries / best_time if best_time > 0 else float('inf'), 'bytes_read': max(bytes_read),
+        'retained_bytes_per_entry': retained_bytes_per_entry, 'peak_bytes_per_entry': peak_bytes_per_entry,
+    }
+
+def parallel_walk_speedup(results):
+    # Serial Best Time / Parallel Best Time (None Unless Both Walk Stages Ran)
+    serial_result = results['stages'].get('walk_directory_hierarchy')
+    parallel_result = results['stages'].get('walk_directory_hierarchy_parallel')
+    if serial_result is None or parallel_result is None or parallel_result['best_seconds'] <= 0:
+        return None
+    return serial_result['best_seconds'] / parallel_result['best_seconds']
+
+def compare_results(results, baseline, tolerance):
+    # Returns Stages Whose Entries per Second Dropped Below (1 - Tolerance) of Baseline
+    regressions = []
+    for stage, result in results['stages'].items():
+        baseline_result = baseline.get('stages', {}).get(stage)
+        if baseline_result and result['entries_per_second'] < baseline_result['entries_per_second'] * (1 - tolerance):
+            regressions.append((stage, baseline_result['entries_per_second'], result['entries_per_second']))
+    return regressions
+
+def print_results(results, output_file):
+    header = f"{'Stage':<34} {'Entries':>10} {'Best (s)':>10} {'Median (s)':>11} {'Entries/s':>12} {'Bytes Read':>12} {'Bytes/Entry':>12} {'Peak B/Entry':>12}"
+    print(header, file=output_file)
+    print("-" * len(header), file=output_file)
+    for stage, result in results['stages'].items():
+        print(f"{stage:<34} {result['entries']:>10} {result['best_seconds']:>10.4f} {result['median_seconds']:>11.4f} {result['entries_per_second']:>12.0f} {result['bytes_read']:>12} {result['retained_bytes_per_entry']:>12.1f} {result['peak_bytes_per_entry']:>12.1f}", file=output_file)
+    if results.get('parallel_walk_speedup') is not None:
+        serial_seconds = results['stages']['walk_directory_hierarchy']['best_seconds']
+        parallel_seconds = results['stages']['walk_directory_hierarchy_parallel']['best_seconds']
+        print(f"\nParallel Walk : Serial {serial_seconds:.4f} s, -j {results['workers']} {parallel_seconds:.4f} s, Speedup {results['parallel_walk_speedup']:.2f}x ({results['cpu_count']} CPUs)", file=output_file)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time Each Parsing Stage of refs_analyzer.py on a ReFS Image.")
+    parser.add_argument("-f", "--imagefile", help="Image to Benchmark (Default : Generate a Synthetic Image Into a Temporary Directory).")
+    parser.add_argument("--depth", type=int, default=2, help="Directory Levels of Generated Image (Default : 2).")
+    parser.add_argument("--fanout", type=int, default=8, help="Child Directories per Directory of Generated Image (Default : 8).")
+    parser.add_argument("--files", type=int, default=30, help="Files per Directory of Generated Image (Default : 30).")
+    parser.add_argument("--file-size", type=int, default=5000, help="File Size of Generated Image (Default : 5000).")
+    parser.add_argument("--cluster-size", type=lambda value: int(value, 0), default=0x1000, help="Cluster Size of Generated Image (Default : 0x1000).")
+    parser.add_argument("--stage", action="append", choices=BENCHMARK_STAGES, help="Stage to Time, Repeatable (Default : All Stages).")
+    parser.add_argument("-j", "--workers", type=int, default=max(os.cpu_count() or 1, 2), help="Worker Processes of Parallel Walk Stage (Default : CPU Count, at Least 2).")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per Stage, Best and Median are Reported (Default : 5).")
+    parser.add_argument("--no-mmap", action="store_true", help="Read Image Through LRU Block Cache Instead of Memory Mapping.")
+    parser.add_argument("--json", metavar="PATH", help="Write Results as JSON (Usable as --baseline Later).")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare With Earlier JSON Results, Exit Status 1 on Regression.")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="Allowed Entries per Second Drop Against Baseline (Default : 0.20).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        image_path = args.imagefile
+        if image_path is None:
+            image_path = os.path.join(temporary_directory, 'synthetic_refs.img')
+            summary = build_synthetic_image(image_path, args.depth, args.fanout, args.files, args.file_size, args.cluster_size)
+            print(f"Synthetic Image : {summary['image_size']} Bytes, {summary['directories']} Directories, {summary['files']} Files\n")
+
+        results = {'image': args.imagefile or 'synthetic', 'mode': 'cache' if args.no_mmap else 'mmap', 'repeat': args.repeat, 'workers': args.workers, 'cpu_count': os.cpu_count(), 'stages': {}}
+        try:
+            for stage in args.stage or BENCHMARK_STAGES:
+                results['stages'][stage] = benchmark_stage(stage, image_path, args.repeat, not args.no_mmap, args.workers)
+        except refs_analyzer.ReFSError as error:
+            sys.exit(f"{error}\n")
+        results['parallel_walk_speedup'] = parallel_walk_speedup(results)
+
+    print_results(results, sys.stdout)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as json_file:
+            json.dump(results, json_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            regressions = compare_results(results, json.load(baseline_file), args.tolerance)
+        for stage, baseline_rate, current_rate in regressions:
+            print(f"Regression : {stage} {baseline_rate:.0f} -> {current_rate:.0f} Entries/s", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,313 @@
+from refs_analyzer import (
+    STRUCT_REGISTRY, VBR_HEADER_STRUCTURE, SUPER_BLOCK_STRUCTURE, CHECK_POINT_STRUCTURE, CONTAINER_TABLE_STRUCTURE,
+    OBJECT_ID_TABLE_KEY_STRUCTURE, OBJECT_ID_TABLE_VALUE_STRUCTURE, PAGE_HEADER_STRUCTURE, PAGE_REFERENCE_STRUCTURE,
+    FILE_TABLE_TIME_SIZE_STRUCTURE, FILE_TABLE_SIZE_STRUCTURE, FILE_TABLE_DATARUN_STRUCTURE, DIRECTORY_TABLE_METADATA_STRUCTURE,
+    INDEX_ROOT_STRUCTURE, INDEX_HEADER_STRUCTURE, INDEX_KEY_STRUCTURE, INDEX_ENTRY_STRUCTURE, FILE_SIGNATURE_TABLE,
+    OBJECT_ID_TABLE_ID, CONTAINER_TABLE_ID, PARENT_CHILD_TABLE_ID, SUPER_BLOCK_CLUSTER, SUPER_BLOCK_PAGE_SIGNATURE,
+    CHECK_POINT_PAGE_SIGNATURE, MSB_PLUS_PAGE_SIGNATURE, metadata_page_size, directory_table_key,
+)
+import argparse
+import hashlib
+import random
+import struct
+import json
+import os
+
+# Synthetic ReFS 3.x Image - Only the Structures refs_analyzer.py Parses are Written, Everything Else is Zero
+CHECK_POINT_CLUSTER = 0x24
+FIRST_DATA_CLUSTER = 0x40  # Clusters Below Hold VBR, Super Block and Check Point
+ROOT_DIRECTORY_OBJECT_ID = 0x600
+FIRST_DIRECTORY_OBJECT_ID = 0x701
+BASE_FILETIME = 133000000000000000  # 2022-06-18 (FILETIME, 100ns Since 1601-01-01)
+
+CONTAINER_TABLE_LEAF_ENTRY_COUNT = 0x40  # Count : Container Entries per Leaf Page Below the Container Table Root
+CONTAINER_PERMUTATION_SPAN = 0x40  # Count : Containers Shuffled Together - Container i Gets a Key Within its Span of 64
+
+FILE_TABLE_KEY_TYPE = 0x10030
+DIRECTORY_TABLE_KEY_TYPE = 0x20030
+FILE_TABLE_DATARUN_KEY = 0x80
+
+def align(value, alignment=0x08):
+    return (value + alignment - 1) // alignment * alignment
+
+def pack_index_entry(key, value):
+    # | Index Entry Header | Key | Value | - Key and Value 8 Byte Aligned
+    entry_header = STRUCT_REGISTRY[INDEX_ENTRY_STRUCTURE]
+    key_offset = align(entry_header.size)
+    value_offset = align(key_offset + len(key))
+    entry = bytearray(align(value_offset + len(value)))
+    entry_header.pack_into(entry, 0, len(entry), key_offset, len(key), 0, value_offset, len(value))
+    entry[key_offset:key_offset + len(key)] = key
+    entry[value_offset:value_offset + len(value)] = value
+    return bytes(entry)
+
+def pack_index(entries, level=0, index_root_extra=b''):
+    # | Index Root (+ Extra) | Index Header | Entries | Key Array | - Key Array Holds Entry Offsets From Index Header
+    index_root = STRUCT_REGISTRY[INDEX_ROOT_STRUCTURE]
+    index_header = STRUCT_REGISTRY[INDEX_HEADER_STRUCTURE]
+    index_key = STRUCT_REGISTRY[INDEX_KEY_STRUCTURE]
+
+    entry_offsets = []
+    entry_area = bytearray()
+    for entry in entries:
+        entry_offsets.append(index_header.size + len(entry_area))
+        entry_area += entry
+    key_array_offset = index_header.size + len(entry_area)
+
+    return (index_root.pack(index_root.size + len(index_root_extra), 0, b'', 0, 0, 0, b'', 0, 0) + index_root_extra
+            + index_header.pack(index_header.size, key_array_offset, 0, level, b'', key_array_offset, len(entries), 0, 0, 0)
+            + bytes(entry_area) + b''.join(index_key.pack(entry_offset) for entry_offset in entry_offsets))
+
+def pack_page_header(signature, table_id):
+    return STRUCT_REGISTRY[PAGE_HEADER_STRUCTURE].pack(signature, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, table_id)
+
+def pack_page_reference(lcn):
+    return STRUCT_REGISTRY[PAGE_REFERENCE_STRUCTURE].pack(lcn, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+class SyntheticImage:
+    """Image file being generated, with cluster allocation and LCN mapping.
+
+    Containers are mapped to container table keys in shuffled order (key 0 stays
+    on container 0), so LCN -> VCN translation is exercised on every reference
+    the parser follows. Clusters are allocated upward and the image grows to the
+    last container used.
+    """
+
+    def __init__(self, image_file, cluster_size, container_size, seed):
+        self.image_file = image_file
+        self.cluster_size = cluster_size
+        self.container_size = container_size
+        self.page_size = metadata_page_size(cluster_size)
+        self.page_clusters = self.page_size // cluster_size
+
+        self.clusters_per_container = container_size // cluster_size
+        self.entry_key_shift = self.clusters_per_container.bit_length()  # Entry Key = LCN >> (CPC Shift + 1)
+
+        # Same Shuffle Repeats Every Span - Mapping Does Not Depend on Final Image Size
+        self.key_permutation = [0] + random.Random(seed).sample(range(1, CONTAINER_PERMUTATION_SPAN), CONTAINER_PERMUTATION_SPAN - 1)
+        self.next_cluster = FIRST_DATA_CLUSTER
+
+    @property
+    def number_of_containers(self):
+        return (self.next_cluster + self.clusters_per_container - 1) // self.clusters_per_container
+
+    @property
+    def size(self):
+        return self.number_of_containers * self.container_size
+
+    def allocate_clusters(self, number_of_clusters):
+        vcn = self.next_cluster
+        self.next_cluster += number_of_clusters
+        return vcn
+
+    def allocate_page(self):
+        return self.allocate_clusters(self.page_clusters)
+
+    def container_key(self, container):
+        span, container_in_span = divmod(container, CONTAINER_PERMUTATION_SPAN)
+        return span * CONTAINER_PERMUTATION_SPAN + self.key_permutation[container_in_span]
+
+    def vcn_to_lcn(self, vcn):
+        container, cluster_offset = divmod(vcn, self.clusters_per_container)
+        return (self.container_key(container) << self.entry_key_shift) | cluster_offset
+
+    def write(self, offset, data):
+        self.image_file.seek(offset)
+        self.image_file.write(data)
+
+    def write_page(self, vcn, signature, table_id, index, description):
+        page = pack_page_header(signature, table_id) + index
+        if len(page) > self.page_size:
+            raise ValueError(f"{description} needs {len(page)} bytes, more than one {self.page_size} byte metadata page.")
+        self.write(vcn * self.cluster_size, page)
+
+    def write_tree(self, keyed_entries, table_id, description, reference_function, node_entry_count=None):
+        # Keyed Entries | Key | Packed Entry | in Key Order -> Leaf Pages, Then Inner Levels Until One Root Page (Returns Root VCN)
+        # Inner Entry = First Key of Child + Page Reference (reference_function Maps Child VCN to the Referenced Cluster)
+        empty_page_size = len(pack_page_header(0, 0) + pack_index([]))
+        level = 0
+        while True:
+            nodes = [[]]
+            node_size = empty_page_size
+            for key, entry in keyed_entries:
+                entry_size = len(entry) + STRUCT_REGISTRY[INDEX_KEY_STRUCTURE].size
+                if empty_page_size + entry_size > self.page_size:
+                    raise ValueError(f"{description} entry needs {entry_size} bytes, more than one {self.page_size} byte metadata page.")
+                if nodes[-1] and (node_size + entry_size > self.page_size or len(nodes[-1]) == node_entry_count):
+                    nodes.append([])
+                    node_size = empty_page_size
+                nodes[-1].append((key, entry))
+                node_size += entry_size
+
+            keyed_entries = []
+            for node in nodes:
+                vcn = self.allocate_page()
+                self.write_page(vcn, MSB_PLUS_PAGE_SIGNATURE, table_id, pack_index([entry for _, entry in node], level=level), description)
+                if node:
+                    keyed_entries.append((node[0][0], pack_index_entry(node[0][0], pack_page_reference(reference_function(vcn)))))
+
+            if len(nodes) == 1:
+                return vcn
+            level += 1
+
+def build_file_content(file_size, file_number, random_generator):
+    # Random Content Starting With a Known Magic Number (Rotates Through Signature Table)
+    content = bytearray(random_generator.randbytes(file_size))
+    magic_offset, magic_number, _ = FILE_SIGNATURE_TABLE[file_number % len(FILE_SIGNATURE_TABLE)]
+    content[magic_offset:magic_offset + len(magic_number)] = magic_number
+    return bytes(content[:file_size])
+
+def write_file_data(synthetic_image, content):
+    # Returns Data Runs | LCN | Number of Clusters | and Cluster Count - One Run per File (refs_analyzer.py Does Not Parse the Extent Index of Fragmented Files)
+    cluster_size = synthetic_image.cluster_size
+    clusters_per_container = synthetic_image.clusters_per_container
+    number_of_clusters = (len(content) + cluster_size - 1) // cluster_size
+    if number_of_clusters > clusters_per_container:
+        raise ValueError("File is larger than a container, so it would need several data runs.")
+
+    # Run Never Crosses a Container Boundary - Containers are Not Adjacent in LCN Space
+    if synthetic_image.next_cluster % clusters_per_container + number_of_clusters > clusters_per_container:
+        synthetic_image.allocate_clusters(clusters_per_container - synthetic_image.next_cluster % clusters_per_container)
+    vcn = synthetic_image.allocate_clusters(number_of_clusters)
+    synthetic_image.write(vcn * cluster_size, content)
+    return [(synthetic_image.vcn_to_lcn(vcn), number_of_clusters)], number_of_clusters
+
+def pack_file_table(file_number, file_size, number_of_clusters, data_runs, cluster_size):
+    # File Table = Index Root + Time / Size, One Entry Whose Value Holds the Data Run
+    file_table_size = STRUCT_REGISTRY[FILE_TABLE_SIZE_STRUCTURE]
+    file_table_datarun = STRUCT_REGISTRY[FILE_TABLE_DATARUN_STRUCTURE]
+    datarun_pointer = struct.pack('<II', 0x08, 0)  # Offset of Data Run From This Pointer
+
+    (lcn, run_clusters), = data_runs
+    allocated_size = number_of_clusters * cluster_size
+    value = file_table_size.pack(file_table_size.size, b'', b'', b'', allocated_size, 0, file_size, file_size) + datarun_pointer + file_table_datarun.pack(lcn, 0, 0, 0, run_clusters)
+    times = STRUCT_REGISTRY[FILE_TABLE_TIME_SIZE_STRUCTURE].pack(
+        BASE_FILETIME, BASE_FILETIME + 10, BASE_FILETIME + 20, BASE_FILETIME + 30 + file_number * 600000000,
+        0x20, 0, 0, file_size, 0, 0, 0, 0, 0, 0, 0, 0)
+    return pack_index([pack_index_entry(struct.pack('<I', FILE_TABLE_DATARUN_KEY), value)], index_root_extra=times)
+
+def build_synthetic_image(image_path, depth=2, fanout=3, files_per_directory=4, file_size=5000, cluster_size=0x1000, container_size=0x100000, seed=0, manifest_path=None, node_entry_count=None):
+    if node_entry_count is not None and node_entry_count < 2:
+        raise ValueError("Node entry count must be at least 2, otherwise the tree never narrows to one root.")
+
+    # Directory Tree - Object ID -> (Parent Object ID, Name), Depth First Numbering
+    directory_dic = {}
+    directory_path_dic = {ROOT_DIRECTORY_OBJECT_ID: ''}
+    directory_stack = [(ROOT_DIRECTORY_OBJECT_ID, 0)]
+    while directory_stack:
+        parent_object_id, level = directory_stack.pop()
+        if level == depth:
+            continue
+        for child_number in range(fanout):
+            object_id = FIRST_DIRECTORY_OBJECT_ID + len(directory_dic)
+            directory_dic[object_id] = (parent_object_id, f'dir_{level}_{child_number}')
+            directory_path_dic[object_id] = directory_path_dic[parent_object_id] + '\\' + f'dir_{level}_{child_number}'
+            directory_stack.append((object_id, level + 1))
+    all_object_ids = [ROOT_DIRECTORY_OBJECT_ID] + list(directory_dic)
+
+    random_generator = random.Random(seed)
+    manifest = {}
+    number_of_files = 0
+    with open(image_path, 'wb+') as image_file:
+        image_file.truncate(0)
+        synthetic_image = SyntheticImage(image_file, cluster_size, container_size, seed)
+        directory_vcn_dic = {}
+
+        # Directory Tables - Child Directory and File Entries Sorted by Name
+        children_dic = {}
+        for object_id, (parent_object_id, directory_name) in directory_dic.items():
+            children_dic.setdefault(parent_object_id, []).append((object_id, directory_name))
+
+        for object_id in all_object_ids:
+            named_entries = []
+            for child_object_id, directory_name in children_dic.get(object_id, []):
+                key = struct.pack('<I', DIRECTORY_TABLE_KEY_TYPE) + directory_name.encode('utf-16-le')
+                value = STRUCT_REGISTRY[DIRECTORY_TABLE_METADATA_STRUCTURE].pack(0, child_object_id, BASE_FILETIME, BASE_FILETIME + 1, BASE_FILETIME + 2, BASE_FILETIME + 3 + child_object_id)
+                named_entries.append((key, pack_index_entry(key, value)))
+
+            for file_number in range(files_per_directory):
+                file_name = f'file_{object_id:x}_{file_number}.bin'
+                content = build_file_content(file_size + file_number, file_number, random_generator)
+                data_runs, number_of_file_clusters = write_file_data(synthetic_image, content)
+
+                key = struct.pack('<I', FILE_TABLE_KEY_TYPE) + file_name.encode('utf-16-le')
+                named_entries.append((key, pack_index_entry(key, pack_file_table(file_number, len(content), number_of_file_clusters, data_runs, cluster_size))))
+                manifest[directory_path_dic[object_id] + '\\' + file_name] = hashlib.sha256(content).hexdigest()
+                number_of_files += 1
+
+            # Directory Table - Entries in Case Insensitive Name Order (Same Order Name Lookup Expects)
+            named_entries.sort(key=lambda named_entry: directory_table_key(named_entry[0]))
+            directory_vcn_dic[object_id] = synthetic_image.write_tree(named_entries, object_id, f"Directory table of object ID {hex(object_id)}", synthetic_image.vcn_to_lcn, node_entry_count)
+
+        # Object ID Table - Object ID -> Page Reference (LCN) of its Directory Table Root
+        object_id_table_entries = []
+        for object_id in sorted(all_object_ids):
+            key = STRUCT_REGISTRY[OBJECT_ID_TABLE_KEY_STRUCTURE].pack(0, object_id)
+            value = bytes(STRUCT_REGISTRY[OBJECT_ID_TABLE_VALUE_STRUCTURE].size) + pack_page_reference(synthetic_image.vcn_to_lcn(directory_vcn_dic[object_id]))
+            object_id_table_entries.append((key, pack_index_entry(key, value)))
+        object_id_table_vcn = synthetic_image.write_tree(object_id_table_entries, OBJECT_ID_TABLE_ID, "Object ID table", synthetic_image.vcn_to_lcn, node_entry_count)
+
+        # Parent Child Table - | Parent Object ID | Child Object ID |, Ordered by Parent
+        parent_child_table_entries = []
+        for object_id, (parent_object_id, _) in sorted(directory_dic.items(), key=lambda directory: directory[1][0]):
+            key = struct.pack('<QQ', 0, parent_object_id)
+            parent_child_table_entries.append((key, pack_index_entry(key, struct.pack('<QQ', 0, object_id))))
+        parent_child_table_vcn = synthetic_image.write_tree(parent_child_table_entries, PARENT_CHILD_TABLE_ID, "Parent child table", synthetic_image.vcn_to_lcn, node_entry_count)
+
+        # Container Table - Entry Key -> Start Cluster, Page References are VCN (Table Defines the Translation)
+        container_table_entries = []
+        for container in sorted(range(synthetic_image.number_of_containers + 1), key=synthetic_image.container_key):  # + 1 : Container Table Pages May Open a New Container
+            entry_key = synthetic_image.container_key(container)
+            key = struct.pack('<Q', entry_key)
+            value = STRUCT_REGISTRY[CONTAINER_TABLE_STRUCTURE].pack(entry_key, 0, *([b''] * 8), container * synthetic_image.clusters_per_container, 0, 0)
+            container_table_entries.append((key, pack_index_entry(key, value)))
+        container_table_vcn = synthetic_image.write_tree(container_table_entries, CONTAINER_TABLE_ID, "Container table", lambda vcn: vcn, min(node_entry_count or CONTAINER_TABLE_LEAF_ENTRY_COUNT, CONTAINER_TABLE_LEAF_ENTRY_COUNT))
+
+        # Check Point - Page References Follow the Structure, Their Offsets are Fields [9], [13], [16]
+        check_point_structure = STRUCT_REGISTRY[CHECK_POINT_STRUCTURE]
+        page_reference_size = STRUCT_REGISTRY[PAGE_REFERENCE_STRUCTURE].size
+        reference_offset = align(STRUCT_REGISTRY[PAGE_HEADER_STRUCTURE].size + check_point_structure.size)
+        table_reference_offsets = [0] * 14
+        table_reference_offsets[1], table_reference_offsets[5], table_reference_offsets[8] = (reference_offset + index * page_reference_size for index in range(3))
+        check_point = (pack_page_header(CHECK_POINT_PAGE_SIGNATURE, 0) + check_point_structure.pack(0, 0, 0, 0, 1, 0, b'', b'', *table_reference_offsets)).ljust(reference_offset, b'\x00')
+        check_point += pack_page_reference(synthetic_image.vcn_to_lcn(object_id_table_vcn)) + pack_page_reference(synthetic_image.vcn_to_lcn(parent_child_table_vcn)) + pack_page_reference(container_table_vcn)
+        synthetic_image.write(CHECK_POINT_CLUSTER * cluster_size, check_point)
+
+        # Super Block (Cluster 0x1E) -> Primary and Secondary Check Point Cluster
+        super_block = pack_page_header(SUPER_BLOCK_PAGE_SIGNATURE, 0) + STRUCT_REGISTRY[SUPER_BLOCK_STRUCTURE].pack(b'', 0, 0, 0, 0, 0, 0, b'', b'', b'', b'', CHECK_POINT_CLUSTER, CHECK_POINT_CLUSTER)
+        synthetic_image.write(SUPER_BLOCK_CLUSTER * cluster_size, super_block)
+
+        # VBR - ReFS 3.x, Sector Size 512, Container Size
+        sector_size = 0x200
+        image_file.truncate(synthetic_image.size)
+        vbr = STRUCT_REGISTRY[VBR_HEADER_STRUCTURE].pack(b'\xebR\x90', b'ReFS\x00\x00\x00\x00', b'', 0x53525346, 0, 0, synthetic_image.size // sector_size, sector_size, cluster_size // sector_size, 3, 4, 0, 0, seed, 0, container_size)
+        synthetic_image.write(0, vbr)
+
+    if manifest_path is not None:
+        with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+    return {'image_size': synthetic_image.size, 'directories': len(all_object_ids), 'files': number_of_files}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a Synthetic ReFS 3.x Image Readable by refs_analyzer.py.")
+    parser.add_argument("-o", "--output", required=True, help="Output Image File.")
+    parser.add_argument("--depth", type=int, default=2, help="Directory Levels Below Root (Default : 2).")
+    parser.add_argument("--fanout", type=int, default=3, help="Child Directories per Directory (Default : 3).")
+    parser.add_argument("--files", type=int, default=4, help="Files per Directory (Default : 4).")
+    parser.add_argument("--file-size", type=int, default=5000, help="Logical Size of First File in Each Directory, Following Files Grow by One Byte (Default : 5000).")
+    parser.add_argument("--cluster-size", type=lambda value: int(value, 0), default=0x1000, help="Cluster Size, 0x1000 or 0x10000 (Default : 0x1000).")
+    parser.add_argument("--container-size", type=lambda value: int(value, 0), default=0x100000, help="Container Size (Default : 0x100000).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of Container Order and File Content (Default : 0).")
+    parser.add_argument("--node-entries", type=int, help="Upper Bound of Entries per Table Node - Small Values Build Deep Multi-Level Tables (Default : Fill Pages).")
+    parser.add_argument("--manifest", nargs="?", const="", help="Write SHA-256 of Every File Content (Default Path : Output + '.manifest.json').")
+    args = parser.parse_args()
+
+    manifest_path = None if args.manifest is None else (args.manifest or args.output + '.manifest.json')
+    try:
+        summary = build_synthetic_image(args.output, args.depth, args.fanout, args.files, args.file_size, args.cluster_size, args.container_size, args.seed, manifest_path, args.node_entries)
+    except ValueError as error:
+        if os.path.exists(args.output):
+            os.remove(args.output)
+        parser.exit(1, f"{error}\n")
+    print(f"{args.output} : {summary['image_size']} Bytes, {summary['directories']} Directories, {summary['files']} Files")
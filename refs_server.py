@@ -0,0 +1,220 @@
+import refs_analyzer
+from urllib.parse import urlsplit, parse_qs, unquote, quote
+from http import HTTPStatus
+import argparse
+import asyncio
+import json
+import traceback
+import os
+import sys
+
+SERVER_READ_CHUNK_SIZE = 0x100000  # Size : 1 MiB / File Content Streamed per Write
+REQUEST_LINE_LIMIT = 0x2000  # Size : 8 KiB / Longest Accepted Request Line or Header Line
+REQUEST_HEADER_COUNT = 0x64  # Count : Headers Accepted per Request
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class VolumeServer:
+    """Local HTTP/JSON service answering queries against several open images.
+
+    Each image is opened once and its tables are parsed once at start-up, so every
+    request reuses the same Volume (tables, recently used directory table trees
+    with their parsed nodes, signature cache and image block cache). Blocking
+    parser work runs in the default thread pool; the Volume lock serializes
+    metadata access per image while different images and file content reads
+    proceed concurrently.
+
+    GET /images                          Open images and their geometry
+    GET /images/<name>/list?path=\\Dir    Records of one directory
+    GET /images/<name>/stat?path=\\File   Record of one file or directory
+    GET /images/<name>/file?path=\\File   File content (application/octet-stream)
+    """
+
+    def __init__(self):
+        self.volume_dic = {}  # Image Name -> Volume
+
+    def open_volume(self, image_path, use_mmap=True, index_path=None):
+        name = os.path.basename(image_path)
+        if name in self.volume_dic:
+            raise refs_analyzer.ReFSError(f"Image name '{name}' is already served (rename or link one of the images).")
+
+        volume = refs_analyzer.Volume.open(image_path, use_mmap=use_mmap)
+        try:
+            index_is_valid = volume.open_metadata_index(index_path) if index_path is not None else False
+            volume.read_tables(use_index=index_is_valid)
+        except BaseException:
+            volume.close()
+            raise
+        self.volume_dic[name] = volume
+        return name
+
+    def close(self):
+        for volume in self.volume_dic.values():
+            volume.close()
+        self.volume_dic.clear()
+
+    def get_volume(self, name):
+        volume = self.volume_dic.get(name)
+        if volume is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Image '{name}' is not served.")
+        return volume
+
+    def describe_volume(self, name, volume):
+        return {
+            'name': name, 'image_path': volume.image_path, 'image_size': volume.image_file.size,
+            'cluster_size': volume.cluster_size, 'container_size': volume.container_size,
+        }
+
+    async def handle_connection(self, reader, writer):
+        # HTTP/1.1 Keep-Alive - Requests of One Connection are Answered in Order
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, target, keep_alive = request
+                try:
+                    await self.dispatch(method, target, writer)
+                except HttpError as error:
+                    await self.send_json(writer, error.status, {'error': str(error)})
+                except refs_analyzer.PathNotFoundError as error:
+                    await self.send_json(writer, HTTPStatus.NOT_FOUND, {'error': str(error)})
+                except refs_analyzer.ReFSError as error:
+                    await self.send_json(writer, HTTPStatus.UNPROCESSABLE_ENTITY, {'error': str(error)})
+                except ConnectionError:
+                    raise
+                except Exception as error:  # Parser Bug or Unexpected Image Contents - Client Still Gets an Answer
+                    print(f"Request '{method} {target}' Failed : {error!r}", file=sys.stderr)
+                    traceback.print_exc(file=sys.stderr)
+                    await self.send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"Internal error : {type(error).__name__}"})
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # Client Went Away, Malformed Request or Line Over Limit - Connection is Dropped
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise ConnectionError("Malformed request line.") from None
+
+        headers = {}
+        while True:
+            header_line = await reader.readline()
+            if header_line in (b'\r\n', b'\n', b''):
+                break
+            if len(headers) >= REQUEST_HEADER_COUNT:
+                raise ConnectionError("Too many request headers.")
+            name, _, value = header_line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        # Body is Not Used by Any Route - Consume it to Keep the Connection in Step
+        content_length = int(headers.get('content-length', 0) or 0)
+        if content_length:
+            await reader.readexactly(content_length)
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        return method, target, keep_alive
+
+    async def dispatch(self, method, target, writer):
+        if method != 'GET':
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"Method '{method}' is not supported.")
+
+        url = urlsplit(target)
+        parameters = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        components = [unquote(component) for component in url.path.split('/') if component]
+        loop = asyncio.get_running_loop()
+
+        if components == ['images']:
+            await self.send_json(writer, HTTPStatus.OK, [self.describe_volume(name, volume) for name, volume in self.volume_dic.items()])
+            return
+
+        if len(components) != 3 or components[0] != 'images':
+            raise HttpError(HTTPStatus.NOT_FOUND, f"No route for '{url.path}'.")
+        volume = self.get_volume(components[1])
+        action = components[2]
+        path = parameters.get('path', '\\')
+
+        if action == 'list':
+            records = await loop.run_in_executor(None, volume.list_dir, path)
+            await self.send_json(writer, HTTPStatus.OK, {'path': path, 'entries': [refs_analyzer.format_walk_record(record) for record in records]})
+        elif action == 'stat':
+            record = await loop.run_in_executor(None, volume.stat, path)
+            await self.send_json(writer, HTTPStatus.OK, refs_analyzer.format_walk_record(record))
+        elif action == 'file':
+            record = await loop.run_in_executor(None, volume.file_record, path)
+            await self.send_file(writer, volume, record)
+        else:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"No route for '{url.path}'.")
+
+    def send_response_header(self, writer, status, content_type, content_length, extra_headers=()):
+        header_lines = [f"HTTP/1.1 {status.value} {status.phrase}", f"Content-Type: {content_type}", f"Content-Length: {content_length}"]
+        header_lines.extend(f"{name}: {value}" for name, value in extra_headers)
+        writer.write(('\r\n'.join(header_lines) + '\r\n\r\n').encode('latin-1'))
+
+    async def send_json(self, writer, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response_header(writer, status, 'application/json', len(body))
+        writer.write(body)
+        await writer.drain()
+
+    async def send_file(self, writer, volume, record):
+        # Content Streamed Chunk by Chunk - Each Chunk is Read in the Thread Pool, Socket Back Pressure Paces the Reads
+        loop = asyncio.get_running_loop()
+        file_name = record['path'].rsplit('\\', 1)[-1]
+        ascii_file_name = file_name.encode('ascii', 'replace').decode('ascii').replace('"', '_')  # Header is Latin-1 - Full Name Goes in filename* (RFC 6266)
+        self.send_response_header(writer, HTTPStatus.OK, 'application/octet-stream', record['size'], (('Content-Disposition', f"attachment; filename=\"{ascii_file_name}\"; filename*=UTF-8''{quote(file_name)}"),))
+
+        file_chunks = refs_analyzer.read_file_chunks(volume.image_file, volume.lcn_translator, record['data_runs'], record['size'], SERVER_READ_CHUNK_SIZE)
+
+        def read_chunk():
+            chunk = next(file_chunks, None)
+            return bytes(chunk) if chunk is not None else None  # Copy - Generator Reuses its Buffer
+
+        while True:
+            try:
+                chunk = await loop.run_in_executor(None, read_chunk)
+            except Exception as error:  # Header Already Sent - Only Dropping the Connection Tells the Client
+                raise ConnectionError(str(error)) from error
+            if chunk is None:
+                break
+            writer.write(chunk)
+            await writer.drain()
+
+async def serve(volume_server, host, port):
+    server = await asyncio.start_server(volume_server.handle_connection, host, port, limit=REQUEST_LINE_LIMIT)
+    addresses = ', '.join(f"{address[0]}:{address[1]}" for address in (socket.getsockname() for socket in server.sockets))
+    print(f"Serving {len(volume_server.volume_dic)} Images on {addresses}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Directory Listings, Entry Metadata and File Content of ReFS Images Over Local HTTP/JSON.")
+    parser.add_argument("-f", "--imagefile", action="append", required=True, help="Image to Serve, Repeatable (Served Under its File Name).")
+    parser.add_argument("--host", default="127.0.0.1", help="Listen Address (Default : 127.0.0.1, Local Only).")
+    parser.add_argument("--port", type=int, default=8080, help="Listen Port (Default : 8080).")
+    parser.add_argument("--no-mmap", action="store_true", help="Read Images Through LRU Block Cache Instead of Memory Mapping.")
+    parser.add_argument("--index", action="store_true", help="Keep Parsed Tables and Listings in Sidecar Index of Each Image (Image Path + '.refsidx').")
+    args = parser.parse_args()
+
+    volume_server = VolumeServer()
+    try:
+        for image_path in args.imagefile:
+            name = volume_server.open_volume(image_path, use_mmap=not args.no_mmap, index_path=image_path + refs_analyzer.METADATA_INDEX_SUFFIX if args.index else None)
+            print(f"Opened '{image_path}' as '{name}'", file=sys.stderr)
+        asyncio.run(serve(volume_server, args.host, args.port))
+    except (refs_analyzer.ReFSError, OSError) as error:
+        sys.exit(f"{error}\n")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        volume_server.close()